@@ -1,16 +1,27 @@
-from .components import Component, Components
-from .conditions import CalculationType, Conditions, TemperatureProgram
-from .diffusion_curve import DiffusionCurve, DiffusionCurveSet
+from .components import Component, Components, ComponentTables, PropertyTable
+from .conditions import (CalculationType, Conditions, StopConditions,
+                         TemperatureProgram)
+from .diffusion_curve import (CompositionColumn, DiffusionCurve,
+                              DiffusionCurveSet, PartialFluxColumn,
+                              PermeanceColumn)
 from .experiments import IdealExperiment, IdealExperiments
 from .membrane import Membrane
 from .mixtures import (Composition, CompositionType, Mixture, Mixtures,
-                       get_nrtl_partial_pressures)
-from .optimizer import Measurements, PervaporationFunction, find_best_fit, fit
+                       get_nrtl_partial_pressures,
+                       get_nrtl_partial_pressures_array, to_molar_fraction,
+                       to_weight_fraction)
+from .optimizer import (FitCache, FitMethod, Measurements,
+                        PervaporationFunction, find_best_fit, fit,
+                        fit_linearized)
 from .permeance import Permeance, Units
-from .pervaporation import Pervaporation
-from .process import ProcessModel
-from .utils import (HeatCapacityConstants, NRTLParameters, R,
-                    VaporPressureConstants, VPConstantsType)
+from .pervaporation import (FIT_PARAMETERS, PartialFluxesBatch, Pervaporation,
+                            ProcessCheckpoint, ProcessEngine, ProcessEnsemble,
+                            ProcessState, SolverMethod, parameter_sweep)
+from .process import (PROCESS_STEP_COLUMNS, FrameSink, ProcessModel,
+                      ProcessSink, ProcessStep, RollingAggregator)
+from .utils import (HeatCapacityConstants, NRTLParameters, R, StorageFormat,
+                    VaporPressureConstants, VPConstantsType,
+                    get_storage_format, read_frame, write_frame)
 
 __all__ = [
     "VaporPressureConstants",
@@ -18,27 +29,56 @@ __all__ = [
     "NRTLParameters",
     "HeatCapacityConstants",
     "VPConstantsType",
+    "StorageFormat",
+    "get_storage_format",
+    "read_frame",
+    "write_frame",
     "ProcessModel",
+    "ProcessStep",
+    "ProcessSink",
+    "FrameSink",
+    "RollingAggregator",
+    "PROCESS_STEP_COLUMNS",
     "Pervaporation",
+    "PartialFluxesBatch",
+    "SolverMethod",
+    "ProcessEngine",
+    "ProcessState",
+    "ProcessEnsemble",
+    "ProcessCheckpoint",
+    "parameter_sweep",
+    "FIT_PARAMETERS",
     "Permeance",
     "Units",
     "Measurements",
     "PervaporationFunction",
     "find_best_fit",
     "fit",
+    "fit_linearized",
+    "FitMethod",
+    "FitCache",
     "Composition",
     "CompositionType",
     "Mixture",
     "Mixtures",
     "get_nrtl_partial_pressures",
+    "get_nrtl_partial_pressures_array",
+    "to_molar_fraction",
+    "to_weight_fraction",
     "Membrane",
     "IdealExperiment",
     "IdealExperiments",
     "DiffusionCurve",
     "DiffusionCurveSet",
+    "CompositionColumn",
+    "PartialFluxColumn",
+    "PermeanceColumn",
     "Conditions",
+    "StopConditions",
     "CalculationType",
     "TemperatureProgram",
     "Component",
     "Components",
+    "ComponentTables",
+    "PropertyTable",
 ]
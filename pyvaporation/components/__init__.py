@@ -1,4 +1,5 @@
 from .component import Component
 from .components import Components
+from .tables import ComponentTables, PropertyTable
 
-__all__ = ["Components", "Component"]
+__all__ = ["Components", "Component", "ComponentTables", "PropertyTable"]
@@ -1,92 +1,237 @@
+import typing
+from functools import partial
+
 import attr
 import numpy
 
 from ..utils import (HeatCapacityConstants, R, VaporPressureConstants,
                      VPConstantsType)
+from .tables import ComponentTables, PropertyTable
+
+
+def _antoine_vapor_pressure(
+    constants: VaporPressureConstants, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    return 10 ** (constants.a + constants.b / (temperature + constants.c))
+
+
+def _frost_vapor_pressure(
+    constants: VaporPressureConstants, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    return numpy.exp(
+        constants.a + constants.b / temperature + constants.c / temperature**2
+    )
+
+
+def _antoine_vaporisation_heat(
+    constants: VaporPressureConstants, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    return (
+        -(
+            (temperature / (temperature + constants.c)) ** 2
+            * R
+            * constants.b
+            * numpy.log(10)
+        )
+        / 1000
+    )
+
+
+def _frost_vaporisation_heat(
+    constants: VaporPressureConstants, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    return -R * (constants.b + 2 * constants.c / temperature) / 1000
+
+
+def _specific_heat(
+    constants: HeatCapacityConstants, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    return (
+        constants.a
+        + constants.b * temperature
+        + constants.c * temperature**2
+        + constants.d * temperature**3
+    )
+
+
+_VAPOR_PRESSURE_FUNCTIONS = {
+    VPConstantsType.antoine: (_antoine_vapor_pressure, _antoine_vaporisation_heat),
+    VPConstantsType.frost: (_frost_vapor_pressure, _frost_vaporisation_heat),
+}
+
+
+def _get_vapor_pressure_functions(
+    constants: VaporPressureConstants,
+) -> typing.Tuple[typing.Callable, typing.Callable]:
+    """
+    :return: vapour pressure and vaporisation heat functions for the type of the constants
+    """
+    try:
+        return _VAPOR_PRESSURE_FUNCTIONS[constants.type]
+    except KeyError:
+        raise ValueError("Type of calculation not supported")
+
+
+def _on_vapour_pressure_constants_change(
+    component: "Component",
+    attribute: attr.Attribute,
+    constants: VaporPressureConstants,
+) -> VaporPressureConstants:
+    """
+    Resolves the vapour pressure equations of a Component, when its constants are replaced
+    """
+    (
+        component._vapor_pressure_function,
+        component._vaporisation_heat_function,
+    ) = _get_vapor_pressure_functions(constants)
+    return constants
+
+
+def _to_output(value: numpy.ndarray) -> typing.Union[float, numpy.ndarray]:
+    """
+    Returns a float for scalar (0-d) results and an array otherwise
+    """
+    if numpy.ndim(value) == 0:
+        return float(value)
+    return value
 
 
 @attr.s(auto_attribs=True)
 class Component:
     name: str
     molecular_weight: float = attr.ib(converter=lambda value: float(value))
-    vapour_pressure_constants: VaporPressureConstants
+    vapour_pressure_constants: VaporPressureConstants = attr.ib(
+        on_setattr=_on_vapour_pressure_constants_change
+    )
     heat_capacity_constants: HeatCapacityConstants
+    tables: typing.Optional[ComponentTables] = attr.ib(
+        default=None, repr=False, eq=False
+    )
+    _vapor_pressure_function: typing.Callable = attr.ib(
+        init=False, repr=False, eq=False
+    )
+    _vaporisation_heat_function: typing.Callable = attr.ib(
+        init=False, repr=False, eq=False
+    )
+
+    def __attrs_post_init__(self):
+        """
+        Type of the vapour pressure equation is resolved once per Component
+        and again, when the vapour_pressure_constants are replaced;
+        Changes of the type of the constants in place are not taken into account
+        """
+        _on_vapour_pressure_constants_change(
+            self,
+            attr.fields(Component).vapour_pressure_constants,
+            self.vapour_pressure_constants,
+        )
+
+    def tabulate(self, t_min: float, t_max: float, rtol: float = 1e-9) -> "Component":
+        """
+        Creates a copy of the Component, which evaluates vapour pressure, vaporisation heat and heat capacity
+        with cubic spline tables within the temperature range and with the exact equations outside of it,
+        both at scalar temperatures and at arrays of temperatures
+        :param t_min: lower bound of the temperature range, K
+        :param t_max: upper bound of the temperature range, K
+        :param rtol: required relative error of the tables
+        :return: Component with ComponentTables
+        """
+        return attr.evolve(
+            self,
+            tables=ComponentTables(
+                vapor_pressure=PropertyTable.build(
+                    partial(
+                        self._vapor_pressure_function, self.vapour_pressure_constants
+                    ),
+                    t_min,
+                    t_max,
+                    rtol,
+                ),
+                vaporisation_heat=PropertyTable.build(
+                    partial(
+                        self._vaporisation_heat_function, self.vapour_pressure_constants
+                    ),
+                    t_min,
+                    t_max,
+                    rtol,
+                ),
+                specific_heat=PropertyTable.build(
+                    partial(_specific_heat, self.heat_capacity_constants),
+                    t_min,
+                    t_max,
+                    rtol,
+                ),
+            ),
+        )
 
-    def get_vapor_pressure(self, temperature: float) -> float:
+    def get_vapor_pressure(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of saturated pressure in kPa at a given temperature in K using Antoine equation (by the basis of 10)
         type of the calculation using Antoine (antoine) log10(P)=a+b/(T+C)
         or Frost equation (Frost) ln(P) = a+b/T+c/T^2
-        :param temperature: temperature in K
+        :param temperature: temperature in K, a float or an array
         :return: saturated pressure in kPa calculated with respect to constants and given temperature
         """
-        if self.vapour_pressure_constants.type == VPConstantsType.antoine:
-            return 10 ** (
-                self.vapour_pressure_constants.a
-                + self.vapour_pressure_constants.b
-                / (temperature + self.vapour_pressure_constants.c)
-            )
-        elif self.vapour_pressure_constants.type == VPConstantsType.frost:
-            return numpy.exp(
-                self.vapour_pressure_constants.a
-                + self.vapour_pressure_constants.b / temperature
-                + self.vapour_pressure_constants.c / temperature**2
+        if self.tables is not None:
+            return self.tables.vapor_pressure(temperature)
+        return _to_output(
+            self._vapor_pressure_function(
+                self.vapour_pressure_constants,
+                numpy.asarray(temperature, dtype=float),
             )
-        else:
-            raise ValueError("Type of calculation not supported")
+        )
 
-    def get_vaporisation_heat(self, temperature: float) -> float:
+    def get_vaporisation_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Vaporisation heat in kJ/mol using Clapeyron-Clausius equation
         for Antoine equation: H=b*R*ln(10)*(T/(T+C))^2
         for Frost Equation: H=R*(-b-2*c/T)
-        :param temperature: temperature in K
+        :param temperature: temperature in K, a float or an array
         :return: Vaporisation heat in kJ/mol
         """
-        if self.vapour_pressure_constants.type == VPConstantsType.antoine:
-            return (
-                -(
-                    (temperature / (temperature + self.vapour_pressure_constants.c))
-                    ** 2
-                    * R
-                    * self.vapour_pressure_constants.b
-                    * numpy.log(10)
-                )
-                / 1000
-            )
-        elif self.vapour_pressure_constants.type == VPConstantsType.frost:
-            return (
-                -R
-                * (
-                    self.vapour_pressure_constants.b
-                    + 2 * self.vapour_pressure_constants.c / temperature
-                )
-                / 1000
+        if self.tables is not None:
+            return self.tables.vaporisation_heat(temperature)
+        return _to_output(
+            self._vaporisation_heat_function(
+                self.vapour_pressure_constants,
+                numpy.asarray(temperature, dtype=float),
             )
-        else:
-            raise ValueError("Type of calculation not supported")
+        )
 
-    def get_specific_heat(self, temperature: float) -> float:
+    def get_specific_heat(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Heat Capacity in J/(mol*K) using polynomial isobaric heat capacity fit
-        :param temperature: temperature in K
+        :param temperature: temperature in K, a float or an array
         :return: Isobaric Heat capacity in J/(mol*K)
         """
-        return (
-            self.heat_capacity_constants.a
-            + self.heat_capacity_constants.b * temperature
-            + self.heat_capacity_constants.c * temperature**2
-            + self.heat_capacity_constants.d * temperature**3
+        if self.tables is not None:
+            return self.tables.specific_heat(temperature)
+        return _to_output(
+            _specific_heat(
+                self.heat_capacity_constants, numpy.asarray(temperature, dtype=float)
+            )
         )
 
-    def get_cooling_heat(self, t0, t1):
+    def get_cooling_heat(
+        self,
+        t0: typing.Union[float, numpy.ndarray],
+        t1: typing.Union[float, numpy.ndarray],
+    ) -> typing.Union[float, numpy.ndarray]:
         """
         Calculation of Specific Heat in J/mol using Integral (T2-T1) (CpdT)
-        :param t0: temperature in K (t1 < t0)
-        :param t1: temperature in K (t1 < t0)
+        :param t0: temperature in K (t1 < t0), a float or an array
+        :param t1: temperature in K (t1 < t0), a float or an array
         :return: Specific Heat in J/mol
         """
-        return (
+        t0 = numpy.asarray(t0, dtype=float)
+        t1 = numpy.asarray(t1, dtype=float)
+        return _to_output(
             self.heat_capacity_constants.a * (t0 - t1)
             + self.heat_capacity_constants.b * (t0**2 - t1**2) / 2
             + self.heat_capacity_constants.c * (t0**3 - t1**3) / 3
@@ -0,0 +1,180 @@
+import typing
+
+import attr
+import numpy
+from scipy import interpolate
+
+
+def _get_coefficients(
+    function: typing.Callable[[numpy.ndarray], numpy.ndarray],
+    t_min: float,
+    t_max: float,
+    intervals: int,
+) -> numpy.ndarray:
+    """
+    :return: coefficients of the cubic spline of the function on a uniform grid, see PropertyTable
+    """
+    nodes = numpy.linspace(t_min, t_max, intervals + 1)
+    spline = interpolate.CubicSpline(nodes, function(nodes))
+    step = nodes[1] - nodes[0]
+    return spline.c[::-1].T * step ** numpy.arange(4, dtype=float)[numpy.newaxis]
+
+
+def _evaluate(
+    coefficients: numpy.ndarray, t_min: float, t_max: float, temperature: numpy.ndarray
+) -> numpy.ndarray:
+    """
+    :return: values of the cubic spline at the temperatures within the temperature range, see PropertyTable
+    """
+    position = (temperature - t_min) * (len(coefficients) / (t_max - t_min))
+    index = numpy.clip(position.astype(numpy.intp), 0, len(coefficients) - 1)
+    return numpy.polynomial.polynomial.polyval(
+        position - index, numpy.moveaxis(coefficients[index], -1, 0), tensor=False
+    )
+
+
+@attr.s(auto_attribs=True)
+class PropertyTable:
+    """
+    Cubic spline of a temperature dependent property on a uniform temperature grid;
+    Within the range the property is evaluated as a cubic polynomial of the position in the interval,
+    outside the range the exact function is used
+    :param function: exact function of the temperature
+    :param t_min: lower bound of the temperature range, K
+    :param t_max: upper bound of the temperature range, K
+    :param coefficients: coefficients of the cubic polynomial of each interval in increasing order of the powers,
+    array of shape (number of intervals, 4)
+    :param error: estimated maximum relative error of the table, see PropertyTable.build
+    """
+
+    function: typing.Callable[[numpy.ndarray], numpy.ndarray] = attr.ib(repr=False)
+    t_min: float
+    t_max: float
+    coefficients: numpy.ndarray = attr.ib(repr=False)
+    error: float
+    _rows: typing.List[typing.Tuple[float, float, float, float]] = attr.ib(
+        init=False, repr=False
+    )
+    _inverse_step: float = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._rows = [tuple(row) for row in self.coefficients.tolist()]
+        self._inverse_step = len(self.coefficients) / (self.t_max - self.t_min)
+
+    @classmethod
+    def build(
+        cls,
+        function: typing.Callable[[numpy.ndarray], numpy.ndarray],
+        t_min: float,
+        t_max: float,
+        rtol: float = 1e-9,
+        max_intervals: int = 2**16,
+    ) -> "PropertyTable":
+        """
+        Builds the table, the number of intervals is doubled until the estimated relative error is within
+        the tolerance;
+        The error is estimated at 7 points inside each interval as the larger of the deviation from the exact
+        function and the step doubling estimate: the error of a cubic spline is proportional to the fourth power
+        of the step, so 16/15 of the difference from the table with the doubled number of intervals
+        approximates the error of the table
+        :param function: exact function of the temperature, which accepts arrays
+        :param t_min: lower bound of the temperature range, K
+        :param t_max: upper bound of the temperature range, K
+        :param rtol: required relative error
+        :param max_intervals: maximum number of intervals
+        :return: PropertyTable
+        """
+        if not t_min < t_max:
+            raise ValueError("t_min should be less than t_max")
+        u = numpy.linspace(0, 1, 9)[1:-1]
+        intervals = 16
+        coefficients = _get_coefficients(function, t_min, t_max, intervals)
+        while intervals <= max_intervals:
+            doubled_coefficients = _get_coefficients(
+                function, t_min, t_max, 2 * intervals
+            )
+            step = (t_max - t_min) / intervals
+            points = (
+                t_min + step * (numpy.arange(intervals)[:, numpy.newaxis] + u)
+            ).ravel()
+            values = function(points)
+            approximation = _evaluate(coefficients, t_min, t_max, points)
+            doubled_approximation = _evaluate(
+                doubled_coefficients, t_min, t_max, points
+            )
+            error = max(
+                float(numpy.max(numpy.abs(approximation / values - 1))),
+                16
+                / 15
+                * float(
+                    numpy.max(
+                        numpy.abs((approximation - doubled_approximation) / values)
+                    )
+                ),
+            )
+            if error <= rtol:
+                return cls(
+                    function=function,
+                    t_min=float(t_min),
+                    t_max=float(t_max),
+                    coefficients=coefficients,
+                    error=error,
+                )
+            intervals *= 2
+            coefficients = doubled_coefficients
+        raise ValueError(
+            "Relative error %s is not reached with %s intervals" % (rtol, max_intervals)
+        )
+
+    def __call__(
+        self, temperature: typing.Union[float, numpy.ndarray]
+    ) -> typing.Union[float, numpy.ndarray]:
+        """
+        :param temperature: temperature in K, a float or an array
+        :return: value of the property, a float for a scalar temperature and an array otherwise
+        """
+        if numpy.ndim(temperature) == 0:
+            temperature = float(temperature)
+            if not self.t_min <= temperature <= self.t_max:
+                return float(self.function(numpy.asarray(temperature)))
+            position = (temperature - self.t_min) * self._inverse_step
+            index = min(int(position), len(self._rows) - 1)
+            u = position - index
+            c0, c1, c2, c3 = self._rows[index]
+            return c0 + u * (c1 + u * (c2 + u * c3))
+
+        temperature = numpy.asarray(temperature, dtype=float)
+        inside = (self.t_min <= temperature) & (temperature <= self.t_max)
+        if inside.all():
+            return _evaluate(self.coefficients, self.t_min, self.t_max, temperature)
+        values = numpy.empty_like(temperature)
+        values[inside] = _evaluate(
+            self.coefficients, self.t_min, self.t_max, temperature[inside]
+        )
+        values[~inside] = self.function(temperature[~inside])
+        return values
+
+
+@attr.s(auto_attribs=True)
+class ComponentTables:
+    """
+    Tables of the properties of a Component over a temperature range, see Component.tabulate
+    :param vapor_pressure: saturated pressure in kPa
+    :param vaporisation_heat: vaporisation heat in kJ/mol
+    :param specific_heat: isobaric heat capacity in J/(mol*K)
+    """
+
+    vapor_pressure: PropertyTable
+    vaporisation_heat: PropertyTable
+    specific_heat: PropertyTable
+
+    @property
+    def error(self) -> float:
+        """
+        Returns estimated maximum relative error of the tables
+        """
+        return max(
+            self.vapor_pressure.error,
+            self.vaporisation_heat.error,
+            self.specific_heat.error,
+        )
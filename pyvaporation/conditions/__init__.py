@@ -1,3 +1,4 @@
-from .conditions import CalculationType, Conditions, TemperatureProgram
+from .conditions import (CalculationType, Conditions, StopConditions,
+                         TemperatureProgram)
 
-__all__ = ["Conditions", "TemperatureProgram", "CalculationType"]
+__all__ = ["Conditions", "TemperatureProgram", "CalculationType", "StopConditions"]
@@ -6,6 +6,17 @@ import numpy
 from ..mixtures import Composition
 
 
+def _to_plain_value(instance: typing.Any, field: attr.Attribute, value: typing.Any):
+    """
+    Converts numpy arrays and scalars to plain python values, which may be stored as json
+    """
+    if isinstance(value, numpy.ndarray):
+        return value.tolist()
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
 # TODO: Enum or not Enum?
 class CalculationType:
     polynomial: str = "polynomial"
@@ -24,9 +35,7 @@ class TemperatureProgram:
         :param x: parameter used for calculation of temperature
         :return: Temperature value calculated using polynomial relation defined with .coefficients
         """
-        return sum(
-            [self.coefficients[i] * x**i for i in range(len(self.coefficients))]
-        )
+        return sum([self.coefficients[i] * x**i for i in range(len(self.coefficients))])
 
     def exponential(self, x: float) -> float:
         """
@@ -67,6 +76,41 @@ class TemperatureProgram:
         return getattr(self, self.type)(time)
 
 
+@attr.s(auto_attribs=True)
+class StopConditions:
+    """
+    A class for specification of the conditions, that terminate modelling of the test_pervaporation processes;
+    The process is stopped as soon as any of the specified conditions is reached
+    """
+
+    target_feed_composition: typing.Optional[Composition] = None
+    minimum_feed_mass: typing.Optional[float] = None
+    maximum_time: typing.Optional[float] = None
+    minimum_total_flux: typing.Optional[float] = None
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Converts StopConditions to a mapping of plain values, which may be stored as json
+        :return: mapping of StopConditions parameters
+        """
+        return attr.asdict(
+            self,
+            value_serializer=_to_plain_value,
+        )
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> "StopConditions":
+        """
+        Creates StopConditions from a mapping obtained with to_dict
+        :param d: mapping of StopConditions parameters
+        :return: StopConditions
+        """
+        d = dict(d)
+        if d.get("target_feed_composition") is not None:
+            d["target_feed_composition"] = Composition(**d["target_feed_composition"])
+        return cls(**d)
+
+
 @attr.s(auto_attribs=True)
 class Conditions:
     """
@@ -80,3 +124,29 @@ class Conditions:
     permeate_temperature: typing.Optional[float] = None
     permeate_pressure: typing.Optional[float] = None
     temperature_program: typing.Optional[TemperatureProgram] = None
+    stop_conditions: typing.Optional[StopConditions] = None
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Converts Conditions to a mapping of plain values, which may be stored as json
+        :return: mapping of Conditions parameters
+        """
+        return attr.asdict(
+            self,
+            value_serializer=_to_plain_value,
+        )
+
+    @classmethod
+    def from_dict(cls, d: typing.Mapping[str, typing.Any]) -> "Conditions":
+        """
+        Creates Conditions from a mapping obtained with to_dict
+        :param d: mapping of Conditions parameters
+        :return: Conditions
+        """
+        d = dict(d)
+        d["initial_feed_composition"] = Composition(**d["initial_feed_composition"])
+        if d.get("temperature_program") is not None:
+            d["temperature_program"] = TemperatureProgram(**d["temperature_program"])
+        if d.get("stop_conditions") is not None:
+            d["stop_conditions"] = StopConditions.from_dict(d["stop_conditions"])
+        return cls(**d)
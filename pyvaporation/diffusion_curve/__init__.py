@@ -1,3 +1,10 @@
+from .columns import CompositionColumn, PartialFluxColumn, PermeanceColumn
 from .diffusion_curve import DiffusionCurve, DiffusionCurveSet
 
-__all__ = ["DiffusionCurve", "DiffusionCurveSet"]
+__all__ = [
+    "DiffusionCurve",
+    "DiffusionCurveSet",
+    "CompositionColumn",
+    "PartialFluxColumn",
+    "PermeanceColumn",
+]
@@ -0,0 +1,343 @@
+import typing
+
+import attr
+import numpy
+
+from ..mixtures import (Composition, CompositionType, Mixture,
+                        to_molar_fraction, to_weight_fraction)
+from ..permeance import Permeance, Units
+
+
+def _sequence_equal(column: typing.Sequence, other: typing.Any) -> bool:
+    if not isinstance(other, typing.Sequence) or isinstance(other, str):
+        return NotImplemented
+    return len(column) == len(other) and all(a == b for a, b in zip(column, other))
+
+
+def _set_rows(values: numpy.ndarray, item, rows: typing.Any) -> None:
+    """
+    Sets a row or a slice of rows of the values of a column
+    """
+    if isinstance(item, slice):
+        values[item] = numpy.asarray(rows, dtype=float).reshape(values[item].shape)
+    else:
+        values[item] = rows
+
+
+@attr.s(auto_attribs=True, eq=False)
+class CompositionColumn(typing.MutableSequence[Composition]):
+    """
+    Compositions stored as an array of fractions of the first component of a single type,
+    Composition objects are created on access;
+    The column supports the list API, the added Compositions should be of the type of the column
+    """
+
+    values: numpy.ndarray = attr.ib(converter=lambda x: numpy.array(x, dtype=float))
+    type: str = CompositionType.weight
+
+    def __attrs_post_init__(self):
+        if numpy.any(~((self.values >= 0) & (self.values <= 1))):
+            raise ValueError("Given composition values are not in [0, 1] range")
+
+    @classmethod
+    def from_compositions(
+        cls,
+        compositions: typing.Sequence[Composition],
+        mixture: typing.Optional[Mixture] = None,
+    ) -> "CompositionColumn":
+        """
+        Creates a CompositionColumn from Composition objects,
+        compositions of different types are converted to weight fractions
+        :param compositions: list of Compositions
+        :param mixture: Mixture, required only for compositions of different types
+        :return: CompositionColumn
+        """
+        if isinstance(compositions, CompositionColumn):
+            return compositions
+        types = {composition.type for composition in compositions}
+        if len(types) > 1:
+            if mixture is None:
+                raise ValueError(
+                    "Mixture must be specified for compositions of different types"
+                )
+            compositions = [
+                composition.to_weight(mixture) for composition in compositions
+            ]
+            types = {CompositionType.weight}
+        return cls(
+            values=[composition.p for composition in compositions],
+            type=types.pop() if len(types) > 0 else CompositionType.weight,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        values: numpy.ndarray,
+        types: numpy.ndarray,
+        mixture: Mixture,
+    ) -> "CompositionColumn":
+        """
+        Creates a CompositionColumn of weight fractions from arrays of fractions and their types,
+        the fractions are validated before the conversion
+        :param values: fractions of the first component
+        :param types: CompositionType of each fraction
+        :param mixture: Mixture
+        :return: CompositionColumn
+        """
+        values = cls(values=values).values
+        converted = numpy.asarray(types) != CompositionType.weight
+        if converted.any():
+            values = numpy.where(converted, to_weight_fraction(values, mixture), values)
+        return cls(values=values, type=CompositionType.weight)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return CompositionColumn(values=self.values[item], type=self.type)
+        return Composition(p=float(self.values[item]), type=self.type)
+
+    def _get_value(self, composition: Composition) -> float:
+        if composition.type != self.type:
+            raise ValueError(
+                "Composition of type %s can not be added to a column of type %s"
+                % (composition.type, self.type)
+            )
+        return composition.p
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            value = [self._get_value(composition) for composition in value]
+        else:
+            value = self._get_value(value)
+        _set_rows(self.values, item, value)
+
+    def __delitem__(self, item) -> None:
+        self.values = numpy.delete(self.values, item)
+
+    def insert(self, index: int, value: Composition) -> None:
+        self.values = numpy.insert(self.values, index, self._get_value(value))
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return _sequence_equal(self, other)
+
+    @property
+    def first(self) -> numpy.ndarray:
+        """
+        Returns fractions of the first component
+        """
+        return self.values
+
+    @property
+    def second(self) -> numpy.ndarray:
+        """
+        Returns fractions of the second component
+        """
+        return 1 - self.values
+
+    def to_molar(self, mixture: Mixture) -> "CompositionColumn":
+        """
+        Converts the compositions to molar %
+        """
+        if self.type == CompositionType.molar:
+            return self
+        return CompositionColumn(
+            values=to_molar_fraction(self.values, mixture), type=CompositionType.molar
+        )
+
+    def to_weight(self, mixture: Mixture) -> "CompositionColumn":
+        """
+        Converts the compositions to weight %
+        """
+        if self.type == CompositionType.weight:
+            return self
+        return CompositionColumn(
+            values=to_weight_fraction(self.values, mixture),
+            type=CompositionType.weight,
+        )
+
+
+@attr.s(auto_attribs=True, eq=False)
+class PartialFluxColumn(typing.MutableSequence[typing.Tuple[float, float]]):
+    """
+    Partial fluxes of both components stored as an array of shape (n, 2),
+    tuples of floats are created on access;
+    The column supports the list API
+    """
+
+    values: numpy.ndarray = attr.ib(
+        converter=lambda x: numpy.array(x, dtype=float).reshape(-1, 2)
+    )
+
+    @classmethod
+    def from_partial_fluxes(
+        cls, partial_fluxes: typing.Sequence[typing.Tuple[float, float]]
+    ) -> "PartialFluxColumn":
+        """
+        :param partial_fluxes: list of partial fluxes as [(J1, J2), ...]
+        :return: PartialFluxColumn
+        """
+        if isinstance(partial_fluxes, PartialFluxColumn):
+            return partial_fluxes
+        return cls(values=[tuple(fluxes) for fluxes in partial_fluxes])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return PartialFluxColumn(values=self.values[item])
+        return float(self.values[item][0]), float(self.values[item][1])
+
+    def __setitem__(self, item, value) -> None:
+        _set_rows(self.values, item, value)
+
+    def __delitem__(self, item) -> None:
+        self.values = numpy.delete(self.values, item, axis=0)
+
+    def insert(self, index: int, value: typing.Tuple[float, float]) -> None:
+        self.values = numpy.insert(
+            self.values, index, numpy.asarray(value, dtype=float), axis=0
+        )
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return _sequence_equal(self, other)
+
+    @property
+    def first(self) -> numpy.ndarray:
+        """
+        Returns partial fluxes of the first component
+        """
+        return self.values[:, 0]
+
+    @property
+    def second(self) -> numpy.ndarray:
+        """
+        Returns partial fluxes of the second component
+        """
+        return self.values[:, 1]
+
+    @property
+    def total(self) -> numpy.ndarray:
+        """
+        Returns total fluxes
+        """
+        return self.values[:, 0] + self.values[:, 1]
+
+
+@attr.s(auto_attribs=True, eq=False)
+class PermeanceColumn(typing.MutableSequence[typing.Tuple[Permeance, Permeance]]):
+    """
+    Permeances of both components in the same units stored as an array of shape (n, 2),
+    tuples of Permeance objects are created on access;
+    Negative values are set to zero, as in Permeance;
+    The column supports the list API, the added Permeances should be in the units of the column
+    """
+
+    values: numpy.ndarray = attr.ib(
+        converter=lambda x: numpy.array(x, dtype=float).reshape(-1, 2)
+    )
+    units: str = Units.kg_m2_h_kPa
+
+    def __attrs_post_init__(self):
+        self.values = numpy.where(self.values >= 0, self.values, 0.0)
+
+    @classmethod
+    def from_permeances(
+        cls,
+        permeances: typing.Sequence[typing.Tuple[Permeance, Permeance]],
+        mixture: Mixture,
+        units: str = Units.kg_m2_h_kPa,
+    ) -> "PermeanceColumn":
+        """
+        :param permeances: list of Permeances as [(P1, P2), ...]
+        :param mixture: Mixture
+        :param units: units of the column, Permeances are converted if needed
+        :return: PermeanceColumn
+        """
+        if isinstance(permeances, PermeanceColumn):
+            return permeances.convert(to_units=units, mixture=mixture)
+        return cls(
+            values=[
+                (
+                    first.convert(
+                        to_units=units, component=mixture.first_component
+                    ).value,
+                    second.convert(
+                        to_units=units, component=mixture.second_component
+                    ).value,
+                )
+                for first, second in permeances
+            ],
+            units=units,
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return PermeanceColumn(values=self.values[item], units=self.units)
+        return (
+            Permeance(value=float(self.values[item][0]), units=self.units),
+            Permeance(value=float(self.values[item][1]), units=self.units),
+        )
+
+    def _get_row(self, permeances: typing.Tuple[Permeance, Permeance]) -> numpy.ndarray:
+        for permeance in permeances:
+            if permeance.units != self.units:
+                raise ValueError(
+                    "Permeance in %s can not be added to a column in %s"
+                    % (permeance.units, self.units)
+                )
+        return numpy.array([permeance.value for permeance in permeances], dtype=float)
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            value = [self._get_row(permeances) for permeances in value]
+        else:
+            value = self._get_row(value)
+        _set_rows(self.values, item, value)
+
+    def __delitem__(self, item) -> None:
+        self.values = numpy.delete(self.values, item, axis=0)
+
+    def insert(self, index: int, value: typing.Tuple[Permeance, Permeance]) -> None:
+        self.values = numpy.insert(self.values, index, self._get_row(value), axis=0)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return _sequence_equal(self, other)
+
+    @property
+    def first(self) -> numpy.ndarray:
+        """
+        Returns permeances of the first component
+        """
+        return self.values[:, 0]
+
+    @property
+    def second(self) -> numpy.ndarray:
+        """
+        Returns permeances of the second component
+        """
+        return self.values[:, 1]
+
+    def convert(self, to_units: str, mixture: Mixture) -> "PermeanceColumn":
+        """
+        Converts the permeances to the specified units, see Permeance.convert
+        """
+        if to_units == self.units:
+            return self
+        return PermeanceColumn(
+            values=self.values
+            * [
+                Permeance(value=1, units=self.units)
+                .convert(to_units=to_units, component=mixture.first_component)
+                .value,
+                Permeance(value=1, units=self.units)
+                .convert(to_units=to_units, component=mixture.second_component)
+                .value,
+            ],
+            units=to_units,
+        )
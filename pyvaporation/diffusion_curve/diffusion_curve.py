@@ -6,9 +6,11 @@ import numpy
 import pandas
 
 from ..mixtures import (Composition, CompositionType, Mixture, Mixtures,
-                        get_nrtl_partial_pressures)
+                        get_nrtl_partial_pressures_array, to_weight_fraction)
 from ..permeance import Permeance, Units
 from ..plotting import plot_graph
+from ..utils import read_frame, write_frame
+from .columns import CompositionColumn, PartialFluxColumn, PermeanceColumn
 
 DC_SET_COLUMNS = [
     "curve_id",
@@ -27,173 +29,206 @@ DC_SET_COLUMNS = [
     "comment",
 ]
 
-
-@attr.s(auto_attribs=True)
+DC_SET_SCHEMA = {
+    "curve_id": str,
+    "membrane_name": str,
+    "mixture": str,
+    "feed_temperature": float,
+    "permeate_temperature": float,
+    "permeate_pressure": float,
+    "composition": float,
+    "composition_type": str,
+    "partial_flux_1": float,
+    "partial_flux_2": float,
+    "permeance_1": float,
+    "permeance_2": float,
+    "units": str,
+    "comment": str,
+}
+
+
+def _get_frame_columns(data: pandas.DataFrame) -> typing.Dict[str, numpy.ndarray]:
+    """
+    Converts the columns of a frame with DC_SET_COLUMNS to arrays,
+    compositions are validated once for the whole frame
+    :param data: frame with diffusion curves data
+    :return: mapping of the column names to arrays
+    """
+    columns = {
+        name: data[name].to_numpy()
+        for name in [
+            "membrane_name",
+            "mixture",
+            "feed_temperature",
+            "permeate_temperature",
+            "permeate_pressure",
+            "units",
+            "comment",
+        ]
+    }
+    columns["composition"] = CompositionColumn(
+        values=data["composition"].to_numpy(dtype=float)
+    ).values
+    columns["composition_converted"] = (
+        data["composition_type"] != CompositionType.weight
+    ).to_numpy()
+    columns["partial_fluxes"] = data[["partial_flux_1", "partial_flux_2"]].to_numpy(
+        dtype=float
+    )
+    columns["partial_flux_na"] = numpy.isnan(columns["partial_fluxes"]).any(axis=1)
+    columns["permeances"] = data[["permeance_1", "permeance_2"]].to_numpy(dtype=float)
+    columns["permeance_na"] = (
+        numpy.isnan(columns["permeances"]).any(axis=1) | data["units"].isna().to_numpy()
+    )
+    return columns
+
+
+@attr.s(auto_attribs=True, eq=False)
 class DiffusionCurve:
     """
     The class for Diffusion Curves - dependency of selective-transport properties
-    on feed composition, and process temperature
+    on feed composition, and process temperature;
+    Compositions, partial fluxes and permeances are stored as columns of float arrays,
+    Composition and Permeance objects are created on access, the columns support the list API;
+    Either partial fluxes or permeances may be omitted,
+    the omitted quantity is calculated on the first access
     """
 
     mixture: Mixture
     membrane_name: str
     feed_temperature: float
     feed_compositions: typing.List[Composition]
-    partial_fluxes: typing.Optional[typing.List[typing.Tuple[float, float]]] = None
+    _partial_fluxes: typing.Optional[typing.List[typing.Tuple[float, float]]] = None
     permeate_temperature: typing.Optional[float] = None
     permeate_pressure: typing.Optional[float] = None
-    permeances: typing.Optional[typing.List[typing.Tuple[Permeance, Permeance]]] = None
+    _permeances: typing.Optional[typing.List[typing.Tuple[Permeance, Permeance]]] = None
     comments: typing.Optional[str] = None
 
     def __attrs_post_init__(self):
+        self.feed_compositions = CompositionColumn.from_compositions(
+            self.feed_compositions, self.mixture
+        )
+        if self._permeances is None and self._partial_fluxes is None:
+            raise ValueError(
+                "Either Permeances or Fluxes must be specified as functions of feed composition"
+            )
+        if (
+            self._permeances is None
+            and self.permeate_temperature is not None
+            and self.permeate_pressure is not None
+        ):
+            raise ValueError(
+                "Either permeate temperature or permeate pressure could be stated not both"
+            )
+        if self._partial_fluxes is not None:
+            self._partial_fluxes = PartialFluxColumn.from_partial_fluxes(
+                self._partial_fluxes
+            )
+        if self._permeances is not None:
+            self._permeances = PermeanceColumn.from_permeances(
+                self._permeances, self.mixture
+            )
 
-        if self.partial_fluxes is None and self.permeances is not None:
-            """
-            Calculation of Partial Fluxes values if they are not specified
-            Permeance values are converted to kg/(m2*h*kPa),
-            The permeate temperature and pressure parameters are ignored, test_components' pressure in permeate
-            is considered zero
-            :return a list of Partial fluxes for each component tuple(Ji,Jj) at each concentration
-            """
-            feed_partial_pressures = [
-                get_nrtl_partial_pressures(
-                    self.feed_temperature, self.mixture, composition
-                )
-                for composition in self.feed_compositions
-            ]
-
-            self.permeances = [
-                (
-                    self.permeances[i][0].convert(
-                        to_units=Units.kg_m2_h_kPa,
-                        component=self.mixture.first_component,
-                    ),
-                    self.permeances[i][1].convert(
-                        to_units=Units.kg_m2_h_kPa,
-                        component=self.mixture.second_component,
-                    ),
-                )
-                for i in range(len(self.permeances))
-            ]
+    def __eq__(self, other: typing.Any) -> bool:
+        """
+        Diffusion Curves are compared by the partial fluxes and permeances,
+        so that the result does not depend on which of them are calculated on access
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.mixture == other.mixture
+            and self.membrane_name == other.membrane_name
+            and self.feed_temperature == other.feed_temperature
+            and self.feed_compositions == other.feed_compositions
+            and self.permeate_temperature == other.permeate_temperature
+            and self.permeate_pressure == other.permeate_pressure
+            and self.comments == other.comments
+            and self.partial_fluxes == other.partial_fluxes
+            and self.permeances == other.permeances
+        )
 
-            self.partial_fluxes = [
-                (
-                    self.permeances[i][0].value * feed_partial_pressures[i][0],
-                    self.permeances[i][1].value * feed_partial_pressures[i][1],
-                )
-                for i in range(len(self.permeances))
-            ]
-
-        if self.permeances is None and self.partial_fluxes is not None:
-            """
-            Calculation of Permeance values if they are not specified
-            Permeance values are in kg/(m2*h*kPa)
-            If needed, Permeance values may be converted using Permeance.converter()
-            :return a list of Permeances for each component tuple(Pi,Pj) at each concentration
-            """
-            permeate_compositions = self.permeate_composition
-            feed_partial_pressures = [
-                get_nrtl_partial_pressures(
-                    self.feed_temperature, self.mixture, composition
-                )
-                for composition in self.feed_compositions
-            ]
-            if self.permeate_temperature is None and self.permeate_pressure is None:
-                self.permeances = [
-                    (
-                        Permeance(
-                            value=self.partial_fluxes[i][0]
-                            / feed_partial_pressures[i][0]
-                        ),
-                        Permeance(
-                            value=self.partial_fluxes[i][1]
-                            / feed_partial_pressures[i][1]
-                        ),
-                    )
-                    for i in range(len(self.feed_compositions))
-                ]
-            elif (
-                self.permeate_temperature is not None and self.permeate_pressure is None
-            ):
-                permeate_partial_pressures = [
-                    get_nrtl_partial_pressures(
-                        self.permeate_temperature, self.mixture, composition
-                    )
-                    for composition in permeate_compositions
-                ]
-                self.permeances = [
-                    (
-                        Permeance(
-                            value=self.partial_fluxes[i][0]
-                            / (
-                                feed_partial_pressures[i][0]
-                                - permeate_partial_pressures[i][0]
-                            )
-                        ),
-                        Permeance(
-                            value=self.partial_fluxes[i][1]
-                            / (
-                                feed_partial_pressures[i][1]
-                                - permeate_partial_pressures[i][1]
-                            )
-                        ),
-                    )
-                    for i in range(len(self.feed_compositions))
-                ]
-
-            elif (
-                self.permeate_pressure is not None and self.permeate_temperature is None
-            ):
-                permeate_partial_pressures = [
-                    (
-                        self.permeate_pressure
-                        * composition.to_molar(self.mixture).first,
-                        self.permeate_pressure
-                        * composition.to_molar(self.mixture).second,
-                    )
-                    for composition in permeate_compositions
-                ]
-                self.permeances = [
-                    (
-                        Permeance(
-                            value=self.partial_fluxes[i][0]
-                            / (
-                                feed_partial_pressures[i][0]
-                                - permeate_partial_pressures[i][0]
-                            )
-                        ),
-                        Permeance(
-                            value=self.partial_fluxes[i][1]
-                            / (
-                                feed_partial_pressures[i][1]
-                                - permeate_partial_pressures[i][1]
-                            )
-                        ),
-                    )
-                    for i in range(len(self.feed_compositions))
-                ]
-            else:
-                raise ValueError(
-                    "Either permeate temperature or permeate pressure could be stated not both"
+    @property
+    def partial_fluxes(self) -> PartialFluxColumn:
+        """
+        Partial fluxes of both components at each concentration in kg/(m2*h),
+        if not specified, are calculated from Permeances on the first access;
+        The permeate temperature and pressure parameters are ignored, test_components' pressure in permeate
+        is considered zero
+        :return a column of Partial fluxes for each component (Ji,Jj) at each concentration
+        """
+        if self._partial_fluxes is None:
+            self._partial_fluxes = PartialFluxColumn(
+                values=self._permeances.values * self._get_feed_partial_pressures()
+            )
+        return self._partial_fluxes
+
+    @partial_fluxes.setter
+    def partial_fluxes(
+        self, partial_fluxes: typing.Sequence[typing.Tuple[float, float]]
+    ) -> None:
+        self._partial_fluxes = PartialFluxColumn.from_partial_fluxes(partial_fluxes)
+        self._permeances = None
+
+    @property
+    def permeances(self) -> PermeanceColumn:
+        """
+        Permeances of both components at each concentration in kg/(m2*h*kPa),
+        if not specified, are calculated from Partial fluxes on the first access;
+        If needed, Permeance values may be converted using PermeanceColumn.convert()
+        :return a column of Permeances for each component (Pi,Pj) at each concentration
+        """
+        if self._permeances is None:
+            self._permeances = PermeanceColumn(
+                values=self._partial_fluxes.values
+                / (
+                    self._get_feed_partial_pressures()
+                    - self._get_permeate_partial_pressures()
                 )
-        elif self.permeances is None and self.partial_fluxes is None:
-            raise ValueError(
-                "Either Permeances or Fluxes must be specified as functions of feed composition"
+            )
+        return self._permeances
+
+    @permeances.setter
+    def permeances(
+        self, permeances: typing.Sequence[typing.Tuple[Permeance, Permeance]]
+    ) -> None:
+        self._permeances = PermeanceColumn.from_permeances(permeances, self.mixture)
+        self._partial_fluxes = None
+
+    def _get_feed_partial_pressures(self) -> numpy.ndarray:
+        """
+        :return: NRTL partial pressures of both components in feed at each concentration as an array of shape (n, 2)
+        """
+        return numpy.stack(
+            get_nrtl_partial_pressures_array(
+                self.feed_temperature,
+                self.mixture,
+                self.feed_compositions.to_molar(self.mixture).first,
+            ),
+            axis=-1,
+        )
+
+    def _get_permeate_partial_pressures(self) -> numpy.ndarray:
+        """
+        :return: partial pressures of both components in permeate at each concentration as an array of shape (n, 2),
+        zero if neither permeate temperature nor permeate pressure is stated
+        """
+        if self.permeate_temperature is not None:
+            return numpy.stack(
+                get_nrtl_partial_pressures_array(
+                    self.permeate_temperature,
+                    self.mixture,
+                    self.permeate_composition.to_molar(self.mixture).first,
+                ),
+                axis=-1,
+            )
+        elif self.permeate_pressure is not None:
+            permeate_composition = self.permeate_composition.to_molar(self.mixture)
+            return self.permeate_pressure * numpy.stack(
+                (permeate_composition.first, permeate_composition.second), axis=-1
             )
         else:
-            self.permeances = [
-                (
-                    self.permeances[i][0].convert(
-                        to_units=Units.kg_m2_h_kPa,
-                        component=self.mixture.first_component,
-                    ),
-                    self.permeances[i][1].convert(
-                        to_units=Units.kg_m2_h_kPa,
-                        component=self.mixture.second_component,
-                    ),
-                )
-                for i in range(len(self.permeances))
-            ]
+            return numpy.zeros((len(self), 2))
 
     def __len__(self):
         return len(self.feed_compositions)
@@ -262,209 +297,137 @@ class DiffusionCurve:
         )
 
     @property
-    def permeate_composition(self) -> typing.List[Composition]:
+    def permeate_composition(self) -> CompositionColumn:
         """
         Calculation of permeate compositions at each concentration
-        :return - List of permeate weight compositions
+        :return - Column of permeate weight compositions
         """
-        return [
-            Composition(
-                self.partial_fluxes[i][0] / (sum(self.partial_fluxes[i])),
-                type=CompositionType.weight,
-            )
-            for i in range(len(self.feed_compositions))
-        ]
+        return CompositionColumn(
+            values=self.partial_fluxes.first / self.partial_fluxes.total,
+            type=CompositionType.weight,
+        )
 
     @property
-    def get_separation_factor(self) -> typing.List[float]:
+    def get_separation_factor(self) -> numpy.ndarray:
         """
         Calculation of separation factor at each concentration
-        :return - List of separation factors
+        :return - Array of separation factors
         """
         permeate_composition = self.permeate_composition
-        feed_composition = self.feed_compositions
-        return [
-            (permeate_composition[i].first / permeate_composition[i].second)
-            / (feed_composition[i].first / feed_composition[i].second)
-            for i in range(len(self.feed_compositions))
-        ]
+        return (permeate_composition.first / permeate_composition.second) / (
+            self.feed_compositions.first / self.feed_compositions.second
+        )
 
     @property
-    def get_psi(self) -> typing.List[float]:
+    def get_psi(self) -> numpy.ndarray:
         """
         Calculation of Pervaporation Separation Index (PSI) at each concentration
-        :return - List of PSI
+        :return - Array of PSI
         """
-        total_flux = [
-            sum(self.partial_fluxes[i]) for i in range(len(self.feed_compositions))
-        ]
-        separation_factor = self.get_separation_factor
-        return numpy.multiply(total_flux, numpy.subtract(separation_factor, 1))
+        return self.partial_fluxes.total * (self.get_separation_factor - 1)
 
     @property
-    def get_permeances(self) -> typing.List[typing.Tuple[Permeance, Permeance]]:
+    def get_permeances(self) -> PermeanceColumn:
         """
         Calculates permenace of both components based on the partial flux values, mixture, feed  and permeate parameters
         :return: Permeances of each component at each feed concentration as [(P1,P2),...]
         """
-        if self.permeances is not None:
-            return self.permeances
-        else:
-            permeate_compositions = self.permeate_composition
-            feed_partial_pressures = [
-                get_nrtl_partial_pressures(
-                    self.feed_temperature, self.mixture, composition
-                )
-                for composition in self.feed_compositions
-            ]
-            if self.permeate_temperature is None:
-                self.permeances = [
-                    (
-                        Permeance(
-                            value=self.partial_fluxes[i][0]
-                            / feed_partial_pressures[i][0]
-                        ),
-                        Permeance(
-                            value=self.partial_fluxes[i][1]
-                            / feed_partial_pressures[i][1]
-                        ),
-                    )
-                    for i in range(len(self.feed_compositions))
-                ]
-            else:
-                permeate_partial_pressures = [
-                    get_nrtl_partial_pressures(
-                        self.permeate_temperature, self.mixture, composition
-                    )
-                    for composition in permeate_compositions
-                ]
-                self.permeances = [
-                    (
-                        Permeance(
-                            value=self.partial_fluxes[i][0]
-                            / (
-                                feed_partial_pressures[i][0]
-                                - permeate_partial_pressures[i][0]
-                            )
-                        ),
-                        Permeance(
-                            value=self.partial_fluxes[i][1]
-                            / (
-                                feed_partial_pressures[i][1]
-                                - permeate_partial_pressures[i][1]
-                            )
-                        ),
-                    )
-                    for i in range(len(self.feed_compositions))
-                ]
+        return self.permeances
 
     @property
     def get_selectivity(
         self,
-    ) -> typing.List[float]:
+    ) -> numpy.ndarray:
         """
         Calculation of selectivity at each concentration
-        :return - List of selectivities (Permeances are in SI by default)
+        :return - Array of selectivities (Permeances are in SI by default)
         """
-        permeances = self.permeances
-        return [
-            permeances[i][0].convert("SI", self.mixture.first_component).value
-            / permeances[i][1].convert("SI", self.mixture.second_component).value
-            for i in range(len(self.feed_compositions))
-        ]
+        permeances = self.permeances.convert(Units.SI, self.mixture)
+        return permeances.first / permeances.second
 
     @classmethod
-    def from_frame(cls, data: pandas.DataFrame) -> "DiffusionCurve":
-        # TODO: docstring
-        mixture = getattr(Mixtures, data["mixture"].iloc[0])
+    def _from_columns(
+        cls, columns: typing.Mapping[str, numpy.ndarray], index: numpy.ndarray
+    ) -> "DiffusionCurve":
+        """
+        Creates a DiffusionCurve from the selected rows of the frame columns
+        :param columns: columns of a frame with DC_SET_COLUMNS, see _get_frame_columns
+        :param index: indices of the rows related to the curve
+        :return: DiffusionCurve
+        """
+        first = index[0]
+        mixture = getattr(Mixtures, columns["mixture"][first])
 
-        if (
-            data["partial_flux_1"].isna().mean() == 0
-            and data["partial_flux_2"].isna().mean() == 0
-        ):
-            partial_fluxes = []
-            for i in range(len(data)):
-                partial_fluxes.append(
-                    (
-                        data["partial_flux_1"].iloc[i],
-                        data["partial_flux_2"].iloc[i],
-                    )
-                )
+        if not columns["partial_flux_na"][index].any():
+            partial_fluxes = PartialFluxColumn(values=columns["partial_fluxes"][index])
         else:
             partial_fluxes = None
 
-        if (
-            data["permeance_1"].isna().mean() == 0
-            and data["permeance_2"].isna().mean() == 0
-            and data["units"].isna().mean() == 0
-        ):
-            permeances = []
-            for i in range(len(data)):
-                permeances.append(
-                    (
-                        Permeance(
-                            value=data["permeance_1"].iloc[i],
-                            units=data["units"].iloc[0],
-                        ).convert(
-                            to_units=Units.kg_m2_h_kPa,
-                            component=mixture.first_component,
-                        ),
-                        Permeance(
-                            value=data["permeance_2"].iloc[i],
-                            units=data["units"].iloc[0],
-                        ).convert(
-                            to_units=Units.kg_m2_h_kPa,
-                            component=mixture.second_component,
-                        ),
-                    )
-                )
+        if not columns["permeance_na"][index].any():
+            permeances = PermeanceColumn(
+                values=columns["permeances"][index],
+                units=columns["units"][first],
+            ).convert(to_units=Units.kg_m2_h_kPa, mixture=mixture)
         else:
             permeances = None
 
         if partial_fluxes is None and permeances is None:
             raise ValueError("Partial fluxes and permeances are not provided")
 
-        if pandas.isna(data["permeate_temperature"].iloc[0]):
+        if pandas.isna(columns["permeate_temperature"][first]):
             permeate_temperature = None
         else:
-            permeate_temperature = data["permeate_temperature"].iloc[0]
-        if pandas.isna(data["permeate_pressure"].iloc[0]):
+            permeate_temperature = columns["permeate_temperature"][first]
+        if pandas.isna(columns["permeate_pressure"][first]):
             permeate_pressure = None
         else:
-            permeate_pressure = data["permeate_pressure"].iloc[0]
+            permeate_pressure = columns["permeate_pressure"][first]
+
+        compositions = columns["composition"][index]
+        converted = columns["composition_converted"][index]
 
         return DiffusionCurve(
             mixture=mixture,
-            membrane_name=data["membrane_name"].iloc[0],
-            feed_temperature=data["feed_temperature"].iloc[0],
-            feed_compositions=[
-                Composition(
-                    p=data["composition"].iloc[i], type=data["composition_type"].iloc[i]
-                ).to_weight(mixture=mixture)
-                for i in range(len(data))
-            ],
+            membrane_name=columns["membrane_name"][first],
+            feed_temperature=columns["feed_temperature"][first],
+            feed_compositions=CompositionColumn(
+                values=numpy.where(
+                    converted, to_weight_fraction(compositions, mixture), compositions
+                ),
+                type=CompositionType.weight,
+            ),
             partial_fluxes=partial_fluxes,
             permeate_temperature=permeate_temperature,
             permeate_pressure=permeate_pressure,
             permeances=permeances,
-            comments=data["comment"].iloc[0],
+            comments=columns["comment"][first],
         )
 
+    @classmethod
+    def from_frame(cls, data: pandas.DataFrame) -> "DiffusionCurve":
+        """
+        Creates a DiffusionCurve from rows of a frame with DC_SET_COLUMNS related to a single curve
+        :param data: frame with the curve data
+        :return: DiffusionCurve with compositions converted to weight fractions and permeances in kg/(m2*h*kPa)
+        """
+        return cls._from_columns(_get_frame_columns(data), numpy.arange(len(data)))
+
     def save(self, path: typing.Union[str, Path]) -> None:
         """
-        Saves the curve to a specified path in the form of a .csv file
-        :param path: path to the directory
+        Saves the curve to a specified path in the form of a .csv file,
+        or a binary columnar file with DC_SET_SCHEMA if the path has .npz, .parquet or .feather suffix
+        :param path: path to the file
         :return: None, the object is saved in a specified directory
         """
         output = pandas.DataFrame(
             {
-                "composition": [c.p for c in self.feed_compositions],
-                "composition_type": [c.type for c in self.feed_compositions],
-                "partial_flux_1": [f[0] for f in self.partial_fluxes],
-                "partial_flux_2": [f[1] for f in self.partial_fluxes],
-                "permeance_1": [p[0].value for p in self.permeances],
-                "permeance_2": [p[1].value for p in self.permeances],
-                "units": [p[0].units for p in self.permeances],
+                "composition": self.feed_compositions.values,
+                "composition_type": self.feed_compositions.type,
+                "partial_flux_1": self.partial_fluxes.first,
+                "partial_flux_2": self.partial_fluxes.second,
+                "permeance_1": self.permeances.first,
+                "permeance_2": self.permeances.second,
+                "units": self.permeances.units,
             }
         )
         output["curve_id"] = "1"
@@ -474,8 +437,7 @@ class DiffusionCurve:
         output["permeate_temperature"] = self.permeate_temperature
         output["permeate_pressure"] = self.permeate_pressure
         output["comment"] = self.comments
-        output = output[DC_SET_COLUMNS]
-        output.to_csv(path, index=False)
+        write_frame(output, path, DC_SET_SCHEMA)
 
 
 @attr.s(auto_attribs=True)
@@ -491,8 +453,14 @@ class DiffusionCurveSet:
         return self.diffusion_curves[item]
 
     @classmethod
-    def load(cls, path: Path) -> "DiffusionCurveSet":
-        data = pandas.read_csv(path)
+    def load(cls, path: typing.Union[str, Path]) -> "DiffusionCurveSet":
+        """
+        Reads a DiffusionCurveSet from a .csv file or a binary columnar file (.npz, .parquet, .feather)
+        :param path: path to the file
+        :return: DiffusionCurveSet named after the file
+        """
+        path = Path(path)
+        data = read_frame(path)
         name = path.stem
 
         if list(data.columns) != DC_SET_COLUMNS:
@@ -500,10 +468,16 @@ class DiffusionCurveSet:
                 "Incorrect default_membranes: %s at %s" % (list(data.columns), path)
             )
 
-        raw_diffusion_curves = data.groupby("curve_id")
-        diffusion_curves = []
-        for _, curve in raw_diffusion_curves:
-            diffusion_curves.append(DiffusionCurve.from_frame(curve))
+        columns = _get_frame_columns(data)
+        codes, _ = pandas.factorize(data["curve_id"], sort=True)
+        order = numpy.argsort(codes, kind="stable")
+        bounds = numpy.searchsorted(
+            codes[order], numpy.arange(codes.max(initial=-1) + 2)
+        )
+        diffusion_curves = [
+            DiffusionCurve._from_columns(columns, order[start:stop])
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
 
         return cls(
             name=name,
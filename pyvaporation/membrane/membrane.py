@@ -1,3 +1,4 @@
+import bisect
 import typing
 from pathlib import Path
 
@@ -6,15 +7,104 @@ import numpy
 
 from ..components import Component
 from ..diffusion_curve import DiffusionCurveSet
-from ..experiments import IdealExperiments
+from ..experiments import IdealExperiment, IdealExperiments
 from ..permeance import Permeance, Units
 from ..utils import R
 
 
+@attr.s(auto_attribs=True)
+class _PenetrantIndex:
+    """
+    Ideal experiments of a single component sorted by temperature,
+    only the first stated experiment is kept for each temperature
+    """
+
+    experiments: typing.List[IdealExperiment]
+    temperatures: typing.List[float]
+    positions: typing.List[int]
+    permeances: typing.List[Permeance]
+    activation_energy: typing.Optional[float] = None
+
+    @classmethod
+    def from_experiments(
+        cls, experiments: typing.List[IdealExperiment], component: Component
+    ) -> "_PenetrantIndex":
+        """
+        :param experiments: ideal experiments of the component in the stated order
+        :param component: the component
+        :return: _PenetrantIndex
+        """
+        if len(experiments) == 0:
+            raise ValueError("No ideal experiments found for %s" % component.name)
+
+        order = sorted(
+            range(len(experiments)), key=lambda i: experiments[i].temperature
+        )
+        positions = [
+            i
+            for k, i in enumerate(order)
+            if k == 0
+            or experiments[i].temperature != experiments[order[k - 1]].temperature
+        ]
+        return cls(
+            experiments=[experiments[i] for i in positions],
+            temperatures=[experiments[i].temperature for i in positions],
+            positions=positions,
+            permeances=[
+                experiments[i].permeance.convert(
+                    to_units=Units().kg_m2_h_kPa, component=component
+                )
+                for i in positions
+            ],
+        )
+
+    def get_nearest(self, temperature: float) -> int:
+        """
+        :param temperature: temperature in K
+        :return: index of the experiment with the nearest temperature,
+        the first stated experiment is taken if two are equally near
+        """
+        index = bisect.bisect_left(self.temperatures, temperature)
+        if index == 0:
+            return 0
+        if index == len(self.temperatures):
+            return index - 1
+        lower = abs(self.temperatures[index - 1] - temperature)
+        upper = abs(self.temperatures[index] - temperature)
+        if lower < upper or (
+            lower == upper and self.positions[index - 1] < self.positions[index]
+        ):
+            return index - 1
+        return index
+
+    def get_nearest_array(self, temperature: numpy.ndarray) -> numpy.ndarray:
+        """
+        Vectorized version of get_nearest
+        :param temperature: array of temperatures in K
+        :return: array of indices of the experiments with the nearest temperatures
+        """
+        temperatures = numpy.array(self.temperatures, dtype=float)
+        positions = numpy.array(self.positions)
+        index = numpy.searchsorted(temperatures, temperature, side="left")
+        lower_index = numpy.clip(index - 1, 0, len(temperatures) - 1)
+        upper_index = numpy.clip(index, 0, len(temperatures) - 1)
+        lower = numpy.abs(temperatures[lower_index] - temperature)
+        upper = numpy.abs(temperatures[upper_index] - temperature)
+        return numpy.where(
+            (lower < upper)
+            | ((lower == upper) & (positions[lower_index] <= positions[upper_index])),
+            lower_index,
+            upper_index,
+        )
+
+
 @attr.s(auto_attribs=True)
 class Membrane:
     """
-    Class to represent a membrane
+    Class to represent a membrane;
+    Ideal experiments are indexed by component on the first permeance lookup,
+    the index is rebuilt when ideal experiments are replaced or experiments are added or removed,
+    clear_cache should be called after modification of the stated experiments
     """
 
     name: str
@@ -23,6 +113,13 @@ class Membrane:
 
     path: typing.Optional[Path] = None
 
+    _penetrant_indices: typing.Dict[str, _PenetrantIndex] = attr.ib(
+        factory=dict, init=False, repr=False, eq=False
+    )
+    _indexed_experiments: typing.Optional[tuple] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
     @classmethod
     def load(cls, path: typing.Union[str, Path]) -> "Membrane":
         """
@@ -65,6 +162,36 @@ class Membrane:
             path=path,
         )
 
+    def clear_cache(self) -> None:
+        """
+        Removes the indexed ideal experiments and calculated activation energies
+        """
+        self._penetrant_indices.clear()
+        self._indexed_experiments = None
+
+    def _get_penetrant_index(self, component: Component) -> _PenetrantIndex:
+        """
+        Gets indexed ideal experiments of the membrane for a specified Component
+        """
+        if (
+            self._indexed_experiments is None
+            or self._indexed_experiments[0] is not self.ideal_experiments
+            or self._indexed_experiments[1] is not self.ideal_experiments.experiments
+            or self._indexed_experiments[2] != len(self.ideal_experiments.experiments)
+        ):
+            self._penetrant_indices.clear()
+            self._indexed_experiments = (
+                self.ideal_experiments,
+                self.ideal_experiments.experiments,
+                len(self.ideal_experiments.experiments),
+            )
+
+        if component.name not in self._penetrant_indices:
+            self._penetrant_indices[component.name] = _PenetrantIndex.from_experiments(
+                self.get_penetrant_data(component).experiments, component
+            )
+        return self._penetrant_indices[component.name]
+
     def get_penetrant_data(self, component: Component) -> IdealExperiments:
         """
         Gets all ideal experiments of the membrane for a specified Component
@@ -88,6 +215,10 @@ class Membrane:
         Activation energy is assumed to be independent of concentration for Ideal Process
 
         """
+        penetrant_index = self._get_penetrant_index(component)
+        if penetrant_index.activation_energy is not None:
+            return penetrant_index.activation_energy
+
         component_experiments = self.get_penetrant_data(component)
         stated_activation_energy = component_experiments.experiments[
             0
@@ -99,6 +230,7 @@ class Membrane:
                 "the calculation of Apparent Activation Energy"
             )
         elif len(component_experiments) < 2 and stated_activation_energy is not None:
+            penetrant_index.activation_energy = stated_activation_energy
             return stated_activation_energy
 
         x = numpy.divide(
@@ -120,6 +252,7 @@ class Membrane:
 
         activation_energy, c = numpy.linalg.lstsq(a, y, rcond=-1)[0] * R
 
+        penetrant_index.activation_energy = -activation_energy
         return -activation_energy
 
     def get_permeance(
@@ -133,25 +266,14 @@ class Membrane:
         based on a given or calculated Apparent Activation Energy of Transport
         """
 
-        component_experiments = self.get_penetrant_data(component)
-
-        temperature_list = [
-            ideal_experiment.temperature
-            for ideal_experiment in component_experiments.experiments
-        ]
-
-        index = min(
-            range(len(temperature_list)),
-            key=lambda i: abs(temperature_list[i] - temperature),
-        )
-
-        given_permeance = component_experiments.experiments[index].permeance.convert(
-            to_units=Units().kg_m2_h_kPa, component=component
-        )
+        penetrant_index = self._get_penetrant_index(component)
+        index = penetrant_index.get_nearest(temperature)
+        experiment = penetrant_index.experiments[index]
+        given_permeance = penetrant_index.permeances[index]
 
         if (
-            component_experiments.experiments[index].activation_energy is None
-            and component_experiments.experiments[index].temperature != temperature
+            experiment.activation_energy is None
+            and experiment.temperature != temperature
         ):
 
             activation_energy = self.calculate_activation_energy(component)
@@ -160,19 +282,19 @@ class Membrane:
                 * numpy.exp(
                     -activation_energy
                     / R
-                    * (1 / temperature - 1 / temperature_list[index])
+                    * (1 / temperature - 1 / experiment.temperature)
                 )
             )
-        elif component_experiments.experiments[index].temperature == temperature:
+        elif experiment.temperature == temperature:
             return given_permeance
 
         elif initial_permeance is not None:
             return Permeance(
                 value=initial_permeance.value
                 * numpy.exp(
-                    -component_experiments.experiments[index].activation_energy
+                    -experiment.activation_energy
                     / R
-                    * (1 / temperature - 1 / temperature_list[index])
+                    * (1 / temperature - 1 / experiment.temperature)
                 )
             )
 
@@ -180,11 +302,67 @@ class Membrane:
             return Permeance(
                 value=given_permeance.value
                 * numpy.exp(
-                    -component_experiments.experiments[index].activation_energy
+                    -experiment.activation_energy
                     / R
-                    * (1 / temperature - 1 / temperature_list[index])
+                    * (1 / temperature - 1 / experiment.temperature)
+                )
+            )
+
+    def get_permeance_array(
+        self,
+        temperature: typing.Union[float, numpy.ndarray],
+        component: Component,
+        initial_permeance: typing.Optional[Permeance] = None,
+    ) -> numpy.ndarray:
+        """
+        Vectorized version of get_permeance
+        :param temperature: array of temperatures in K
+        :param component: the component
+        :param initial_permeance: Permeance used instead of the stated one,
+        if the activation energy of the nearest experiment is stated
+        :return: array of Permeances in kg/(m2*h*kPa)
+        """
+        temperature = numpy.asarray(temperature, dtype=float)
+        penetrant_index = self._get_penetrant_index(component)
+        index = penetrant_index.get_nearest_array(temperature)
+
+        reference_temperature = numpy.array(penetrant_index.temperatures)[index]
+        given_permeance = numpy.array(
+            [permeance.value for permeance in penetrant_index.permeances]
+        )[index]
+        activation_energy = numpy.array(
+            [
+                (
+                    numpy.nan
+                    if experiment.activation_energy is None
+                    else experiment.activation_energy
                 )
+                for experiment in penetrant_index.experiments
+            ],
+            dtype=float,
+        )[index]
+
+        stated = ~numpy.isnan(activation_energy)
+        extrapolated = reference_temperature != temperature
+        if numpy.any(~stated & extrapolated):
+            activation_energy = numpy.where(
+                stated, activation_energy, self.calculate_activation_energy(component)
             )
+        if initial_permeance is not None:
+            given_permeance = numpy.where(
+                stated & extrapolated, initial_permeance.value, given_permeance
+            )
+
+        return numpy.where(
+            extrapolated,
+            given_permeance
+            * numpy.exp(
+                -numpy.nan_to_num(activation_energy)
+                / R
+                * (1 / temperature - 1 / reference_temperature)
+            ),
+            given_permeance,
+        )
 
     def get_ideal_selectivity(
         self,
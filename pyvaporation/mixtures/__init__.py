@@ -1,5 +1,7 @@
 from .mixture import (Composition, CompositionType, Mixture,
-                      get_nrtl_partial_pressures)
+                      get_nrtl_partial_pressures,
+                      get_nrtl_partial_pressures_array, to_molar_fraction,
+                      to_weight_fraction)
 from .mixtures import Mixtures
 
 __all__ = [
@@ -7,5 +9,8 @@ __all__ = [
     "Mixtures",
     "Composition",
     "get_nrtl_partial_pressures",
+    "get_nrtl_partial_pressures_array",
+    "to_molar_fraction",
+    "to_weight_fraction",
     "CompositionType",
 ]
@@ -32,6 +32,21 @@ class Mixture:
     second_component: Component
     nrtl_params: NRTLParameters
 
+    def tabulate(self, t_min: float, t_max: float, rtol: float = 1e-9) -> "Mixture":
+        """
+        Creates a copy of the Mixture with the components tabulated within the temperature range,
+        see Component.tabulate
+        :param t_min: lower bound of the temperature range, K
+        :param t_max: upper bound of the temperature range, K
+        :param rtol: required relative error of the tables
+        :return: Mixture
+        """
+        return attr.evolve(
+            self,
+            first_component=self.first_component.tabulate(t_min, t_max, rtol),
+            second_component=self.second_component.tabulate(t_min, t_max, rtol),
+        )
+
 
 @attr.s(auto_attribs=True)
 class Composition:
@@ -63,11 +78,9 @@ class Composition:
         if self.type == CompositionType.molar:
             return self
         else:
-            p = (self.p / mixture.first_component.molecular_weight) / (
-                self.p / mixture.first_component.molecular_weight
-                + (1 - self.p) / mixture.second_component.molecular_weight
+            return Composition(
+                p=float(to_molar_fraction(self.p, mixture)), type=CompositionType.molar
             )
-            return Composition(p=p, type=CompositionType.molar)
 
     def to_weight(self, mixture: Mixture) -> "Composition":
         """
@@ -76,11 +89,95 @@ class Composition:
         if self.type == CompositionType.weight:
             return self
         else:
-            p = (mixture.first_component.molecular_weight * self.p) / (
-                mixture.first_component.molecular_weight * self.p
-                + mixture.second_component.molecular_weight * (1 - self.p)
+            return Composition(
+                p=float(to_weight_fraction(self.p, mixture)),
+                type=CompositionType.weight,
             )
-            return Composition(p=p, type=CompositionType.weight)
+
+
+def to_molar_fraction(
+    weight_fraction: typing.Union[float, numpy.ndarray], mixture: Mixture
+) -> numpy.ndarray:
+    """
+    Converts weight fractions of the first component to molar fractions
+    :param weight_fraction: weight fraction (or an array of fractions) of the first component
+    :param mixture: Mixture
+    :return: molar fractions of the first component
+    """
+    weight_fraction = numpy.asarray(weight_fraction, dtype=float)
+    return (weight_fraction / mixture.first_component.molecular_weight) / (
+        weight_fraction / mixture.first_component.molecular_weight
+        + (1 - weight_fraction) / mixture.second_component.molecular_weight
+    )
+
+
+def to_weight_fraction(
+    molar_fraction: typing.Union[float, numpy.ndarray], mixture: Mixture
+) -> numpy.ndarray:
+    """
+    Converts molar fractions of the first component to weight fractions
+    :param molar_fraction: molar fraction (or an array of fractions) of the first component
+    :param mixture: Mixture
+    :return: weight fractions of the first component
+    """
+    molar_fraction = numpy.asarray(molar_fraction, dtype=float)
+    return (mixture.first_component.molecular_weight * molar_fraction) / (
+        mixture.first_component.molecular_weight * molar_fraction
+        + mixture.second_component.molecular_weight * (1 - molar_fraction)
+    )
+
+
+def get_nrtl_partial_pressures_array(
+    temperature: typing.Union[float, numpy.ndarray],
+    mixture: Mixture,
+    molar_fraction: typing.Union[float, numpy.ndarray],
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Calculation of partial pressures of both components using NRTL model,
+    temperatures and compositions are broadcast against each other
+    :params
+    temperature: temperature (or an array of temperatures) in K
+    mixture: Mixture
+    molar_fraction: molar fraction (or an array of fractions) of the first component
+    :return: Partial pressures of both components as a tuple of arrays in kPa
+    """
+    temperature = numpy.asarray(temperature, dtype=float)
+    first = numpy.asarray(molar_fraction, dtype=float)
+    second = 1 - first
+
+    tau_12 = mixture.nrtl_params.a12 + mixture.nrtl_params.g12 / (R * temperature)
+    tau_21 = mixture.nrtl_params.a21 + mixture.nrtl_params.g21 / (R * temperature)
+    if mixture.nrtl_params.alpha21 is None:
+        alpha_21 = mixture.nrtl_params.alpha12
+    else:
+        alpha_21 = mixture.nrtl_params.alpha21
+
+    g_exp_12 = numpy.exp(-tau_12 * mixture.nrtl_params.alpha12)
+    g_exp_21 = numpy.exp(-tau_21 * alpha_21)
+
+    activity_coefficient_1 = numpy.exp(
+        second**2
+        * (
+            tau_21 * (g_exp_21 / (first + second * g_exp_21)) ** 2
+            + tau_12 * g_exp_12 / (second + first * g_exp_12) ** 2
+        )
+    )
+    activity_coefficient_2 = numpy.exp(
+        first**2
+        * (
+            tau_12 * (g_exp_12 / (second + first * g_exp_12)) ** 2
+            + tau_21 * g_exp_21 / (first + second * g_exp_21) ** 2
+        )
+    )
+
+    return (
+        mixture.first_component.get_vapor_pressure(temperature)
+        * activity_coefficient_1
+        * first,
+        mixture.second_component.get_vapor_pressure(temperature)
+        * activity_coefficient_2
+        * second,
+    )
 
 
 def get_nrtl_partial_pressures(
@@ -99,47 +196,7 @@ def get_nrtl_partial_pressures(
     if composition.type == CompositionType.weight:
         composition = composition.to_molar(mixture=mixture)
 
-    tau = numpy.array(
-        [
-            (mixture.nrtl_params.a12 + mixture.nrtl_params.g12 / (R * temperature)),
-            (mixture.nrtl_params.a21 + mixture.nrtl_params.g21 / (R * temperature)),
-        ]
-    )
-    if mixture.nrtl_params.alpha21 is None:
-        alphas = mixture.nrtl_params.alpha12
-    else:
-        alphas = [mixture.nrtl_params.alpha12, mixture.nrtl_params.alpha21]
-
-    g_exp = numpy.exp(numpy.multiply(-tau, alphas))
-
-    activity_coefficients = [
-        numpy.exp(
-            (composition.second**2)
-            * (
-                tau[1]
-                * (g_exp[1] / (composition.first + composition.second * g_exp[1])) ** 2
-                + tau[0]
-                * g_exp[0]
-                / (composition.second + composition.first * g_exp[0]) ** 2
-            )
-        ),
-        numpy.exp(
-            (composition.first**2)
-            * (
-                tau[0]
-                * (g_exp[0] / (composition.second + composition.first * g_exp[0])) ** 2
-                + tau[1]
-                * g_exp[1]
-                / (composition.first + composition.second * g_exp[1]) ** 2
-            )
-        ),
-    ]
-
-    return (
-        mixture.first_component.get_vapor_pressure(temperature)
-        * activity_coefficients[0]
-        * composition.first,
-        mixture.second_component.get_vapor_pressure(temperature)
-        * activity_coefficients[1]
-        * composition.second,
+    first_partial_pressure, second_partial_pressure = get_nrtl_partial_pressures_array(
+        temperature, mixture, composition.first
     )
+    return float(first_partial_pressure), float(second_partial_pressure)
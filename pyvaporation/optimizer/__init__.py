@@ -1,3 +1,13 @@
-from .optimizer import Measurements, PervaporationFunction, find_best_fit, fit
+from .fit_cache import FitCache
+from .optimizer import (FitMethod, Measurements, PervaporationFunction,
+                        find_best_fit, fit, fit_linearized)
 
-__all__ = ["PervaporationFunction", "Measurements", "fit", "find_best_fit"]
+__all__ = [
+    "PervaporationFunction",
+    "Measurements",
+    "FitMethod",
+    "fit",
+    "fit_linearized",
+    "find_best_fit",
+    "FitCache",
+]
@@ -0,0 +1,135 @@
+import hashlib
+import inspect
+import json
+import typing
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+
+import attr
+import numpy
+
+from .optimizer import Measurements, PervaporationFunction, find_best_fit
+
+_IGNORED_OPTIONS = {"data", "n_jobs", "executor"}
+
+
+@attr.s(auto_attribs=True)
+class FitCache:
+    """
+    Content-addressed cache of the PervaporationFunctions obtained with find_best_fit;
+    The functions are identified by a hash of the measurements and the fit options,
+    the recently used functions are stored in memory,
+    if the path is specified, the functions are also stored on disk as .npz files with plain arrays
+    of the coefficients, so that no pickles are loaded from the cache
+    :param maxsize: max number of functions stored in memory
+    :param path: path to the directory, where the functions are stored on disk
+    """
+
+    maxsize: int = 128
+    path: typing.Optional[Path] = None
+    _functions: typing.MutableMapping[str, PervaporationFunction] = attr.ib(
+        factory=OrderedDict, init=False, repr=False, eq=False
+    )
+
+    def __attrs_post_init__(self):
+        if self.path is not None:
+            self.path = Path(self.path)
+            self.path.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._functions)
+
+    @classmethod
+    def from_membrane_path(
+        cls, membrane_path: typing.Union[str, Path], maxsize: int = 128
+    ) -> "FitCache":
+        """
+        Creates a FitCache, which stores the functions in the results directory of a membrane
+        :param membrane_path: path to the membrane
+        :param maxsize: max number of functions stored in memory
+        :return: FitCache
+        """
+        return cls(maxsize=maxsize, path=Path(membrane_path) / "results" / "fits")
+
+    @staticmethod
+    def get_key(data: Measurements, **options) -> str:
+        """
+        :param data: List of Measurements
+        :param options: options of find_best_fit, the omitted options are set to defaults
+        :return: hash of the measurements and the fit options
+        """
+        options = {
+            **{
+                name: parameter.default
+                for name, parameter in inspect.signature(
+                    find_best_fit
+                ).parameters.items()
+                if name not in _IGNORED_OPTIONS
+            },
+            **{
+                name: value
+                for name, value in options.items()
+                if name not in _IGNORED_OPTIONS
+            },
+        }
+        key = hashlib.sha256()
+        for column in data.to_arrays():
+            key.update(numpy.ascontiguousarray(column, dtype=float).tobytes())
+            key.update(b"|")
+        key.update(json.dumps(options, sort_keys=True, default=str).encode())
+        return key.hexdigest()
+
+    def get(self, key: str) -> typing.Optional[PervaporationFunction]:
+        """
+        :param key: hash of the measurements and the fit options
+        :return: a copy of the stored PervaporationFunction, None if the function is not stored
+        """
+        if key in self._functions:
+            self._functions.move_to_end(key)
+            return deepcopy(self._functions[key])
+
+        if self.path is not None and (self.path / f"{key}.npz").exists():
+            function = PervaporationFunction.load(self.path / f"{key}.npz")
+            self._store(key, function)
+            return deepcopy(function)
+
+        return None
+
+    def put(self, key: str, function: PervaporationFunction) -> None:
+        """
+        Stores a copy of the PervaporationFunction
+        :param key: hash of the measurements and the fit options
+        :param function: PervaporationFunction
+        """
+        function = deepcopy(function)
+        self._store(key, function)
+        if self.path is not None:
+            function.save(self.path / f"{key}.npz")
+
+    def _store(self, key: str, function: PervaporationFunction) -> None:
+        self._functions[key] = function
+        self._functions.move_to_end(key)
+        while len(self._functions) > self.maxsize:
+            self._functions.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes the functions stored in memory
+        """
+        self._functions.clear()
+
+    def find_best_fit(self, data: Measurements, **options) -> PervaporationFunction:
+        """
+        Returns the stored best fit of PervaporationFunction to given data,
+        the fit is performed with find_best_fit if it is not stored
+        :param data: List of Measurements
+        :param options: options of find_best_fit
+        :return: PervaporationFunction
+        """
+        key = self.get_key(data, **options)
+        function = self.get(key)
+        if function is None:
+            function = find_best_fit(data=data, **options)
+            self.put(key, function)
+        return function
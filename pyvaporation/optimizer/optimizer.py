@@ -1,5 +1,7 @@
 import typing
+from concurrent.futures import Executor
 from copy import copy
+from functools import partial
 from pathlib import Path
 
 import attr
@@ -62,6 +64,16 @@ class Measurements:
     def append(self, measurement: Measurement) -> None:
         self.data.append(measurement)
 
+    def to_arrays(self) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        :return: concentrations, temperatures and permeances of the measurements as arrays
+        """
+        return (
+            numpy.array([measurement.x for measurement in self.data], dtype=float),
+            numpy.array([measurement.t for measurement in self.data], dtype=float),
+            numpy.array([measurement.p for measurement in self.data], dtype=float),
+        )
+
     @classmethod
     def from_diffusion_curve_second(cls, curve: DiffusionCurve) -> "Measurements":
         """
@@ -156,21 +168,43 @@ class PervaporationFunction:
             b=self.b,
         )
 
+    def to_array(self) -> numpy.ndarray:
+        """
+        :return: array of coefficients [alpha, a..., b...], see from_array
+        """
+        return numpy.concatenate(
+            (
+                [self.alpha],
+                numpy.asarray(self.a, dtype=float),
+                numpy.asarray(self.b, dtype=float),
+            )
+        ).astype(float)
+
     @classmethod
     def load(cls, path: typing.Union[str, Path]) -> "PervaporationFunction":
         """
-        :param path: path to binary file with PervaporationFunction
+        :param path: path to binary file with PervaporationFunction,
+        .npz files are read as plain arrays of coefficients, other files as joblib pickles
         :return: PervaporationFunction
         """
         if type(path) is not Path:
             path = Path(path)
+        if path.suffix == ".npz":
+            with numpy.load(path, allow_pickle=False) as data:
+                return cls.from_array(
+                    data["coefficients"], n=int(data["n"]), m=int(data["m"])
+                )
         return joblib.load(path)
 
     def save(self, path: typing.Union[str, Path]) -> None:
         """
-        :param path: path where to save binary file with PervaporationFunction
+        :param path: path where to save binary file with PervaporationFunction,
+        for .npz files the coefficients are saved as plain arrays, otherwise the object is pickled with joblib
         """
-        joblib.dump(self, path)
+        if Path(path).suffix == ".npz":
+            numpy.savez(path, n=self.n, m=self.m, coefficients=self.to_array())
+        else:
+            joblib.dump(self, path)
 
     def plot(
         self,
@@ -244,6 +278,16 @@ class PervaporationFunction:
         )
 
 
+class FitMethod:
+    """
+    A class to describe methods used for fitting of the PervaporationFunction
+    """
+
+    powell: str = "powell"
+    linear: str = "linear"
+    least_squares: str = "least_squares"
+
+
 def _suggest_n_m(
     data: Measurements, n: typing.Optional[int] = None, m: typing.Optional[int] = None
 ) -> typing.Tuple[int, int]:
@@ -262,12 +306,117 @@ def get_initial_guess(n: int, m: int) -> typing.List[float]:
     return [1] * (2 + n + m)
 
 
-def objective(data: Measurements, params: typing.List[float], n: int, m: int) -> float:
-    error = 0
-    foo = PervaporationFunction.from_array(array=params, n=n, m=m)
-    for d in data:
-        error += (foo(d.x, d.t) - d.p) ** 2
-    return numpy.sqrt(error / len(data))
+def fit_linearized(data: Measurements, n: int, m: int) -> numpy.ndarray:
+    """
+    Fits logarithm of the PervaporationFunction to given data by linear least squares;
+    Measurements with non-positive permeances are not taken into account
+    :param data: List of Measurements
+    :param n: max power of temperature independent components in equation
+    :param m: max power of temperature dependent components in equation
+    :return: array of coefficients of the PervaporationFunction
+    """
+    x, t, p = data.to_arrays()
+    positive = p > 0
+    if not positive.any():
+        raise ValueError("Linearized fit requires measurements with positive permeance")
+    x, t, p = x[positive], t[positive], p[positive]
+
+    matrix = numpy.column_stack(
+        [numpy.ones_like(x)]
+        + [numpy.power(x, i + 1) for i in range(n)]
+        + [-numpy.power(x, i) / t for i in range(m + 1)]
+    )
+    coefficients = numpy.linalg.lstsq(matrix, numpy.log(p), rcond=None)[0]
+    coefficients[0] = numpy.exp(coefficients[0])
+    return coefficients
+
+
+def _get_exponent(
+    params: numpy.ndarray, x: numpy.ndarray, t: numpy.ndarray, n: int, m: int
+) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    :return: powers of concentrations and the exponent of the PervaporationFunction
+    """
+    powers = numpy.power.outer(x, numpy.arange(max(n, m) + 1))
+    exponent = (
+        powers[:, 1 : n + 1] @ params[1 : n + 1]
+        - powers[:, : m + 1] @ params[n + 1 :] / t
+    )
+    return powers, exponent
+
+
+def residuals(
+    params: numpy.ndarray,
+    x: numpy.ndarray,
+    t: numpy.ndarray,
+    p: numpy.ndarray,
+    n: int,
+    m: int,
+) -> numpy.ndarray:
+    """
+    Calculates deviations of the PervaporationFunction from the measured permeances
+    :param params: array of coefficients of the PervaporationFunction
+    :param x: concentrations
+    :param t: temperatures in K
+    :param p: permeances
+    :param n: max power of temperature independent components in equation
+    :param m: max power of temperature dependent components in equation
+    :return: array of deviations
+    """
+    params = numpy.asarray(params, dtype=float)
+    _, exponent = _get_exponent(params, x, t, n, m)
+    return params[0] * numpy.exp(exponent) - p
+
+
+def residuals_jacobian(
+    params: numpy.ndarray,
+    x: numpy.ndarray,
+    t: numpy.ndarray,
+    p: numpy.ndarray,
+    n: int,
+    m: int,
+) -> numpy.ndarray:
+    """
+    Calculates derivatives of the deviations with respect to the coefficients of the PervaporationFunction
+    :param params: array of coefficients of the PervaporationFunction
+    :param x: concentrations
+    :param t: temperatures in K
+    :param p: permeances
+    :param n: max power of temperature independent components in equation
+    :param m: max power of temperature dependent components in equation
+    :return: Jacobian matrix of the shape (number of measurements, number of coefficients)
+    """
+    params = numpy.asarray(params, dtype=float)
+    powers, exponent = _get_exponent(params, x, t, n, m)
+    exponential = numpy.exp(exponent)
+    value = params[0] * exponential
+    return numpy.column_stack(
+        (
+            exponential,
+            value[:, None] * powers[:, 1 : n + 1],
+            -value[:, None] * powers[:, : m + 1] / t[:, None],
+        )
+    )
+
+
+def objective(
+    data: typing.Union[
+        Measurements, typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    ],
+    params: typing.List[float],
+    n: int,
+    m: int,
+) -> float:
+    """
+    :param data: List of Measurements or arrays of concentrations, temperatures and permeances
+    :param params: array of coefficients of the PervaporationFunction
+    :param n: max power of temperature independent components in equation
+    :param m: max power of temperature dependent components in equation
+    :return: root mean square deviation of the PervaporationFunction from the measured permeances
+    """
+    if isinstance(data, Measurements):
+        data = data.to_arrays()
+    return numpy.sqrt(numpy.mean(residuals(params, *data, n=n, m=m) ** 2))
 
 
 def fit(
@@ -276,21 +425,34 @@ def fit(
     m: typing.Optional[int] = None,
     include_zero: bool = False,
     component_index: int = 0,
+    method: str = FitMethod.powell,
+    warm_start: bool = False,
 ) -> PervaporationFunction:
     """
     Fit PervaporationFunction to given data with pre-defined parameters
     :param data: List of Measurements
     :param n: max power of temperature independent components in equation
     :param m: max power of temperature dependent components in equation
-    :param include_zero: include zero-datapoint or not
+    :param include_zero: include zero-datapoint or not, not supported by FitMethod.linear
     :param component_index: index of component to fit
+    :param method: FitMethod.powell - minimization of the RMSE with Powell method (default),
+    FitMethod.linear - linear least squares fit of the logarithm of the permeance,
+    FitMethod.least_squares - Levenberg-Marquardt (Trust Region Reflective for underdetermined problems)
+    least squares with the analytical Jacobian
+    :param warm_start: if True, the linearized fit is used as the initial guess of the minimization,
+    otherwise the minimization starts from zeros (ones for FitMethod.least_squares);
+    the zero-datapoints are not taken into account by the initial guess
     :return: PervaporationFunction
     """
     _n, _m = _suggest_n_m(data, n, m)
     if component_index not in {0, 1}:
         raise ValueError("Index should be either 0 or 1")
+    if include_zero and method == FitMethod.linear:
+        raise ValueError(
+            "Zero-datapoints can not be included in the linearized fit of the logarithm"
+        )
 
-    _data = copy(data)
+    _data = Measurements(data=copy(data.data))
 
     if include_zero:
         unique_temperatures = set([m.t for m in data])
@@ -303,9 +465,37 @@ def fit(
                 )
             )
 
+    if method == FitMethod.linear:
+        return PervaporationFunction.from_array(
+            array=fit_linearized(data, n=_n, m=_m), n=_n, m=_m
+        )
+    arrays = _data.to_arrays()
+
+    if method == FitMethod.least_squares:
+        if warm_start:
+            initial_guess = fit_linearized(data, n=_n, m=_m)
+        else:
+            initial_guess = numpy.array(get_initial_guess(_n, _m), dtype=float)
+        result = optimize.least_squares(
+            residuals,
+            x0=initial_guess,
+            jac=residuals_jacobian,
+            method="lm" if len(_data) >= 2 + _n + _m else "trf",
+            args=(*arrays, _n, _m),
+        )
+        return PervaporationFunction.from_array(array=result.x, n=_n, m=_m)
+
+    if method != FitMethod.powell:
+        raise ValueError("Fit method %s is not supported" % method)
+
+    if warm_start:
+        initial_guess = fit_linearized(data, n=_n, m=_m)
+    else:
+        initial_guess = numpy.array([0] * (2 + _n + _m))
+
     result = optimize.minimize(
-        lambda params: objective(_data, params, n=_n, m=_m),
-        x0=numpy.array([0] * (2 + _n + _m)),
+        lambda params: objective(arrays, params, n=_n, m=_m),
+        x0=initial_guess,
         method="Powell",
     )
     return PervaporationFunction.from_array(array=result.x, n=_n, m=_m)
@@ -317,14 +507,25 @@ def find_best_fit(
     component_index: int = 0,
     n: typing.Optional[int] = None,
     m: typing.Optional[int] = None,
+    method: str = FitMethod.powell,
+    warm_start: bool = False,
+    n_jobs: int = 1,
+    executor: typing.Optional[Executor] = None,
 ) -> PervaporationFunction:
     """
-    Finds best fit of PervaporationFunction to given data
+    Finds best fit of PervaporationFunction to given data;
+    The fits for the different (n, m) are independent and may be performed in parallel,
+    the best fit is selected in the same order as in the serial case,
+    so the result does not depend on the parallelization
     :param data: List of Measurements
     :param include_zero: include zero-datapoint or not
     :param component_index: index of component to fit
     :param n: max power of temperature independent components in equation
     :param m: max power of temperature dependent components in equation
+    :param method: fit method, see fit
+    :param warm_start: if True, the linearized fit is used as the initial guess of the minimization
+    :param n_jobs: number of processes used for fitting, -1 means using all processors
+    :param executor: concurrent.futures.Executor used for fitting, overrides n_jobs
     :return: PervaporationFunction
     """
     max_power_n = min(5, round(numpy.power(len(data), 0.5)))
@@ -347,27 +548,36 @@ def find_best_fit(
                 "m is more or equal to the number of available temperature points, you may be over-fitting"
             )
 
+    grid = [(n, m) for n in n_tries for m in m_tries]
+    fit_function = partial(
+        fit,
+        data,
+        include_zero=include_zero,
+        component_index=component_index,
+        method=method,
+        warm_start=warm_start,
+    )
+
+    if executor is not None:
+        curves = list(
+            executor.map(fit_function, [n for n, _ in grid], [m for _, m in grid])
+        )
+    elif n_jobs != 1:
+        curves = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(fit_function)(n=n, m=m) for n, m in grid
+        )
+    else:
+        curves = [fit_function(n=n, m=m) for n, m in grid]
+
+    x, t, p = data.to_arrays()
     best_curve = None
     best_loss = numpy.inf
 
-    for n in n_tries:
-        for m in m_tries:
-            curve = fit(
-                data,
-                n=n,
-                m=m,
-                include_zero=include_zero,
-                component_index=component_index,
-            )
-            loss = sum(
-                [
-                    (curve(measurement.x, measurement.t) - measurement.p) ** 2
-                    for measurement in data
-                ]
-            )
+    for curve in curves:
+        loss = numpy.sum((curve(x, t) - p) ** 2)
 
-            if loss < best_loss:
-                best_curve = curve
-                best_loss = loss
+        if loss < best_loss:
+            best_curve = curve
+            best_loss = loss
 
     return best_curve
@@ -1,3 +1,16 @@
-from .pervaporation import Pervaporation
+from .pervaporation import (PartialFluxesBatch, Pervaporation,
+                            ProcessCheckpoint, ProcessEngine, ProcessEnsemble,
+                            ProcessState, SolverMethod)
+from .sweep import FIT_PARAMETERS, parameter_sweep
 
-__all__ = ["Pervaporation"]
+__all__ = [
+    "Pervaporation",
+    "PartialFluxesBatch",
+    "SolverMethod",
+    "ProcessEngine",
+    "ProcessState",
+    "ProcessEnsemble",
+    "ProcessCheckpoint",
+    "parameter_sweep",
+    "FIT_PARAMETERS",
+]
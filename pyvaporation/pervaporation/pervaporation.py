@@ -1,18 +1,25 @@
 import datetime
+import json
+import os
 import typing
 from datetime import datetime
+from pathlib import Path
 
 import attr
 import numpy
+from scipy import integrate, interpolate, optimize
 
-from ..conditions import Conditions
-from ..diffusion_curve import DiffusionCurve, DiffusionCurveSet
+from ..conditions import Conditions, StopConditions
+from ..diffusion_curve import (CompositionColumn, DiffusionCurve,
+                               DiffusionCurveSet, PartialFluxColumn,
+                               PermeanceColumn)
 from ..membrane import Membrane
 from ..mixtures import (Composition, CompositionType, Mixture,
-                        get_nrtl_partial_pressures)
-from ..optimizer import Measurements, find_best_fit
+                        get_nrtl_partial_pressures,
+                        get_nrtl_partial_pressures_array, to_molar_fraction)
+from ..optimizer import FitCache, Measurements, PervaporationFunction
 from ..permeance import Permeance, Units
-from ..process import ProcessModel
+from ..process import ProcessModel, ProcessSink, ProcessStep
 from ..utils import R
 
 
@@ -25,10 +32,615 @@ def get_permeate_composition_from_fluxes(
     )
 
 
+class SolverMethod:
+    """
+    A class to describe methods of the permeate composition calculation
+    """
+
+    newton: str = "newton"
+    substitution: str = "substitution"
+
+
+def _find_root_newton_brent(
+    residual: typing.Callable[[float], float],
+    initial_guess: float,
+    precision: float,
+    max_iterations: int,
+    derivative_step: float = 1e-7,
+) -> typing.Tuple[float, int]:
+    """
+    Finds a root of a 1-D residual on [0, 1] using Newton iterations with a Brent fallback.
+    The residual is expected to be non-negative at 0 and non-positive at 1,
+    the bracket is narrowed at each Newton iteration
+    :param residual: residual function
+    :param initial_guess: starting point of the Newton iterations
+    :param precision: absolute tolerance of the residual
+    :param max_iterations: maximum total number of the Newton and the Brent iterations
+    :param derivative_step: step for the finite difference derivative of the residual
+    :return: root of the residual and the number of iterations, which were required to find it
+    """
+    lower, upper = 0.0, 1.0
+    x = min(max(initial_guess, lower), upper)
+
+    iterations = 0
+    while iterations < max_iterations:
+        r = residual(x)
+        if abs(r) < precision:
+            return x, iterations
+        iterations += 1
+        if r > 0:
+            lower = x
+        else:
+            upper = x
+
+        step = derivative_step if x + derivative_step <= 1 else -derivative_step
+        derivative = (residual(x + step) - r) / step
+        if derivative == 0 or not numpy.isfinite(derivative):
+            break
+        x_new = x - r / derivative
+        if not lower <= x_new <= upper:
+            break
+        x = x_new
+
+    r_lower = residual(lower)
+    r_upper = residual(upper)
+    if abs(r_lower) < precision:
+        return lower, iterations
+    if abs(r_upper) < precision:
+        return upper, iterations
+    if iterations >= max_iterations:
+        raise ValueError(
+            "Permeate composition calculation did not converge in %s iterations"
+            % max_iterations
+        )
+    if not r_lower * r_upper < 0:
+        raise ValueError(
+            "Permeate composition calculation did not converge: "
+            "residual does not change sign on [%s, %s]" % (lower, upper)
+        )
+
+    root, result = optimize.brentq(
+        residual,
+        lower,
+        upper,
+        xtol=precision / 10,
+        maxiter=max_iterations - iterations,
+        full_output=True,
+        disp=False,
+    )
+    if not result.converged:
+        raise ValueError(
+            "Permeate composition calculation did not converge in %s iterations"
+            % max_iterations
+        )
+    return root, iterations + result.iterations
+
+
+class ProcessEngine:
+    """
+    A class to describe engines used for the modelling of the processes
+    """
+
+    euler: str = "euler"
+    quadrature: str = "quadrature"
+    adaptive: str = "adaptive"
+
+
+@attr.s(auto_attribs=True)
+class PartialFluxesBatch:
+    """
+    Results of the vectorized partial fluxes calculation
+    :param partial_fluxes: Partial fluxes of both components in kg/(m2*h), array of shape (N, 2)
+    :param permeate_composition: Weight fraction of the first component in permeate, array of shape (N,)
+    :param converged: Convergence mask of the permeate composition iteration, array of shape (N,)
+    :param iterations: Number of iterations of the permeate composition, required for each point,
+    array of shape (N,)
+    """
+
+    partial_fluxes: numpy.ndarray
+    permeate_composition: numpy.ndarray
+    converged: numpy.ndarray
+    iterations: typing.Optional[numpy.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.permeate_composition)
+
+
+def _start_step(
+    time: float,
+    feed_composition: float,
+    feed_mass: float,
+    feed_temperature: float,
+    permeances: typing.Tuple[float, float],
+) -> ProcessStep:
+    """
+    :return: ProcessStep with the state at the beginning of the step,
+    the fluxes and the heats are NaN until the step is calculated
+    """
+    return ProcessStep(
+        time=time,
+        feed_composition=feed_composition,
+        feed_mass=feed_mass,
+        feed_temperature=feed_temperature,
+        partial_fluxes=(numpy.nan, numpy.nan),
+        permeances=permeances,
+        permeate_composition=numpy.nan,
+        feed_evaporation_heat=numpy.nan,
+    )
+
+
+def _get_stop_state(step: ProcessStep) -> typing.Tuple[float, float, float, float]:
+    """
+    :param step: calculated ProcessStep
+    :return: process time, mass of the first component, feed mass and total flux at the beginning of the step
+    """
+    return (
+        step.time,
+        step.feed_composition * step.feed_mass,
+        step.feed_mass,
+        step.partial_fluxes[0] + step.partial_fluxes[1],
+    )
+
+
+def _truncate_steps(
+    previous: ProcessStep, current: ProcessStep, fraction: float
+) -> typing.List[ProcessStep]:
+    """
+    Replaces the last two steps of a process by the steps, where the process is stopped;
+    The state is interpolated within the previous step, the heats of the previous step are scaled accordingly
+    :param previous: the step, within which the process is stopped
+    :param current: the first step after the stop
+    :param fraction: fraction of the previous step, where the process is stopped
+    :return: the final steps of the process
+    """
+    if fraction == 0:
+        return [
+            attr.evolve(
+                previous,
+                feed_evaporation_heat=0.0,
+                permeate_condensation_heat=(
+                    None if previous.permeate_condensation_heat is None else 0.0
+                ),
+            )
+        ]
+
+    def interpolate(previous_value: float, value: float) -> float:
+        return previous_value + fraction * (value - previous_value)
+
+    first_component_mass = interpolate(
+        previous.feed_composition * previous.feed_mass,
+        current.feed_composition * current.feed_mass,
+    )
+    feed_mass = interpolate(previous.feed_mass, current.feed_mass)
+    partial_fluxes = (
+        interpolate(previous.partial_fluxes[0], current.partial_fluxes[0]),
+        interpolate(previous.partial_fluxes[1], current.partial_fluxes[1]),
+    )
+    return [
+        attr.evolve(
+            previous,
+            feed_evaporation_heat=previous.feed_evaporation_heat * fraction,
+            permeate_condensation_heat=(
+                None
+                if previous.permeate_condensation_heat is None
+                else previous.permeate_condensation_heat * fraction
+            ),
+        ),
+        attr.evolve(
+            current,
+            time=interpolate(previous.time, current.time),
+            feed_composition=first_component_mass / feed_mass,
+            feed_mass=feed_mass,
+            feed_temperature=interpolate(
+                previous.feed_temperature, current.feed_temperature
+            ),
+            partial_fluxes=partial_fluxes,
+            permeances=(
+                interpolate(previous.permeances[0], current.permeances[0]),
+                interpolate(previous.permeances[1], current.permeances[1]),
+            ),
+            permeate_composition=partial_fluxes[0]
+            / (partial_fluxes[0] + partial_fluxes[1]),
+            feed_evaporation_heat=0.0,
+            permeate_condensation_heat=(
+                None if previous.permeate_condensation_heat is None else 0.0
+            ),
+        ),
+    ]
+
+
+@attr.s(auto_attribs=True)
+class _StepBuffer:
+    """
+    The last two steps of a process modelled with explicit Euler steps
+    :param current: the step, which is calculated next
+    :param previous: the last calculated step, it is final only after the stop conditions of the current step
+    are checked, None before the first step
+    :param step: index of the current step
+    """
+
+    current: ProcessStep
+    previous: typing.Optional[ProcessStep] = None
+    step: int = 0
+
+    def get_permeate_composition_guess(
+        self, conditions: Conditions
+    ) -> typing.Optional[float]:
+        """
+        Provides a starting point of the permeate composition iterations at the current step,
+        consecutive steps differ slightly, so the permeate composition of the previous step is used
+        :param conditions: Conditions object, where initial conditions are specified
+        :return: permeate composition of the previous step, None for the first step and at zero permeate pressure,
+        where the default starting point is exact
+        """
+        if self.previous is None or (
+            conditions.permeate_temperature is None and not conditions.permeate_pressure
+        ):
+            return None
+        return self.previous.permeate_composition
+
+    def advance(self, next_step: ProcessStep) -> None:
+        """
+        Makes the current step previous and starts the next step
+        :param next_step: ProcessStep with the state at the beginning of the next step
+        """
+        self.previous = self.current
+        self.current = next_step
+        self.step += 1
+
+
+@attr.s(auto_attribs=True)
+class _ProcessDefinition:
+    """
+    Permeances of a process, which are required by the process engines
+    :param isothermal: if True, the feed temperature is kept constant
+    :param initial_permeances: permeances of both components at the beginning of the process in kg/(m2*h*kPa)
+    :param get_permeances: function of the feed weight fraction of the first component and feed temperature,
+    floats or arrays, returning permeances of the components in kg/(m2*h*kPa);
+    None if the permeances are constant
+    :param lagged_permeances: if True, the euler engine evaluates the permeances of the next step
+    at the feed composition at the beginning of the current step
+    :param model_parameters: other parameters of the ProcessModel
+    """
+
+    isothermal: bool
+    initial_permeances: typing.Tuple[float, float]
+    get_permeances: typing.Optional[
+        typing.Callable[[typing.Any, typing.Any], typing.Tuple[typing.Any, typing.Any]]
+    ] = None
+    lagged_permeances: bool = False
+    model_parameters: typing.Dict[str, typing.Any] = attr.ib(factory=dict)
+
+
+@attr.s(auto_attribs=True)
+class ProcessState:
+    """
+    State of a stepwise process model stored in preallocated arrays, which are filled by the process engines
+    :param time: process time at the beginning of each step, hours
+    :param feed_composition: weight fraction of the first component in feed
+    :param feed_mass: feed mass, kg
+    :param feed_temperature: feed temperature, K
+    :param partial_fluxes: partial fluxes of both components in kg/(m2*h), array of shape (N, 2)
+    :param permeances: permeances of both components in kg/(m2*h*kPa), array of shape (N, 2)
+    :param permeate_composition: weight fraction of the first component in permeate
+    :param feed_evaporation_heat: heat of the feed evaporation during each step, kJ
+    :param permeate_condensation_heat: heat of the permeate condensation during each step, kJ,
+    NaN if the permeate temperature is not specified
+    :param iterations: number of iterations of the permeate composition at each step
+    :param length: number of the calculated steps
+    """
+
+    time: numpy.ndarray
+    feed_composition: numpy.ndarray
+    feed_mass: numpy.ndarray
+    feed_temperature: numpy.ndarray
+    partial_fluxes: numpy.ndarray
+    permeances: numpy.ndarray
+    permeate_composition: numpy.ndarray
+    feed_evaporation_heat: numpy.ndarray
+    permeate_condensation_heat: numpy.ndarray
+    iterations: numpy.ndarray
+    length: int = 0
+
+    @classmethod
+    def allocate(cls, number_of_steps: int) -> "ProcessState":
+        """
+        Allocates the arrays for a process model
+        :param number_of_steps: Number of time steps to include in the model
+        :return: ProcessState with no calculated steps
+        """
+        return cls(
+            time=numpy.empty(number_of_steps),
+            feed_composition=numpy.empty(number_of_steps),
+            feed_mass=numpy.empty(number_of_steps),
+            feed_temperature=numpy.empty(number_of_steps),
+            partial_fluxes=numpy.empty((number_of_steps, 2)),
+            permeances=numpy.empty((number_of_steps, 2)),
+            permeate_composition=numpy.empty(number_of_steps),
+            feed_evaporation_heat=numpy.empty(number_of_steps),
+            permeate_condensation_heat=numpy.full(number_of_steps, numpy.nan),
+            iterations=numpy.zeros(number_of_steps, dtype=int),
+        )
+
+    def set_step(self, step: int, process_step: ProcessStep) -> None:
+        """
+        :param step: index of the step
+        :param process_step: calculated ProcessStep
+        """
+        self.time[step] = process_step.time
+        self.feed_composition[step] = process_step.feed_composition
+        self.feed_mass[step] = process_step.feed_mass
+        self.feed_temperature[step] = process_step.feed_temperature
+        self.partial_fluxes[step] = process_step.partial_fluxes
+        self.permeances[step] = process_step.permeances
+        self.permeate_composition[step] = process_step.permeate_composition
+        self.feed_evaporation_heat[step] = process_step.feed_evaporation_heat
+        self.permeate_condensation_heat[step] = (
+            numpy.nan
+            if process_step.permeate_condensation_heat is None
+            else process_step.permeate_condensation_heat
+        )
+        self.iterations[step] = process_step.iterations
+
+    def append(self, process_step: ProcessStep) -> None:
+        """
+        Adds a calculated step after the last calculated step
+        :param process_step: calculated ProcessStep
+        """
+        self.set_step(self.length, process_step)
+        self.length += 1
+
+    def get_step(self, step: int, conditions: Conditions) -> ProcessStep:
+        """
+        :param step: index of the step
+        :param conditions: Conditions object, where initial conditions are specified
+        :return: ProcessStep with the state at the beginning of the step
+        """
+        return ProcessStep(
+            time=float(self.time[step]),
+            feed_composition=float(self.feed_composition[step]),
+            feed_mass=float(self.feed_mass[step]),
+            feed_temperature=float(self.feed_temperature[step]),
+            partial_fluxes=(
+                float(self.partial_fluxes[step, 0]),
+                float(self.partial_fluxes[step, 1]),
+            ),
+            permeances=(
+                float(self.permeances[step, 0]),
+                float(self.permeances[step, 1]),
+            ),
+            permeate_composition=float(self.permeate_composition[step]),
+            feed_evaporation_heat=float(self.feed_evaporation_heat[step]),
+            permeate_condensation_heat=(
+                None
+                if conditions.permeate_temperature is None
+                else float(self.permeate_condensation_heat[step])
+            ),
+            iterations=int(self.iterations[step]),
+        )
+
+    def to_process_model(
+        self,
+        mixture: Mixture,
+        membrane_name: str,
+        conditions: Conditions,
+        **kwargs,
+    ) -> ProcessModel:
+        """
+        Creates a ProcessModel from the calculated steps,
+        the arrays are passed to the model columns without creation of intermediate objects
+        :param mixture: Mixture
+        :param membrane_name: name of the membrane
+        :param conditions: Conditions object, where initial conditions are specified
+        :param kwargs: other parameters of the ProcessModel
+        :return: ProcessModel object
+        """
+        length = self.length
+        if conditions.permeate_temperature is None:
+            permeate_condensation_heat = [None] * length
+        else:
+            permeate_condensation_heat = list(self.permeate_condensation_heat[:length])
+        return ProcessModel(
+            mixture=mixture,
+            membrane_name=membrane_name,
+            feed_temperature=self.feed_temperature[:length].copy(),
+            feed_compositions=CompositionColumn(
+                values=self.feed_composition[:length], type=CompositionType.weight
+            ),
+            permeate_composition=CompositionColumn(
+                values=self.permeate_composition[:length], type=CompositionType.weight
+            ),
+            permeate_temperature=[conditions.permeate_temperature] * length,
+            permeate_pressure=[conditions.permeate_pressure] * length,
+            feed_mass=self.feed_mass[:length].copy(),
+            partial_fluxes=PartialFluxColumn(values=self.partial_fluxes[:length]),
+            permeances=PermeanceColumn(
+                values=self.permeances[:length], units=Units.kg_m2_h_kPa
+            ),
+            time=self.time[:length].copy(),
+            feed_evaporation_heat=self.feed_evaporation_heat[:length].copy(),
+            permeate_condensation_heat=permeate_condensation_heat,
+            initial_conditions=conditions,
+            solver_iterations=self.iterations[:length].copy(),
+            **kwargs,
+        )
+
+
+_PROCESS_STATE_ARRAYS = [
+    field.name for field in attr.fields(ProcessState) if field.name != "length"
+]
+
+
+def _process_step_from_dict(values: typing.Dict[str, typing.Any]) -> ProcessStep:
+    """
+    :param values: ProcessStep converted to a dict, where the tuples are replaced by lists
+    :return: ProcessStep
+    """
+    return ProcessStep(
+        **{
+            **values,
+            "partial_fluxes": tuple(values["partial_fluxes"]),
+            "permeances": tuple(values["permeances"]),
+        }
+    )
+
+
+@attr.s(auto_attribs=True)
+class ProcessCheckpoint:
+    """
+    State of the euler engine of non_ideal_non_isothermal_process before a step,
+    which is sufficient to continue the process exactly as if it was not interrupted
+    :param step: index of the next step
+    :param state: ProcessState with the final steps, all the steps before the previous step
+    :param previous: the last calculated step, None before the first step
+    :param current: the next step, only the state at its beginning is known
+    :param conditions: Initial Conditions of the Process
+    :param number_of_steps: Number of time steps for modelling
+    :param delta_hours: Size of each step in hours
+    :param precision: Precision in obtained permeate composition
+    :param permeance_fits: PervaporationFunctions of both components
+    :param facilitation_rates: ratios of the initial permeances to the values of the PervaporationFunctions
+    :param stop_conditions: Conditions, that terminate the process, if not specified StopConditions of the conditions
+    are used
+    :param checkpoint_every: number of steps between the checkpoints
+    """
+
+    step: int
+    state: ProcessState
+    previous: typing.Optional[ProcessStep]
+    current: ProcessStep
+    conditions: Conditions
+    number_of_steps: int
+    delta_hours: float
+    precision: typing.Optional[float]
+    permeance_fits: typing.Tuple[PervaporationFunction, PervaporationFunction]
+    facilitation_rates: typing.Tuple[float, float]
+    stop_conditions: typing.Optional[StopConditions] = None
+    checkpoint_every: int = 1000
+
+    def save(self, path: typing.Union[str, Path]) -> None:
+        """
+        Saves the checkpoint to a .npz file, the file is replaced only when the checkpoint is completely written
+        :param path: path to the file
+        """
+        path = Path(path)
+        metadata = {
+            "step": self.step,
+            "previous": None if self.previous is None else attr.asdict(self.previous),
+            "current": attr.asdict(self.current),
+            "conditions": self.conditions.to_dict(),
+            "number_of_steps": self.number_of_steps,
+            "delta_hours": self.delta_hours,
+            "precision": self.precision,
+            "stop_conditions": (
+                None if self.stop_conditions is None else self.stop_conditions.to_dict()
+            ),
+            "checkpoint_every": self.checkpoint_every,
+            "n": [function.n for function in self.permeance_fits],
+            "m": [function.m for function in self.permeance_fits],
+        }
+        temporary_path = path.with_name(path.name + ".tmp.npz")
+        numpy.savez(
+            temporary_path,
+            metadata=numpy.array(json.dumps(metadata)),
+            **{
+                name: getattr(self.state, name)[: self.state.length]
+                for name in _PROCESS_STATE_ARRAYS
+            },
+            function_first=self.permeance_fits[0].to_array(),
+            function_second=self.permeance_fits[1].to_array(),
+            facilitation_rates=numpy.array(self.facilitation_rates, dtype=float),
+        )
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: typing.Union[str, Path]) -> "ProcessCheckpoint":
+        """
+        Reads a checkpoint from a .npz file
+        :param path: path to the file
+        :return: ProcessCheckpoint with the state allocated for all the steps of the process
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError("Checkpoint %s does not exist" % path)
+        with numpy.load(path, allow_pickle=False) as data:
+            metadata = json.loads(str(data["metadata"]))
+            state = ProcessState.allocate(metadata["number_of_steps"])
+            for name in _PROCESS_STATE_ARRAYS:
+                getattr(state, name)[: len(data[name])] = data[name]
+            state.length = len(data["time"])
+            permeance_fits = (
+                PervaporationFunction.from_array(
+                    data["function_first"], n=metadata["n"][0], m=metadata["m"][0]
+                ),
+                PervaporationFunction.from_array(
+                    data["function_second"], n=metadata["n"][1], m=metadata["m"][1]
+                ),
+            )
+            facilitation_rates = tuple(
+                float(rate) for rate in data["facilitation_rates"]
+            )
+        return cls(
+            step=metadata["step"],
+            state=state,
+            previous=(
+                None
+                if metadata["previous"] is None
+                else _process_step_from_dict(metadata["previous"])
+            ),
+            current=_process_step_from_dict(metadata["current"]),
+            conditions=Conditions.from_dict(metadata["conditions"]),
+            number_of_steps=metadata["number_of_steps"],
+            delta_hours=metadata["delta_hours"],
+            precision=metadata["precision"],
+            permeance_fits=permeance_fits,
+            facilitation_rates=facilitation_rates,
+            stop_conditions=(
+                None
+                if metadata["stop_conditions"] is None
+                else StopConditions.from_dict(metadata["stop_conditions"])
+            ),
+            checkpoint_every=metadata["checkpoint_every"],
+        )
+
+
+@attr.s(auto_attribs=True, eq=False)
+class ProcessEnsemble(typing.Sequence[ProcessModel]):
+    """
+    Results of the modelling of a batch of processes advanced in lockstep:
+    a ProcessModel for each member and the stacked state arrays of shape (number of members, number of steps);
+    The steps after the termination of a member by its stop conditions are filled with NaN
+    :param models: ProcessModel of each member
+    :param time: process time at the beginning of each step, hours
+    :param feed_composition: weight fraction of the first component in feed
+    :param feed_mass: feed mass, kg
+    :param feed_temperature: feed temperature, K
+    :param partial_fluxes: partial fluxes of both components in kg/(m2*h),
+    array of shape (number of members, number of steps, 2)
+    :param permeate_composition: weight fraction of the first component in permeate
+    :param lengths: number of the calculated steps of each member
+    """
+
+    models: typing.List[ProcessModel]
+    time: numpy.ndarray
+    feed_composition: numpy.ndarray
+    feed_mass: numpy.ndarray
+    feed_temperature: numpy.ndarray
+    partial_fluxes: numpy.ndarray
+    permeate_composition: numpy.ndarray
+    lengths: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def __getitem__(self, item):
+        return self.models[item]
+
+
 @attr.s(auto_attribs=True)
 class Pervaporation:
     membrane: Membrane
     mixture: Mixture
+    fit_cache: FitCache = attr.ib(factory=FitCache, repr=False, eq=False)
 
     def get_partial_fluxes_from_permeate_composition(
         self,
@@ -89,6 +701,9 @@ class Pervaporation:
         permeate_pressure: typing.Optional[float] = None,
         first_component_permeance: typing.Optional[Permeance] = None,
         second_component_permeance: typing.Optional[Permeance] = None,
+        method: str = SolverMethod.substitution,
+        max_iterations: int = 1000,
+        initial_permeate_composition: typing.Optional[Composition] = None,
     ) -> typing.Tuple[float, float]:
         """
         Calculates partial fluxes of the test_components at specified conditions.
@@ -100,6 +715,13 @@ class Pervaporation:
         :param permeate_pressure - permeate pressure, kPa , if not specified permeate pressure is considered 0 kPa
         :param first_component_permeance: Permeance of the first test_components, if not specified is calculated
         :param second_component_permeance: Permeance of the second test_components, if not specified is calculated
+        :param method: Method of the permeate composition calculation:
+        SolverMethod.substitution - successive substitution of the permeate composition (default),
+        SolverMethod.newton - Newton iterations on [0, 1] with a Brent fallback
+        :param max_iterations: Maximum number of iterations, ValueError is raised if exceeded
+        :param initial_permeate_composition: Starting point of the permeate composition iterations,
+        e.g. the permeate composition at close conditions;
+        if not specified the permeate composition at zero permeate pressure is used
         :return: Partial fluxes of test_components as a tuple
         """
         if second_component_permeance is None or first_component_permeance is None:
@@ -114,45 +736,299 @@ class Pervaporation:
                 to_units=Units().kg_m2_h_kPa, component=self.mixture.second_component
             )
 
-        initial_fluxes: typing.Tuple[float, float] = numpy.multiply(
-            (first_component_permeance.value, second_component_permeance.value),
-            get_nrtl_partial_pressures(feed_temperature, self.mixture, composition),
-        )
-        permeate_composition = get_permeate_composition_from_fluxes(initial_fluxes)
-
-        d = 1
-        while d >= precision:
-            try:
-                permeate_composition_new = get_permeate_composition_from_fluxes(
-                    self.get_partial_fluxes_from_permeate_composition(
-                        first_component_permeance=first_component_permeance,
-                        second_component_permeance=second_component_permeance,
-                        permeate_composition=permeate_composition,
-                        feed_composition=composition,
-                        feed_temperature=feed_temperature,
-                        permeate_temperature=permeate_temperature,
-                        permeate_pressure=permeate_pressure,
-                    )
-                )
-                d = max(
-                    abs(permeate_composition_new.first - permeate_composition.first),
-                    abs(permeate_composition_new.second - permeate_composition.second),
+        partial_fluxes, _ = self._calculate_partial_fluxes(
+            feed_temperature=feed_temperature,
+            composition=composition.to_weight(self.mixture).p,
+            first_component_permeance=first_component_permeance.value,
+            second_component_permeance=second_component_permeance.value,
+            precision=precision,
+            permeate_temperature=permeate_temperature,
+            permeate_pressure=permeate_pressure,
+            method=method,
+            max_iterations=max_iterations,
+            initial_guess=(
+                initial_permeate_composition.to_weight(self.mixture).p
+                if initial_permeate_composition is not None
+                else None
+            ),
+        )
+        return partial_fluxes
+
+    def _calculate_partial_fluxes(
+        self,
+        feed_temperature: float,
+        composition: float,
+        first_component_permeance: float,
+        second_component_permeance: float,
+        precision: float,
+        permeate_temperature: typing.Optional[float] = None,
+        permeate_pressure: typing.Optional[float] = None,
+        method: str = SolverMethod.substitution,
+        max_iterations: int = 1000,
+        initial_guess: typing.Optional[float] = None,
+    ) -> typing.Tuple[typing.Tuple[float, float], int]:
+        """
+        Calculates partial fluxes of the components, see calculate_partial_fluxes;
+        The state is passed as plain floats, so that the process engines do not create objects at each step
+        :param feed_temperature: Feed temperature, K
+        :param composition: Weight fraction of the first component in feed
+        :param first_component_permeance: Permeance of the first component in kg/(m2*h*kPa)
+        :param second_component_permeance: Permeance of the second component in kg/(m2*h*kPa)
+        :param initial_guess: Starting weight fraction of the first component in permeate,
+        if not specified the permeate composition at zero permeate pressure is used
+        :return: Partial fluxes of the components as a tuple and the number of iterations
+        of the permeate composition
+        """
+        if permeate_temperature is not None and permeate_pressure is not None:
+            raise ValueError(
+                "Either permeate temperature or permeate pressure could be stated not both"
+            )
+
+        feed_nrtl_partial_pressures = get_nrtl_partial_pressures(
+            feed_temperature,
+            self.mixture,
+            Composition(p=composition, type=CompositionType.weight),
+        )
+
+        def get_fluxes(p: float) -> typing.Tuple[float, float]:
+            if permeate_temperature is not None:
+                permeate_nrtl_partial_pressures = get_nrtl_partial_pressures(
+                    permeate_temperature,
+                    self.mixture,
+                    Composition(p=p, type=CompositionType.weight),
                 )
-            except ():
-                raise ValueError(
-                    "Partial fluxes are not defined in the stated conditions range"
+            elif permeate_pressure is not None:
+                permeate_nrtl_partial_pressures = (
+                    permeate_pressure * p,
+                    permeate_pressure * (1 - p),
                 )
             else:
+                permeate_nrtl_partial_pressures = (0, 0)
+            return (
+                first_component_permeance
+                * (feed_nrtl_partial_pressures[0] - permeate_nrtl_partial_pressures[0]),
+                second_component_permeance
+                * (feed_nrtl_partial_pressures[1] - permeate_nrtl_partial_pressures[1]),
+            )
+
+        initial_fluxes = (
+            first_component_permeance * feed_nrtl_partial_pressures[0],
+            second_component_permeance * feed_nrtl_partial_pressures[1],
+        )
+        permeate_composition = initial_fluxes[0] / sum(initial_fluxes)
+        if initial_guess is not None and 0 <= initial_guess <= 1:
+            permeate_composition = initial_guess
+
+        if method == SolverMethod.newton:
+
+            def residual(p: float) -> float:
+                fluxes = get_fluxes(p)
+                # Where one of the fluxes is reversed the permeate fraction is projected on [0, 1]
+                if fluxes[0] <= 0:
+                    return -p
+                if fluxes[1] <= 0:
+                    return 1 - p
+                return fluxes[0] / sum(fluxes) - p
+
+            permeate_composition, iteration = _find_root_newton_brent(
+                residual,
+                initial_guess=permeate_composition,
+                precision=precision,
+                max_iterations=max_iterations,
+            )
+        elif method == SolverMethod.substitution:
+            d = 1
+            iteration = 0
+            while d >= precision:
+                if iteration >= max_iterations:
+                    raise ValueError(
+                        "Permeate composition calculation did not converge in %s iterations"
+                        % max_iterations
+                    )
+                iteration += 1
+                fluxes = get_fluxes(permeate_composition)
+                permeate_composition_new = fluxes[0] / sum(fluxes)
+                if not 0 <= permeate_composition_new <= 1:
+                    raise ValueError(
+                        "Partial fluxes are not defined in the stated conditions range"
+                    )
+                d = abs(permeate_composition_new - permeate_composition)
                 permeate_composition = permeate_composition_new
+        else:
+            raise ValueError("Method %s is not supported" % method)
 
-        return self.get_partial_fluxes_from_permeate_composition(
-            first_component_permeance=first_component_permeance,
-            second_component_permeance=second_component_permeance,
-            permeate_composition=permeate_composition,
-            feed_composition=composition,
-            feed_temperature=feed_temperature,
-            permeate_temperature=permeate_temperature,
-            permeate_pressure=permeate_pressure,
+        return get_fluxes(permeate_composition), iteration
+
+    def calculate_partial_fluxes_batch(
+        self,
+        feed_temperature: typing.Union[float, numpy.ndarray],
+        composition: typing.Union[float, numpy.ndarray],
+        composition_type: str = CompositionType.weight,
+        precision: float = 3e-4,
+        permeate_temperature: typing.Optional[
+            typing.Union[float, numpy.ndarray]
+        ] = None,
+        permeate_pressure: typing.Optional[typing.Union[float, numpy.ndarray]] = None,
+        first_component_permeance: typing.Optional[numpy.ndarray] = None,
+        second_component_permeance: typing.Optional[numpy.ndarray] = None,
+        max_iterations: int = 1000,
+    ) -> PartialFluxesBatch:
+        """
+        Vectorized version of calculate_partial_fluxes, solves all the points in a single array pass.
+        Either permeate temperature or permeate pressure could be stated for each point
+        :param feed_temperature: Feed temperatures, K, an array or a scalar broadcast over all the points
+        :param composition: Fractions of the first component in feed
+        :param composition_type: Type of the stated feed fractions, weight by default
+        :param precision: Precision in obtained permeate composition, by default is 3e-4
+        :param permeate_temperature: Permeate temperature, if not specified permeate pressure is set to 0 kPa;
+        an array may be stated, where NaN values mark the points with no permeate temperature
+        :param permeate_pressure - permeate pressure, kPa , if not specified permeate pressure is considered 0 kPa;
+        an array may be stated, where NaN values mark the points with no permeate pressure
+        :param first_component_permeance: Permeances of the first component in kg/(m2*h*kPa),
+        if not specified are calculated
+        :param second_component_permeance: Permeances of the second component in kg/(m2*h*kPa),
+        if not specified are calculated
+        :param max_iterations: Maximum number of iterations of the permeate composition
+        :return: PartialFluxesBatch object, points which did not converge are marked in .converged
+        and hold the last iterate of the permeate composition
+        """
+        feed_temperature, composition, permeate_temperature, permeate_pressure = (
+            numpy.broadcast_arrays(
+                numpy.asarray(feed_temperature, dtype=float),
+                numpy.atleast_1d(numpy.asarray(composition, dtype=float)),
+                numpy.asarray(
+                    numpy.nan if permeate_temperature is None else permeate_temperature,
+                    dtype=float,
+                ),
+                numpy.asarray(
+                    numpy.nan if permeate_pressure is None else permeate_pressure,
+                    dtype=float,
+                ),
+            )
+        )
+        by_temperature = numpy.isfinite(permeate_temperature)
+        by_pressure = numpy.isfinite(permeate_pressure)
+        if numpy.any(by_temperature & by_pressure):
+            raise ValueError(
+                "Either permeate temperature or permeate pressure could be stated not both"
+            )
+        if numpy.any((composition < 0) | (composition > 1)):
+            raise ValueError("Feed composition is not in [0, 1] range")
+
+        if second_component_permeance is None or first_component_permeance is None:
+            first_component_permeance = self.membrane.get_permeance_array(
+                feed_temperature, self.mixture.first_component
+            )
+            second_component_permeance = self.membrane.get_permeance_array(
+                feed_temperature, self.mixture.second_component
+            )
+        permeances = numpy.stack(
+            (
+                numpy.broadcast_to(first_component_permeance, composition.shape),
+                numpy.broadcast_to(second_component_permeance, composition.shape),
+            ),
+            axis=-1,
+        ).astype(float)
+
+        if composition_type == CompositionType.weight:
+            molar_composition = to_molar_fraction(composition, self.mixture)
+        else:
+            molar_composition = composition
+
+        feed_partial_pressures = numpy.stack(
+            get_nrtl_partial_pressures_array(
+                feed_temperature, self.mixture, molar_composition
+            ),
+            axis=-1,
+        )
+
+        def get_fluxes(
+            permeate_composition: numpy.ndarray, index: numpy.ndarray
+        ) -> numpy.ndarray:
+            permeate_partial_pressures = numpy.zeros((len(index), 2))
+            pressure_index = by_pressure[index]
+            if pressure_index.any():
+                p = permeate_composition[pressure_index]
+                permeate_partial_pressures[pressure_index] = permeate_pressure[index][
+                    pressure_index, None
+                ] * numpy.stack((p, 1 - p), axis=-1)
+            temperature_index = by_temperature[index]
+            if temperature_index.any():
+                permeate_partial_pressures[temperature_index] = numpy.stack(
+                    get_nrtl_partial_pressures_array(
+                        permeate_temperature[index][temperature_index],
+                        self.mixture,
+                        to_molar_fraction(
+                            permeate_composition[temperature_index], self.mixture
+                        ),
+                    ),
+                    axis=-1,
+                )
+            return permeances[index] * (
+                feed_partial_pressures[index] - permeate_partial_pressures
+            )
+
+        def residual(
+            permeate_composition: numpy.ndarray, index: numpy.ndarray
+        ) -> numpy.ndarray:
+            fluxes = get_fluxes(permeate_composition, index)
+            # Where one of the fluxes is reversed the permeate fraction is projected on [0, 1]
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                return (
+                    numpy.where(
+                        fluxes[:, 0] <= 0,
+                        0.0,
+                        numpy.where(
+                            fluxes[:, 1] <= 0, 1.0, fluxes[:, 0] / fluxes.sum(axis=1)
+                        ),
+                    )
+                    - permeate_composition
+                )
+
+        index = numpy.arange(len(composition))
+        partial_fluxes = permeances * feed_partial_pressures
+        permeate_composition = partial_fluxes[:, 0] / partial_fluxes.sum(axis=1)
+        converged = numpy.zeros(len(composition), dtype=bool)
+        iterations = numpy.zeros(len(composition), dtype=int)
+        failed = ~numpy.isfinite(permeate_composition)
+        lower = numpy.zeros(len(composition))
+        upper = numpy.ones(len(composition))
+
+        # Newton iterations safeguarded by bisection of the bracket of each point
+        for _ in range(max_iterations):
+            active = index[~converged & ~failed]
+            if len(active) == 0:
+                break
+            x = permeate_composition[active]
+            r = residual(x, active)
+            iterations[active] += 1
+            lower[active] = numpy.where(r > 0, x, lower[active])
+            upper[active] = numpy.where(r > 0, upper[active], x)
+
+            step = numpy.where(x + 1e-7 <= 1, 1e-7, -1e-7)
+            derivative = (residual(x + step, active) - r) / step
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                x_new = x - r / derivative
+            bisection = ~(
+                numpy.isfinite(x_new)
+                & (x_new >= lower[active])
+                & (x_new <= upper[active])
+            )
+            x_new[bisection] = (lower[active] + upper[active])[bisection] / 2
+            permeate_composition[active] = x_new
+            # As in calculate_partial_fluxes, the change of the permeate composition is compared to the precision
+            converged[active[numpy.abs(x_new - x) < precision]] = True
+
+        valid = index[~failed]
+        if len(valid) > 0:
+            partial_fluxes[valid] = get_fluxes(permeate_composition[valid], valid)
+        partial_fluxes[failed] = numpy.nan
+
+        return PartialFluxesBatch(
+            partial_fluxes=partial_fluxes,
+            permeate_composition=partial_fluxes[:, 0] / partial_fluxes.sum(axis=1),
+            converged=converged,
+            iterations=iterations,
         )
 
     def calculate_permeate_composition(
@@ -224,6 +1100,17 @@ class Pervaporation:
         :param precision: Precision in obtained permeate composition, by default is 5e-5
         :return: A DiffusionCurve Object
         """
+        batch = self.calculate_partial_fluxes_batch(
+            feed_temperature=feed_temperature,
+            composition=numpy.array(
+                [composition.to_weight(self.mixture).p for composition in compositions]
+            ),
+            composition_type=CompositionType.weight,
+            precision=precision,
+            permeate_temperature=permeate_temperature,
+            permeate_pressure=permeate_pressure,
+        )
+
         return DiffusionCurve(
             mixture=self.mixture,
             membrane_name=self.membrane.name,
@@ -231,16 +1118,7 @@ class Pervaporation:
             permeate_temperature=permeate_temperature,
             permeate_pressure=permeate_pressure,
             feed_compositions=compositions,
-            partial_fluxes=[
-                self.calculate_partial_fluxes(
-                    feed_temperature,
-                    composition,
-                    precision,
-                    permeate_temperature,
-                    permeate_pressure,
-                )
-                for composition in compositions
-            ],
+            partial_fluxes=[tuple(fluxes) for fluxes in batch.partial_fluxes],
             comments=(
                 str(self.membrane.name)
                 + " "
@@ -252,352 +1130,1236 @@ class Pervaporation:
             ),
         )
 
-    def ideal_isothermal_process(
+    def _get_rayleigh_trajectory(
         self,
-        number_of_steps: int,
-        delta_hours: float,
+        time: numpy.ndarray,
         conditions: Conditions,
-        precision: typing.Optional[float] = 5e-5,
-    ) -> ProcessModel:
+        first_component_permeance: float,
+        second_component_permeance: float,
+        precision: float,
+        number_of_nodes: int,
+    ) -> typing.Tuple[numpy.ndarray, numpy.ndarray]:
         """
-        Models mass and heat balance of an Ideal (constant Permeance) Isothermal Pervaporation Process
-        :param number_of_steps: Number of time steps to include in the model
-        :param delta_hours: The duration of each step in hours
-        :param conditions: Conditions object, where initial conditions are specified
-        :param precision: Precision in obtained permeate composition, by default is 5e-5
-        :return: A ProcessModel Object
+        Calculates feed composition and mass of an isothermal batch process with constant permeances.
+        Since partial fluxes depend only on the feed composition w, the mass balance reduces to quadratures:
+        ln(M/M0) = integral dw / (y - w) and t = - integral M dw / (A * J * (y - w)),
+        where y is the permeate composition and J is the total flux.
+        The quadratures are evaluated on a grid geometrically approaching the composition limit of the process,
+        and the state is interpolated at the requested time points.
+        :param time: time points in hours
+        :param conditions: Conditions of the process
+        :param first_component_permeance: Permeance of the first component in kg/(m2*h*kPa)
+        :param second_component_permeance: Permeance of the second component in kg/(m2*h*kPa)
+        :param precision: Precision in obtained permeate composition
+        :param number_of_nodes: Number of composition nodes of the quadrature
+        :return: weight fractions of the first component in feed and feed masses at each time point
         """
+        initial_composition = conditions.initial_feed_composition.to_weight(
+            self.mixture
+        ).p
+        initial_mass = conditions.initial_feed_amount
+        time = numpy.asarray(time, dtype=float)
+
+        def solve(composition: numpy.ndarray) -> PartialFluxesBatch:
+            return self.calculate_partial_fluxes_batch(
+                feed_temperature=conditions.initial_feed_temperature,
+                composition=composition,
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=first_component_permeance,
+                second_component_permeance=second_component_permeance,
+            )
+
+        initial = solve(numpy.array([initial_composition]))
+        if not initial.converged.all():
+            raise ValueError(
+                "Partial fluxes are not defined in the stated conditions range"
+            )
+        initial_difference = initial.permeate_composition[0] - initial_composition
 
-        time: typing.List[float] = [
-            delta_hours * step for step in range(number_of_steps)
-        ]
+        if abs(initial_difference) < precision:
+            total_flux = initial.partial_fluxes[0].sum()
+            return (
+                numpy.full(len(time), initial_composition),
+                initial_mass - conditions.membrane_area * total_flux * time,
+            )
 
-        partial_fluxes: typing.List[typing.Tuple[float, float]] = []
+        boundary = 0.0 if initial_difference > 0 else 1.0
+        log_distance = numpy.linspace(0, numpy.log(1e-12), number_of_nodes)
+        composition = boundary + (initial_composition - boundary) * numpy.exp(
+            log_distance
+        )
+        batch = solve(composition)
+        difference = batch.permeate_composition - composition
 
-        first_component_permeance = self.membrane.get_permeance(
-            conditions.initial_feed_temperature, self.mixture.first_component
+        valid = batch.converged & (
+            numpy.sign(difference) == numpy.sign(initial_difference)
         )
-        second_component_permeance = self.membrane.get_permeance(
-            conditions.initial_feed_temperature, self.mixture.second_component
+        last = len(composition) if valid.all() else numpy.argmin(valid)
+        log_distance = log_distance[:last]
+        composition = composition[:last]
+        difference = difference[:last]
+        total_flux = batch.partial_fluxes[:last].sum(axis=1)
+
+        log_mass = integrate.cumulative_trapezoid(
+            (composition - boundary) / difference, log_distance, initial=0
+        )
+        mass = initial_mass * numpy.exp(log_mass)
+        process_time = integrate.cumulative_trapezoid(
+            -mass
+            * (composition - boundary)
+            / (conditions.membrane_area * total_flux * difference),
+            log_distance,
+            initial=0,
         )
-        permeances: typing.List[typing.Tuple[Permeance, Permeance]] = [
-            (
-                first_component_permeance,
-                second_component_permeance,
-            )
-        ] * number_of_steps
-
-        permeate_composition: typing.List[Composition] = []
-        feed_composition: typing.List[Composition] = [
-            conditions.initial_feed_composition.to_weight(self.mixture)
-        ]
 
-        feed_evaporation_heat: typing.List[float] = []
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
-        feed_mass: typing.List[float] = [conditions.initial_feed_amount]
+        increasing = numpy.concatenate(([True], numpy.diff(process_time) > 0))
+        process_time = process_time[increasing]
+        log_distance = log_distance[increasing]
+        log_mass = log_mass[increasing]
 
-        evaporation_heat_1 = (
-            self.mixture.first_component.get_vaporisation_heat(
-                conditions.initial_feed_temperature
+        if len(process_time) < 2 or time.max() > process_time[-1]:
+            raise ValueError(
+                "The process could not be modelled beyond %s hours, the feed is exhausted"
+                % process_time[-1]
             )
-            / self.mixture.first_component.molecular_weight
-            * 1000
+
+        feed_composition = boundary + (initial_composition - boundary) * numpy.exp(
+            interpolate.PchipInterpolator(process_time, log_distance)(time)
         )
-        evaporation_heat_2 = (
-            self.mixture.second_component.get_vaporisation_heat(
-                conditions.initial_feed_temperature
-            )
-            / self.mixture.first_component.molecular_weight
-            * 1000
+        feed_mass = initial_mass * numpy.exp(
+            interpolate.PchipInterpolator(process_time, log_mass)(time)
         )
-        if conditions.permeate_temperature is None:
-            condensation_heat_1 = None
-            condensation_heat_2 = None
-            cooling_heat_1 = None
-            cooling_heat_2 = None
+        return feed_composition, feed_mass
 
-        else:
-            condensation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    conditions.permeate_temperature
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            condensation_heat_2 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    conditions.permeate_temperature
+    def _get_stop_functions(
+        self,
+        conditions: Conditions,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ) -> typing.List[typing.Callable[[float, float, float, float], float]]:
+        """
+        Converts StopConditions to functions of process time, feed weight fraction of the first component,
+        feed mass and total flux, which are positive until the corresponding condition is reached
+        :param conditions: Conditions object, where initial conditions are specified
+        :param stop_conditions: StopConditions object, if not specified StopConditions of conditions are used
+        :return: list of the functions
+        """
+        if stop_conditions is None:
+            stop_conditions = conditions.stop_conditions
+        if stop_conditions is None:
+            return []
+
+        stop_functions = []
+        if stop_conditions.target_feed_composition is not None:
+            target_composition = stop_conditions.target_feed_composition.to_weight(
+                self.mixture
+            ).p
+            direction = (
+                1.0
+                if conditions.initial_feed_composition.to_weight(self.mixture).p
+                >= target_composition
+                else -1.0
+            )
+            stop_functions.append(
+                lambda t, composition, mass, flux: direction
+                * (composition - target_composition)
+            )
+        if stop_conditions.minimum_feed_mass is not None:
+            stop_functions.append(
+                lambda t, composition, mass, flux: mass
+                - stop_conditions.minimum_feed_mass
+            )
+        if stop_conditions.maximum_time is not None:
+            stop_functions.append(
+                lambda t, composition, mass, flux: stop_conditions.maximum_time - t
+            )
+        if stop_conditions.minimum_total_flux is not None:
+            stop_functions.append(
+                lambda t, composition, mass, flux: flux
+                - stop_conditions.minimum_total_flux
+            )
+        return stop_functions
+
+    @staticmethod
+    def _locate_stop(
+        stop_functions: typing.Sequence[
+            typing.Callable[[float, float, float, float], float]
+        ],
+        previous_state: typing.Tuple[float, float, float, float],
+        state: typing.Tuple[float, float, float, float],
+    ) -> typing.Optional[float]:
+        """
+        Locates the point within a process step, where any of the stop conditions is reached;
+        The masses and the total flux are considered to change linearly within the step
+        :param stop_functions: functions of process time, feed composition, feed mass and total flux
+        :param previous_state: process time, mass of the first component, feed mass and total flux
+        at the beginning of the step
+        :param state: process time, mass of the first component, feed mass and total flux at the end of the step
+        :return: fraction of the step, where the process is stopped, None if no condition is reached
+        """
+
+        def get_stop_value(
+            stop_function: typing.Callable[[float, float, float, float], float],
+            fraction: float,
+        ) -> float:
+            t, first_mass, mass, flux = (
+                previous + fraction * (current - previous)
+                for previous, current in zip(previous_state, state)
+            )
+            return stop_function(t, first_mass / mass, mass, flux)
+
+        fractions = []
+        for stop_function in stop_functions:
+            if get_stop_value(stop_function, 1.0) > 0:
+                continue
+            if get_stop_value(stop_function, 0.0) <= 0:
+                fractions.append(0.0)
+            else:
+                fractions.append(
+                    optimize.brentq(
+                        lambda fraction: get_stop_value(stop_function, fraction),
+                        0.0,
+                        1.0,
+                    )
                 )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            cooling_heat_1 = self.mixture.first_component.get_cooling_heat(
-                conditions.permeate_temperature, conditions.initial_feed_temperature
-            )
-            cooling_heat_2 = self.mixture.second_component.get_cooling_heat(
-                conditions.permeate_temperature, conditions.initial_feed_temperature
-            )
+        return min(fractions) if fractions else None
 
-        for step in range(len(time)):
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=conditions.initial_feed_temperature,
-                    composition=feed_composition[step],
+    def _integrate_process(
+        self,
+        conditions: Conditions,
+        time: numpy.ndarray,
+        get_permeances: typing.Callable[[float, float], typing.Tuple[float, float]],
+        isothermal: bool,
+        precision: float,
+        rtol: float,
+        atol: float,
+        stop_functions: typing.Sequence[
+            typing.Callable[[float, float, float, float], float]
+        ] = (),
+    ) -> typing.Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Integrates mass and heat balances of a batch Pervaporation process
+        with an adaptive step Runge-Kutta method.
+        The state consists of the masses of both components in the feed and the feed temperature;
+        The feed temperature is constant for an isothermal process,
+        follows the TemperatureProgram if it is specified, otherwise the process is self-cooling
+        :param conditions: Conditions object, where initial conditions are specified
+        :param time: Time points in hours, where the state should be evaluated
+        :param get_permeances: function of the feed weight fraction of the first component and feed temperature,
+        returning permeances of the components in kg/(m2*h*kPa)
+        :param isothermal: if True, the feed temperature is kept constant
+        :param precision: Precision in obtained permeate composition
+        :param rtol: relative tolerance of the integrator
+        :param atol: absolute tolerance of the integrator
+        :param stop_functions: functions of process time, feed composition, feed mass and total flux,
+        the integration is terminated, when any of them reaches zero
+        :return: time points, weight fractions of the first component in feed, feed masses and feed temperatures;
+        If the integration is terminated, the time points before termination are followed
+        by the termination point, which is repeated twice
+        """
+        initial_composition = conditions.initial_feed_composition.to_weight(
+            self.mixture
+        ).p
+        time = numpy.asarray(time, dtype=float)
+        calculated_fluxes: typing.Dict[
+            typing.Tuple[float, ...], typing.Tuple[float, float]
+        ] = {}
+
+        def get_state(
+            t: float, state: numpy.ndarray
+        ) -> typing.Tuple[float, float, float]:
+            feed_mass = state[0] + state[1]
+            composition = min(max(state[0] / feed_mass, 0.0), 1.0)
+            if isothermal:
+                temperature = conditions.initial_feed_temperature
+            elif conditions.temperature_program is not None:
+                temperature = conditions.temperature_program.program(t)
+            else:
+                temperature = state[2]
+            return composition, feed_mass, temperature
+
+        def get_partial_fluxes(
+            t: float, state: numpy.ndarray
+        ) -> typing.Tuple[float, float]:
+            key = (t, *state)
+            if key not in calculated_fluxes:
+                composition, _, temperature = get_state(t, state)
+                first_component_permeance, second_component_permeance = get_permeances(
+                    composition, temperature
+                )
+                # The permeate composition of the previous evaluation is the starting point of the iterations
+                initial_guess = None
+                if calculated_fluxes and (
+                    conditions.permeate_temperature is not None
+                    or conditions.permeate_pressure
+                ):
+                    previous_fluxes = next(iter(calculated_fluxes.values()))
+                    initial_guess = previous_fluxes[0] / sum(previous_fluxes)
+                calculated_fluxes.clear()
+                calculated_fluxes[key], _ = self._calculate_partial_fluxes(
+                    feed_temperature=temperature,
+                    composition=composition,
                     precision=precision,
                     permeate_temperature=conditions.permeate_temperature,
                     permeate_pressure=conditions.permeate_pressure,
                     first_component_permeance=first_component_permeance,
                     second_component_permeance=second_component_permeance,
+                    initial_guess=initial_guess,
                 )
-            )
-
-            permeate_composition.append(
-                Composition(
-                    p=partial_fluxes[step][0] / (sum(partial_fluxes[step])),
-                    type=CompositionType.weight,
-                )
-            )
+            return calculated_fluxes[key]
 
-            d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
-            d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
+        def balance(t: float, state: numpy.ndarray) -> numpy.ndarray:
+            composition, feed_mass, temperature = get_state(t, state)
+            partial_fluxes = get_partial_fluxes(t, state)
+            d_mass_1 = -partial_fluxes[0] * conditions.membrane_area
+            d_mass_2 = -partial_fluxes[1] * conditions.membrane_area
 
-            feed_evaporation_heat.append(
-                evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
-            )
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
+            if isothermal or conditions.temperature_program is not None:
+                d_temperature = 0.0
             else:
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (cooling_heat_1 * d_mass_1 + cooling_heat_2 * d_mass_2)
-                    * (
-                        conditions.initial_feed_temperature
-                        - conditions.permeate_temperature
-                    )
+                evaporation_heat_1 = (
+                    self.mixture.first_component.get_vaporisation_heat(temperature)
+                    / self.mixture.first_component.molecular_weight
+                    * 1000
+                )
+                evaporation_heat_2 = (
+                    self.mixture.second_component.get_vaporisation_heat(temperature)
+                    / self.mixture.second_component.molecular_weight
+                    * 1000
+                )
+                feed_heat_capacity = composition * (
+                    self.mixture.first_component.get_specific_heat(temperature)
+                    / self.mixture.first_component.molecular_weight
+                ) + (1 - composition) * (
+                    self.mixture.second_component.get_specific_heat(temperature)
+                    / self.mixture.second_component.molecular_weight
+                )
+                d_temperature = (
+                    evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
+                ) / (feed_heat_capacity * feed_mass)
+
+            return numpy.array([d_mass_1, d_mass_2, d_temperature])
+
+        def get_event(
+            stop_function: typing.Callable[[float, float, float, float], float],
+        ) -> typing.Callable[[float, numpy.ndarray], float]:
+            def event(t: float, state: numpy.ndarray) -> float:
+                composition, feed_mass, _ = get_state(t, state)
+                return stop_function(
+                    t, composition, feed_mass, sum(get_partial_fluxes(t, state))
                 )
 
-            feed_mass.append(feed_mass[step] - d_mass_1 - d_mass_2)
+            event.terminal = True
+            return event
 
-            feed_composition.append(
-                Composition(
-                    p=(feed_composition[step].p * feed_mass[step] - d_mass_1)
-                    / feed_mass[step + 1],
-                    type=CompositionType.weight,
+        initial_state = numpy.array(
+            [
+                initial_composition * conditions.initial_feed_amount,
+                (1 - initial_composition) * conditions.initial_feed_amount,
+                conditions.initial_feed_temperature,
+            ]
+        )
+        events = [get_event(stop_function) for stop_function in stop_functions]
+
+        if any(event(0.0, initial_state) <= 0 for event in events):
+            process_time = numpy.zeros(2)
+            states = numpy.column_stack((initial_state, initial_state))
+        else:
+            solution = integrate.solve_ivp(
+                balance,
+                (0.0, time[-1]),
+                initial_state,
+                method="RK45",
+                t_eval=time,
+                rtol=rtol,
+                atol=atol,
+                events=events or None,
+            )
+            if not solution.success:
+                raise ValueError(
+                    "The process could not be integrated: %s" % solution.message
                 )
-            )
 
-        feed_composition.pop(-1)
-        feed_mass.pop(-1)
+            process_time = solution.t
+            states = solution.y
+            if solution.status == 1:
+                index = next(i for i, t in enumerate(solution.t_events) if len(t) > 0)
+                stop_time = solution.t_events[index][0]
+                stop_state = solution.y_events[index][0]
+                before_stop = process_time < stop_time
+                process_time = numpy.concatenate(
+                    (process_time[before_stop], [stop_time, stop_time])
+                )
+                states = numpy.column_stack(
+                    (states[:, before_stop], stop_state, stop_state)
+                )
 
-        return ProcessModel(
-            mixture=self.mixture,
-            membrane_name=self.membrane.name,
-            feed_temperature=[conditions.initial_feed_temperature] * number_of_steps,
-            feed_compositions=feed_composition,
-            permeate_composition=permeate_composition,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
-            feed_mass=feed_mass,
-            partial_fluxes=partial_fluxes,
-            permeances=permeances,
-            time=time,
-            feed_evaporation_heat=feed_evaporation_heat,
-            permeate_condensation_heat=permeate_condensation_heat,
-            initial_conditions=conditions,
-            comments=(
-                f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
-                f"Ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
-            ),
-            membrane_path=self.membrane.path,
-        )
+        feed_mass = states[0] + states[1]
+        feed_composition = states[0] / feed_mass
+        if isothermal:
+            feed_temperature = numpy.full(
+                len(process_time), float(conditions.initial_feed_temperature)
+            )
+        elif conditions.temperature_program is not None:
+            feed_temperature = numpy.array(
+                [conditions.temperature_program.program(t) for t in process_time]
+            )
+        else:
+            feed_temperature = states[2]
+        return process_time, feed_composition, feed_mass, feed_temperature
 
-    def ideal_non_isothermal_process(
+    def _get_trajectory_fluxes(
         self,
         conditions: Conditions,
-        number_of_steps: int,
-        delta_hours: float,
-        precision: typing.Optional[float] = 5e-5,
-    ) -> ProcessModel:
+        feed_composition: numpy.ndarray,
+        feed_mass: numpy.ndarray,
+        feed_temperature: typing.Union[float, numpy.ndarray],
+        first_component_permeance: typing.Union[float, numpy.ndarray],
+        second_component_permeance: typing.Union[float, numpy.ndarray],
+        precision: float,
+    ) -> typing.Tuple[PartialFluxesBatch, numpy.ndarray, numpy.ndarray]:
         """
-        Models mass and heat balance of an Ideal (constant Permeance) Non-Isothermal Pervaporation Process.
-        The temperature program maybe specified in Conditions, by including a TemperatureProgram object.
-        If temperature program is not specified, models self-cooling process;
-        :param number_of_steps: Number of time steps to include in the model
-        :param delta_hours: The duration of each step in hours
+        Calculates partial fluxes at the beginning of each step of a process trajectory
+        and the masses of the components permeated during each step
         :param conditions: Conditions object, where initial conditions are specified
-        :param precision: Precision in obtained permeate composition, by default is 5e-5
-        :return: A ProcessModel Object
+        :param feed_composition: weight fractions of the first component in feed at each time point,
+        including the end of the last step
+        :param feed_mass: feed masses at each time point, including the end of the last step
+        :param feed_temperature: feed temperatures at the beginning of each step
+        :param first_component_permeance: Permeances of the first component in kg/(m2*h*kPa)
+        :param second_component_permeance: Permeances of the second component in kg/(m2*h*kPa)
+        :param precision: Precision in obtained permeate composition
+        :return: PartialFluxesBatch and masses of the first and second components permeated during each step
         """
+        batch = self.calculate_partial_fluxes_batch(
+            feed_temperature=feed_temperature,
+            composition=feed_composition[:-1],
+            precision=precision,
+            permeate_temperature=conditions.permeate_temperature,
+            permeate_pressure=conditions.permeate_pressure,
+            first_component_permeance=first_component_permeance,
+            second_component_permeance=second_component_permeance,
+        )
+        if not batch.converged.all():
+            raise ValueError(
+                "Partial fluxes are not defined in the stated conditions range"
+            )
 
-        time: typing.List[float] = [
-            delta_hours * step for step in range(number_of_steps)
-        ]
-
-        feed_temperature: typing.List[float] = [conditions.initial_feed_temperature]
-
-        partial_fluxes: typing.List[typing.Tuple[float, float]] = []
-
-        permeances: typing.List[typing.Tuple[Permeance, Permeance]] = []
+        first_component_mass = feed_composition * feed_mass
+        second_component_mass = feed_mass - first_component_mass
+        return (
+            batch,
+            -numpy.diff(first_component_mass),
+            -numpy.diff(second_component_mass),
+        )
 
-        permeate_composition: typing.List[Composition] = []
+    def _get_heats(
+        self,
+        permeate_temperature: typing.Optional[typing.Union[float, numpy.ndarray]],
+        feed_temperature: typing.Union[float, numpy.ndarray],
+        d_mass_1: typing.Union[float, numpy.ndarray],
+        d_mass_2: typing.Union[float, numpy.ndarray],
+    ) -> typing.Tuple[
+        typing.Union[float, numpy.ndarray], typing.Union[float, numpy.ndarray]
+    ]:
+        """
+        Calculates feed evaporation and permeate condensation heats of a process step or a sequence of steps,
+        the condensation heats are NaN if the permeate temperature is not specified;
+        The heats are used by all the process engines and the ensemble
+        :param permeate_temperature: Permeate temperature, K, a float or an array with NaN values,
+        where the permeate temperature is not specified
+        :param feed_temperature: Feed temperature at the beginning of each step, a float or an array
+        :param d_mass_1: Mass of the first component permeated during each step
+        :param d_mass_2: Mass of the second component permeated during each step
+        :return: feed evaporation heats and permeate condensation heats of each step
+        """
+        evaporation_heat_1 = (
+            self.mixture.first_component.get_vaporisation_heat(feed_temperature)
+            / self.mixture.first_component.molecular_weight
+            * 1000
+        )
+        evaporation_heat_2 = (
+            self.mixture.second_component.get_vaporisation_heat(feed_temperature)
+            / self.mixture.second_component.molecular_weight
+            * 1000
+        )
+        feed_evaporation_heat = (
+            evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
+        )
 
-        feed_composition: typing.List[Composition] = [
-            conditions.initial_feed_composition.to_weight(self.mixture)
-        ]
+        if permeate_temperature is None:
+            return feed_evaporation_heat, feed_evaporation_heat * numpy.nan
 
-        feed_evaporation_heat: typing.List[float] = []
+        condensation_heat_1 = (
+            self.mixture.first_component.get_vaporisation_heat(permeate_temperature)
+            / self.mixture.first_component.molecular_weight
+            * 1000
+        )
+        condensation_heat_2 = (
+            self.mixture.second_component.get_vaporisation_heat(permeate_temperature)
+            / self.mixture.second_component.molecular_weight
+            * 1000
+        )
+        specific_heat_1 = self.mixture.first_component.get_cooling_heat(
+            feed_temperature, permeate_temperature
+        )
+        specific_heat_2 = self.mixture.second_component.get_cooling_heat(
+            feed_temperature, permeate_temperature
+        )
+        permeate_condensation_heat = (
+            condensation_heat_1 * d_mass_1
+            + condensation_heat_2 * d_mass_2
+            + (specific_heat_1 * d_mass_1 + specific_heat_2 * d_mass_2)
+            * (feed_temperature - permeate_temperature)
+        )
+        return feed_evaporation_heat, permeate_condensation_heat
 
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
+    def _update_step(
+        self,
+        feed_composition: typing.Union[float, numpy.ndarray],
+        feed_mass: typing.Union[float, numpy.ndarray],
+        feed_temperature: typing.Union[float, numpy.ndarray],
+        flux_1: typing.Union[float, numpy.ndarray],
+        flux_2: typing.Union[float, numpy.ndarray],
+        membrane_area: typing.Union[float, numpy.ndarray],
+        delta_hours: float,
+        permeate_temperature: typing.Optional[typing.Union[float, numpy.ndarray]],
+        self_cooling: bool,
+    ) -> typing.Tuple[typing.Union[float, numpy.ndarray], ...]:
+        """
+        Calculates the mass and heat balances of an explicit Euler step of a process,
+        the values are floats for a single process or arrays for a batch of processes;
+        The step update is used by the euler engine, the checkpoints and the ensemble
+        :param feed_composition: Weight fraction of the first component in feed at the beginning of the step
+        :param feed_mass: Feed mass at the beginning of the step, kg
+        :param feed_temperature: Feed temperature at the beginning of the step, K
+        :param flux_1: Partial flux of the first component, kg/(m2*h)
+        :param flux_2: Partial flux of the second component, kg/(m2*h)
+        :param membrane_area: Membrane area, m2
+        :param delta_hours: The duration of the step in hours
+        :param permeate_temperature: Permeate temperature, K, see _get_heats
+        :param self_cooling: if True, the feed is cooled by the evaporation heat, otherwise the feed temperature
+        is not changed
+        :return: permeate composition, feed evaporation heat and permeate condensation heat of the step,
+        feed composition, feed mass and feed temperature at the end of the step
+        """
+        permeate_composition = flux_1 / (flux_1 + flux_2)
 
-        feed_mass: typing.List[float] = [conditions.initial_feed_amount]
+        d_mass_1 = flux_1 * membrane_area * delta_hours
+        d_mass_2 = flux_2 * membrane_area * delta_hours
 
-        for step in range(len(time)):
+        feed_evaporation_heat, permeate_condensation_heat = self._get_heats(
+            permeate_temperature=permeate_temperature,
+            feed_temperature=feed_temperature,
+            d_mass_1=d_mass_1,
+            d_mass_2=d_mass_2,
+        )
 
-            evaporation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            evaporation_heat_2 = (
-                self.mixture.second_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.second_component.molecular_weight
-                * 1000
-            )
+        next_feed_mass = feed_mass - d_mass_1 - d_mass_2
+        next_feed_composition = (
+            feed_composition * feed_mass - d_mass_1
+        ) / next_feed_mass
 
-            heat_capacity_1 = (
-                self.mixture.first_component.get_specific_heat(feed_temperature[step])
+        next_feed_temperature = feed_temperature
+        if self_cooling:
+            feed_heat_capacity = feed_composition * (
+                self.mixture.first_component.get_specific_heat(feed_temperature)
                 / self.mixture.first_component.molecular_weight
-            )
-            heat_capacity_2 = (
-                self.mixture.second_component.get_specific_heat(feed_temperature[step])
+            ) + (1 - feed_composition) * (
+                self.mixture.second_component.get_specific_heat(feed_temperature)
                 / self.mixture.second_component.molecular_weight
             )
-            feed_heat_capacity = (
-                feed_composition[step].first * heat_capacity_1
-                + feed_composition[step].second * heat_capacity_2
+            next_feed_temperature = feed_temperature - (
+                feed_evaporation_heat / (feed_heat_capacity * feed_mass)
             )
+        return (
+            permeate_composition,
+            feed_evaporation_heat,
+            permeate_condensation_heat,
+            next_feed_composition,
+            next_feed_mass,
+            next_feed_temperature,
+        )
 
-            permeances.append(
-                (
-                    self.membrane.get_permeance(
-                        feed_temperature[step], self.mixture.first_component
-                    ),
-                    self.membrane.get_permeance(
-                        feed_temperature[step], self.mixture.second_component
-                    ),
+    def _get_initial_step(
+        self, conditions: Conditions, permeances: typing.Tuple[float, float]
+    ) -> ProcessStep:
+        """
+        :param conditions: Conditions object, where initial conditions are specified
+        :param permeances: permeances of both components at the beginning of the process in kg/(m2*h*kPa)
+        :return: ProcessStep with the initial state of the process, which is not calculated yet
+        """
+        return _start_step(
+            time=0.0,
+            feed_composition=conditions.initial_feed_composition.to_weight(
+                self.mixture
+            ).p,
+            feed_mass=float(conditions.initial_feed_amount),
+            feed_temperature=float(conditions.initial_feed_temperature),
+            permeances=(float(permeances[0]), float(permeances[1])),
+        )
+
+    def _euler_steps(
+        self,
+        definition: _ProcessDefinition,
+        buffer: _StepBuffer,
+        conditions: Conditions,
+        number_of_steps: int,
+        delta_hours: float,
+        precision: typing.Optional[float],
+        stop_conditions: typing.Optional[StopConditions] = None,
+        before_step: typing.Optional[typing.Callable[[_StepBuffer], None]] = None,
+    ) -> typing.Iterator[ProcessStep]:
+        """
+        Calculates a process with explicit Euler steps starting from the current step of the buffer;
+        A step is final, when the stop conditions of the next step are checked, since they may truncate it,
+        so only the last two steps are kept
+        :param definition: _ProcessDefinition of the process
+        :param buffer: _StepBuffer with the last steps of the process, which is advanced in place
+        :param conditions: Conditions object, where initial conditions are specified
+        :param number_of_steps: Number of time steps to include in the model
+        :param delta_hours: The duration of each step in hours
+        :param precision: Precision in obtained permeate composition
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used
+        :param before_step: function, which is called with the buffer before each step
+        :return: generator of the final ProcessSteps
+        """
+        stop_functions = self._get_stop_functions(conditions, stop_conditions)
+        self_cooling = (
+            not definition.isothermal and conditions.temperature_program is None
+        )
+
+        while buffer.step < number_of_steps:
+            if before_step is not None:
+                before_step(buffer)
+
+            current = buffer.current
+            partial_fluxes, iterations = self._calculate_partial_fluxes(
+                feed_temperature=current.feed_temperature,
+                composition=current.feed_composition,
+                precision=precision,
+                permeate_temperature=conditions.permeate_temperature,
+                permeate_pressure=conditions.permeate_pressure,
+                first_component_permeance=current.permeances[0],
+                second_component_permeance=current.permeances[1],
+                initial_guess=buffer.get_permeate_composition_guess(conditions),
+            )
+            current = attr.evolve(
+                current,
+                partial_fluxes=(float(partial_fluxes[0]), float(partial_fluxes[1])),
+                iterations=int(iterations),
+            )
+
+            if buffer.previous is not None:
+                if stop_functions:
+                    fraction = self._locate_stop(
+                        stop_functions=stop_functions,
+                        previous_state=_get_stop_state(buffer.previous),
+                        state=_get_stop_state(current),
+                    )
+                    if fraction is not None:
+                        yield from _truncate_steps(buffer.previous, current, fraction)
+                        return
+                yield buffer.previous
+
+            (
+                permeate_composition,
+                feed_evaporation_heat,
+                permeate_condensation_heat,
+                feed_composition,
+                feed_mass,
+                feed_temperature,
+            ) = self._update_step(
+                feed_composition=current.feed_composition,
+                feed_mass=current.feed_mass,
+                feed_temperature=current.feed_temperature,
+                flux_1=partial_fluxes[0],
+                flux_2=partial_fluxes[1],
+                membrane_area=conditions.membrane_area,
+                delta_hours=delta_hours,
+                permeate_temperature=conditions.permeate_temperature,
+                self_cooling=self_cooling,
+            )
+            if not definition.isothermal and conditions.temperature_program is not None:
+                feed_temperature = conditions.temperature_program.program(
+                    current.time + delta_hours
                 )
-            )
 
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=feed_temperature[step],
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
+            permeances = current.permeances
+            if definition.get_permeances is not None:
+                permeances = tuple(
+                    max(float(permeance), 0.0)
+                    for permeance in definition.get_permeances(
+                        (
+                            current.feed_composition
+                            if definition.lagged_permeances
+                            else feed_composition
+                        ),
+                        feed_temperature,
+                    )
                 )
-            )
 
-            permeate_composition.append(
-                Composition(
-                    p=partial_fluxes[step][0] / (sum(partial_fluxes[step])),
-                    type=CompositionType.weight,
+            buffer.current = attr.evolve(
+                current,
+                permeate_composition=permeate_composition,
+                feed_evaporation_heat=feed_evaporation_heat,
+                permeate_condensation_heat=(
+                    None
+                    if conditions.permeate_temperature is None
+                    else permeate_condensation_heat
+                ),
+            )
+            buffer.advance(
+                _start_step(
+                    time=delta_hours * float(buffer.step + 1),
+                    feed_composition=feed_composition,
+                    feed_mass=feed_mass,
+                    feed_temperature=feed_temperature,
+                    permeances=permeances,
                 )
             )
 
-            d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
-            d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
+        if buffer.previous is not None:
+            yield buffer.previous
 
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
-            else:
-                condensation_heat_1 = (
-                    self.mixture.first_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.first_component.molecular_weight
-                    * 1000
-                )
-                condensation_heat_2 = (
-                    self.mixture.second_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
+    def _get_process_state(
+        self,
+        definition: _ProcessDefinition,
+        conditions: Conditions,
+        number_of_steps: int,
+        delta_hours: float,
+        precision: typing.Optional[float],
+        engine: str,
+        number_of_nodes: int = 2000,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ) -> ProcessState:
+        """
+        Calculates all the steps of a process with the specified engine
+        :param definition: _ProcessDefinition of the process
+        :return: ProcessState with the calculated steps
+        """
+        if engine == ProcessEngine.euler:
+            state = ProcessState.allocate(number_of_steps)
+            for process_step in self._euler_steps(
+                definition=definition,
+                buffer=_StepBuffer(
+                    current=self._get_initial_step(
+                        conditions, definition.initial_permeances
                     )
-                    / self.mixture.second_component.molecular_weight
-                    * 1000
-                )
-
-                specific_heat_1 = self.mixture.first_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-                specific_heat_2 = self.mixture.second_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
+                ),
+                conditions=conditions,
+                number_of_steps=number_of_steps,
+                delta_hours=delta_hours,
+                precision=precision,
+                stop_conditions=stop_conditions,
+            ):
+                state.append(process_step)
+            return state
+
+        time = delta_hours * numpy.arange(number_of_steps + 1, dtype=float)
+        stop_functions = self._get_stop_functions(conditions, stop_conditions)
+        if (
+            engine == ProcessEngine.quadrature
+            and definition.isothermal
+            and definition.get_permeances is None
+        ):
+            if stop_functions:
+                raise ValueError(
+                    "Stop conditions are not supported by the quadrature engine"
                 )
-
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (specific_heat_1 * d_mass_1 + specific_heat_2 * d_mass_2)
-                    * (feed_temperature[step] - conditions.permeate_temperature)
+            feed_composition, feed_mass = self._get_rayleigh_trajectory(
+                time=time,
+                conditions=conditions,
+                first_component_permeance=definition.initial_permeances[0],
+                second_component_permeance=definition.initial_permeances[1],
+                precision=precision,
+                number_of_nodes=number_of_nodes,
+            )
+            feed_temperature = numpy.full(
+                len(time), float(conditions.initial_feed_temperature)
+            )
+        elif engine == ProcessEngine.adaptive:
+            get_permeances = definition.get_permeances or (
+                lambda composition, temperature: definition.initial_permeances
+            )
+            time, feed_composition, feed_mass, feed_temperature = (
+                self._integrate_process(
+                    conditions=conditions,
+                    time=time,
+                    get_permeances=get_permeances,
+                    isothermal=definition.isothermal,
+                    precision=precision,
+                    rtol=rtol,
+                    atol=atol,
+                    stop_functions=stop_functions,
                 )
+            )
+        else:
+            raise ValueError("Engine %s is not supported" % engine)
 
-            feed_evaporation_heat.append(
-                evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
+        length = len(time) - 1
+        temperature = (
+            conditions.initial_feed_temperature
+            if definition.isothermal
+            else feed_temperature[:-1]
+        )
+        if definition.get_permeances is None:
+            first_component_permeance, second_component_permeance = (
+                definition.initial_permeances
             )
+            permeances = numpy.tile(definition.initial_permeances, (length, 1))
+        else:
+            first_component_permeance, second_component_permeance = (
+                definition.get_permeances(feed_composition[:-1], temperature)
+            )
+            permeances = numpy.column_stack(
+                (first_component_permeance, second_component_permeance)
+            )
+        batch, d_mass_1, d_mass_2 = self._get_trajectory_fluxes(
+            conditions=conditions,
+            feed_composition=feed_composition,
+            feed_mass=feed_mass,
+            feed_temperature=temperature,
+            first_component_permeance=first_component_permeance,
+            second_component_permeance=second_component_permeance,
+            precision=precision,
+        )
+        feed_evaporation_heat, permeate_condensation_heat = self._get_heats(
+            permeate_temperature=conditions.permeate_temperature,
+            feed_temperature=temperature,
+            d_mass_1=d_mass_1,
+            d_mass_2=d_mass_2,
+        )
+        return ProcessState(
+            time=time[:-1],
+            feed_composition=feed_composition[:-1],
+            feed_mass=feed_mass[:-1],
+            feed_temperature=feed_temperature[:-1],
+            partial_fluxes=batch.partial_fluxes,
+            permeances=permeances,
+            permeate_composition=batch.permeate_composition,
+            feed_evaporation_heat=feed_evaporation_heat,
+            permeate_condensation_heat=permeate_condensation_heat,
+            iterations=batch.iterations,
+            length=length,
+        )
 
-            feed_mass.append(feed_mass[step] - d_mass_1 - d_mass_2)
+    def _model_process(
+        self,
+        definition: _ProcessDefinition,
+        conditions: Conditions,
+        number_of_steps: int,
+        delta_hours: float,
+        precision: typing.Optional[float],
+        engine: str,
+        number_of_nodes: int = 2000,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ) -> ProcessModel:
+        """
+        Models a process with the specified engine, see _get_process_state
+        :param definition: _ProcessDefinition of the process
+        :return: ProcessModel object
+        """
+        return self._get_process_state(
+            definition=definition,
+            conditions=conditions,
+            number_of_steps=number_of_steps,
+            delta_hours=delta_hours,
+            precision=precision,
+            engine=engine,
+            number_of_nodes=number_of_nodes,
+            rtol=rtol,
+            atol=atol,
+            stop_conditions=stop_conditions,
+        ).to_process_model(
+            mixture=self.mixture,
+            membrane_name=self.membrane.name,
+            conditions=conditions,
+            **definition.model_parameters,
+        )
 
-            feed_composition.append(
-                Composition(
-                    p=(feed_composition[step].p * feed_mass[step] - d_mass_1)
-                    / feed_mass[step + 1],
-                    type=CompositionType.weight,
+    def _get_ideal_definition(
+        self, conditions: Conditions, isothermal: bool
+    ) -> _ProcessDefinition:
+        """
+        :param conditions: Conditions object, where initial conditions are specified
+        :param isothermal: if True, the permeances are constant,
+        otherwise they depend on the feed temperature according to the IdealExperiments of the Membrane
+        :return: _ProcessDefinition of an Ideal Process
+        """
+
+        def get_permeances(
+            composition: typing.Union[float, numpy.ndarray],
+            temperature: typing.Union[float, numpy.ndarray],
+        ) -> typing.Tuple[
+            typing.Union[float, numpy.ndarray], typing.Union[float, numpy.ndarray]
+        ]:
+            if numpy.ndim(temperature) == 0:
+                return (
+                    self.membrane.get_permeance(
+                        temperature, self.mixture.first_component
+                    ).value,
+                    self.membrane.get_permeance(
+                        temperature, self.mixture.second_component
+                    ).value,
                 )
+            return (
+                self.membrane.get_permeance_array(
+                    temperature, self.mixture.first_component
+                ),
+                self.membrane.get_permeance_array(
+                    temperature, self.mixture.second_component
+                ),
             )
 
-            if conditions.temperature_program is None:
-                feed_temperature.append(
-                    feed_temperature[step]
-                    - (
-                        feed_evaporation_heat[step]
-                        / (feed_heat_capacity * feed_mass[step])
-                    )
+        return _ProcessDefinition(
+            isothermal=isothermal,
+            initial_permeances=get_permeances(
+                None, conditions.initial_feed_temperature
+            ),
+            get_permeances=None if isothermal else get_permeances,
+            model_parameters=dict(
+                comments=(
+                    f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
+                    f"Ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
+                ),
+                membrane_path=self.membrane.path,
+            ),
+        )
+
+    def ideal_isothermal_process(
+        self,
+        number_of_steps: int,
+        delta_hours: float,
+        conditions: Conditions,
+        precision: typing.Optional[float] = 5e-5,
+        engine: str = ProcessEngine.euler,
+        number_of_nodes: int = 2000,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ) -> ProcessModel:
+        """
+        Models mass and heat balance of an Ideal (constant Permeance) Isothermal Pervaporation Process
+        :param number_of_steps: Number of time steps to include in the model
+        :param delta_hours: The duration of each step in hours
+        :param conditions: Conditions object, where initial conditions are specified
+        :param precision: Precision in obtained permeate composition, by default is 5e-5
+        :param engine: ProcessEngine.euler - explicit Euler steps (default),
+        ProcessEngine.quadrature - Rayleigh-type quadrature over the feed composition,
+        the state is evaluated exactly at the requested time points,
+        ProcessEngine.adaptive - adaptive step integration of the mass balance
+        :param number_of_nodes: Number of composition nodes for the quadrature engine
+        :param rtol: Relative tolerance of the adaptive engine
+        :param atol: Absolute tolerance of the adaptive engine
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used;
+        The last state of a terminated process corresponds to the point, where the condition is reached
+        :return: A ProcessModel Object
+        """
+        return self._model_process(
+            definition=self._get_ideal_definition(conditions, isothermal=True),
+            conditions=conditions,
+            number_of_steps=number_of_steps,
+            delta_hours=delta_hours,
+            precision=precision,
+            engine=engine,
+            number_of_nodes=number_of_nodes,
+            rtol=rtol,
+            atol=atol,
+            stop_conditions=stop_conditions,
+        )
+
+    def ideal_non_isothermal_process(
+        self,
+        conditions: Conditions,
+        number_of_steps: int,
+        delta_hours: float,
+        precision: typing.Optional[float] = 5e-5,
+        engine: str = ProcessEngine.euler,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ) -> ProcessModel:
+        """
+        Models mass and heat balance of an Ideal (constant Permeance) Non-Isothermal Pervaporation Process.
+        The temperature program maybe specified in Conditions, by including a TemperatureProgram object.
+        If temperature program is not specified, models self-cooling process;
+        :param number_of_steps: Number of time steps to include in the model
+        :param delta_hours: The duration of each step in hours
+        :param conditions: Conditions object, where initial conditions are specified
+        :param precision: Precision in obtained permeate composition, by default is 5e-5
+        :param engine: ProcessEngine.euler - explicit Euler steps (default),
+        ProcessEngine.adaptive - adaptive step integration of the mass and heat balances
+        :param rtol: Relative tolerance of the adaptive engine
+        :param atol: Absolute tolerance of the adaptive engine
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used;
+        The last state of a terminated process corresponds to the point, where the condition is reached
+        :return: A ProcessModel Object
+        """
+        return self._model_process(
+            definition=self._get_ideal_definition(conditions, isothermal=False),
+            conditions=conditions,
+            number_of_steps=number_of_steps,
+            delta_hours=delta_hours,
+            precision=precision,
+            engine=engine,
+            rtol=rtol,
+            atol=atol,
+            stop_conditions=stop_conditions,
+        )
+
+    def ensemble_process(
+        self,
+        conditions: typing.Sequence[Conditions],
+        number_of_steps: int,
+        delta_hours: float,
+        isothermal: bool = True,
+        precision: float = 5e-5,
+        max_iterations: int = 1000,
+    ) -> ProcessEnsemble:
+        """
+        Models mass and heat balances of Ideal (constant Permeance) Pervaporation Processes
+        for a batch of Conditions with the same membrane and mixture;
+        All the trajectories are advanced together with explicit Euler steps,
+        the partial fluxes of all the members are calculated at each step in a single call of
+        calculate_partial_fluxes_batch. StopConditions of each member are applied individually
+        :param conditions: Conditions of each member of the ensemble
+        :param number_of_steps: Number of time steps to include in the models
+        :param delta_hours: The duration of each step in hours
+        :param isothermal: if True, Isothermal Processes are modelled, otherwise Non-Isothermal Processes,
+        where the feed temperature follows the TemperatureProgram if it is specified, or the process is self-cooling
+        :param precision: Precision in obtained permeate composition, by default is 5e-5
+        :param max_iterations: Maximum number of iterations of the permeate composition at each step
+        :return: ProcessEnsemble object
+        """
+        members = len(conditions)
+        # Feed composition, mass and temperature are allocated for one more point
+        # to hold the state at the end of the last step
+        state_arrays = {
+            "time": numpy.tile(
+                delta_hours * numpy.arange(number_of_steps, dtype=float), (members, 1)
+            ),
+            "feed_composition": numpy.empty((members, number_of_steps + 1)),
+            "feed_mass": numpy.empty((members, number_of_steps + 1)),
+            "feed_temperature": numpy.empty((members, number_of_steps + 1)),
+            "partial_fluxes": numpy.empty((members, number_of_steps, 2)),
+            "permeances": numpy.empty((members, number_of_steps, 2)),
+            "permeate_composition": numpy.empty((members, number_of_steps)),
+            "feed_evaporation_heat": numpy.empty((members, number_of_steps)),
+            "permeate_condensation_heat": numpy.empty((members, number_of_steps)),
+            "iterations": numpy.zeros((members, number_of_steps), dtype=int),
+        }
+        # States of the members are views of the rows of the stacked arrays
+        states = [
+            ProcessState(
+                **{
+                    name: values[member, :number_of_steps]
+                    for name, values in state_arrays.items()
+                }
+            )
+            for member in range(members)
+        ]
+        time = state_arrays["time"]
+        feed_composition = state_arrays["feed_composition"]
+        feed_mass = state_arrays["feed_mass"]
+        feed_temperature = state_arrays["feed_temperature"]
+        partial_fluxes = state_arrays["partial_fluxes"]
+        permeances = state_arrays["permeances"]
+
+        feed_composition[:, 0] = [
+            member.initial_feed_composition.to_weight(self.mixture).p
+            for member in conditions
+        ]
+        feed_mass[:, 0] = [member.initial_feed_amount for member in conditions]
+        feed_temperature[:, 0] = [
+            member.initial_feed_temperature for member in conditions
+        ]
+        membrane_area = numpy.array([member.membrane_area for member in conditions])
+        permeate_temperature = numpy.array(
+            [
+                (
+                    numpy.nan
+                    if member.permeate_temperature is None
+                    else member.permeate_temperature
                 )
-            else:
-                feed_temperature.append(
-                    conditions.temperature_program.program(time[step] + delta_hours)
+                for member in conditions
+            ],
+            dtype=float,
+        )
+        permeate_pressure = numpy.array(
+            [
+                (
+                    numpy.nan
+                    if member.permeate_pressure is None
+                    else member.permeate_pressure
+                )
+                for member in conditions
+            ],
+            dtype=float,
+        )
+        stop_functions = [self._get_stop_functions(member) for member in conditions]
+
+        active = numpy.ones(members, dtype=bool)
+        for step in range(number_of_steps):
+            index = numpy.flatnonzero(active)
+            if len(index) == 0:
+                break
+            temperature = feed_temperature[index, step]
+            permeances[index, step, 0] = self.membrane.get_permeance_array(
+                temperature, self.mixture.first_component
+            )
+            permeances[index, step, 1] = self.membrane.get_permeance_array(
+                temperature, self.mixture.second_component
+            )
+            batch = self.calculate_partial_fluxes_batch(
+                feed_temperature=temperature,
+                composition=feed_composition[index, step],
+                precision=precision,
+                permeate_temperature=permeate_temperature[index],
+                permeate_pressure=permeate_pressure[index],
+                first_component_permeance=permeances[index, step, 0],
+                second_component_permeance=permeances[index, step, 1],
+                max_iterations=max_iterations,
+            )
+            if not batch.converged.all():
+                raise ValueError(
+                    "Partial fluxes are not defined in the stated conditions range"
                 )
+            partial_fluxes[index, step] = batch.partial_fluxes
+            state_arrays["iterations"][index, step] = batch.iterations
+
+            if step > 0:
+                for member in index:
+                    if not stop_functions[member]:
+                        continue
+                    state = states[member]
+                    previous = state.get_step(step - 1, conditions[member])
+                    current = state.get_step(step, conditions[member])
+                    fraction = self._locate_stop(
+                        stop_functions=stop_functions[member],
+                        previous_state=_get_stop_state(previous),
+                        state=_get_stop_state(current),
+                    )
+                    if fraction is not None:
+                        state.length = step - 1
+                        for process_step in _truncate_steps(
+                            previous, current, fraction
+                        ):
+                            state.append(process_step)
+                        active[member] = False
+                index = numpy.flatnonzero(active)
+                temperature = feed_temperature[index, step]
 
-        feed_mass.pop(-1)
-        feed_composition.pop(-1)
-        feed_temperature.pop(-1)
+            (
+                state_arrays["permeate_composition"][index, step],
+                state_arrays["feed_evaporation_heat"][index, step],
+                state_arrays["permeate_condensation_heat"][index, step],
+                feed_composition[index, step + 1],
+                feed_mass[index, step + 1],
+                feed_temperature[index, step + 1],
+            ) = self._update_step(
+                feed_composition=feed_composition[index, step],
+                feed_mass=feed_mass[index, step],
+                feed_temperature=temperature,
+                flux_1=partial_fluxes[index, step, 0],
+                flux_2=partial_fluxes[index, step, 1],
+                membrane_area=membrane_area[index],
+                delta_hours=delta_hours,
+                permeate_temperature=permeate_temperature[index],
+                self_cooling=not isothermal,
+            )
+            if isothermal:
+                continue
+            for member in index:
+                if conditions[member].temperature_program is not None:
+                    feed_temperature[member, step + 1] = conditions[
+                        member
+                    ].temperature_program.program(time[member, step] + delta_hours)
+
+        for member in numpy.flatnonzero(active):
+            states[member].length = number_of_steps
+
+        models = [
+            state.to_process_model(
+                mixture=self.mixture,
+                membrane_name=self.membrane.name,
+                conditions=member,
+                comments=(
+                    f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
+                    f"Ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
+                ),
+                membrane_path=self.membrane.path,
+            )
+            for state, member in zip(states, conditions)
+        ]
 
-        return ProcessModel(
-            mixture=self.mixture,
-            membrane_name=self.membrane.name,
-            feed_temperature=feed_temperature,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
-            feed_compositions=feed_composition,
-            permeate_composition=permeate_composition,
-            feed_mass=feed_mass,
-            partial_fluxes=partial_fluxes,
-            permeances=permeances,
-            time=time,
-            feed_evaporation_heat=feed_evaporation_heat,
-            permeate_condensation_heat=permeate_condensation_heat,
-            initial_conditions=conditions,
-            comments=(
-                f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
-                f"Ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
+        lengths = numpy.array([state.length for state in states])
+        terminated = numpy.arange(number_of_steps) >= lengths[:, None]
+        for name in [
+            "time",
+            "feed_composition",
+            "feed_mass",
+            "feed_temperature",
+            "partial_fluxes",
+            "permeate_composition",
+        ]:
+            state_arrays[name] = state_arrays[name][:, :number_of_steps]
+            state_arrays[name][terminated] = numpy.nan
+        return ProcessEnsemble(
+            models=models,
+            time=state_arrays["time"],
+            feed_composition=state_arrays["feed_composition"],
+            feed_mass=state_arrays["feed_mass"],
+            feed_temperature=state_arrays["feed_temperature"],
+            partial_fluxes=state_arrays["partial_fluxes"],
+            permeate_composition=state_arrays["permeate_composition"],
+            lengths=lengths,
+        )
+
+    def _find_permeance_fits(
+        self,
+        diffusion_curve_set: DiffusionCurveSet,
+        n_first: typing.Optional[int] = None,
+        m_first: typing.Optional[int] = None,
+        n_second: typing.Optional[int] = None,
+        m_second: typing.Optional[int] = None,
+        include_zero: bool = False,
+    ) -> typing.Tuple[PervaporationFunction, PervaporationFunction]:
+        """
+        Finds the PervaporationFunctions of both components in the fit_cache, the functions are fitted
+        if they are not stored; The functions of a single diffusion curve do not depend on the temperature
+        :param diffusion_curve_set: DiffusionCurveSet used as a basis for fitting of the PervaporationFunctions
+        :param n_first: n parameter of the PervaporationFunction of the first component
+        :param m_first: m parameter of the PervaporationFunction of the first component
+        :param n_second: n parameter of the PervaporationFunction of the second component
+        :param m_second: m parameter of the PervaporationFunction of the second component
+        :param include_zero: bool parameter to force default points while fitting the PervaporationFunction
+        :return: PervaporationFunctions of both components
+        """
+        single_curve = len(diffusion_curve_set.diffusion_curves) == 1
+        return (
+            self.fit_cache.find_best_fit(
+                data=Measurements.from_diffusion_curves_first(diffusion_curve_set),
+                n=n_first,
+                m=0 if single_curve else m_first,
+                include_zero=include_zero,
+                component_index=0,
+            ),
+            self.fit_cache.find_best_fit(
+                data=Measurements.from_diffusion_curves_second(diffusion_curve_set),
+                n=n_second,
+                m=0 if single_curve else m_second,
+                include_zero=include_zero,
+                component_index=1,
             ),
-            membrane_path=self.membrane.path,
         )
 
     def non_ideal_diffusion_curve(
@@ -641,11 +2403,15 @@ class Pervaporation:
         :return: non-ideal diffusion curve
         """
 
-        measurements_first = Measurements.from_diffusion_curves_first(
-            diffusion_curve_set
-        )
-        measurements_second = Measurements.from_diffusion_curves_second(
-            diffusion_curve_set
+        pervaporation_function_first, pervaporation_function_second = (
+            self._find_permeance_fits(
+                diffusion_curve_set=diffusion_curve_set,
+                n_first=n_first,
+                m_first=m_first,
+                n_second=n_second,
+                m_second=m_second,
+                include_zero=include_zero,
+            )
         )
 
         if len(diffusion_curve_set.diffusion_curves) == 1:
@@ -653,22 +2419,6 @@ class Pervaporation:
                 0
             ].feed_temperature
 
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=0,
-                include_zero=include_zero,
-                component_index=0,
-            )
-
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=0,
-                include_zero=include_zero,
-                component_index=1,
-            )
-
             if pervaporation_function_temperature == feed_temperature:
                 pass
             else:
@@ -698,22 +2448,6 @@ class Pervaporation:
                 pervaporation_function_first.b[0] = activation_energy_first / R
                 pervaporation_function_second.b[0] = activation_energy_second / R
 
-        else:
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=m_first,
-                include_zero=include_zero,
-                component_index=0,
-            )
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=m_second,
-                include_zero=include_zero,
-                component_index=1,
-            )
-
         if initial_permeances is None:
             first_component_permeance = Permeance(
                 value=pervaporation_function_first(
@@ -817,75 +2551,45 @@ class Pervaporation:
             ),
         )
 
-    def non_ideal_isothermal_process(
+    def _fit_non_ideal_permeances(
         self,
         conditions: Conditions,
         diffusion_curve_set: DiffusionCurveSet,
-        number_of_steps: int,
-        delta_hours: float,
-        precision: typing.Optional[float] = 5e-5,
+        isothermal: bool,
         initial_permeances: typing.Optional[typing.Tuple[Permeance, Permeance]] = None,
         n_first: typing.Optional[int] = None,
         m_first: typing.Optional[int] = None,
         n_second: typing.Optional[int] = None,
         m_second: typing.Optional[int] = None,
         include_zero: bool = False,
-    ):
+    ) -> typing.Tuple[
+        typing.Tuple[PervaporationFunction, PervaporationFunction],
+        typing.Tuple[float, float],
+        typing.Tuple[float, float],
+    ]:
         """
-        The function models Non-Ideal Isothermal Process
-        Based on a set of Diffusion curves measured at different temperatures;
-        The modelling could be also performed based on a single diffusion curve:
-        In that case the apparent activation energy of transport is considered constant
-        and is calculated for each component based on the IdealExperiments default_membranes provided for the Membrane.
-        :param conditions: Initial Conditions of the Process
-        :param diffusion_curve_set: A set of Diffusion curves picked for the Modelling form the Membrane
-        :param number_of_steps: Number of time steps for modelling
-        :param delta_hours: Size of each step in hours
-        :param precision: Precision in obtained permeate composition, by default is 5e-5
-        :param initial_permeances: Initial Permeances, should be stated if the Membranes swelling history is significant
-        :param n_first: Optional parameter,
-        indicates the order of the polynomial of the composition part of the Permeance function for the
-        first component
-        :param m_first: Optional parameter,
-        indicates the order of the polynomial of the temperature part of the Permeance function for
-        the first component
-        :param n_second: Optional parameter,
-        indicates the order of the polynomial of the composition part of the Permeance function for
-        the second component
-        :param m_second: Optional parameter,
-        indicates the order of the polynomial of the temperature part of the Permeance function for
-        the second component
-        :param include_zero: if True, points:
-         first_component_fraction = 0 first_component_permeance=0 for the first test_components
-         first_component_fraction = 1 second_component_permeance=0 for the second test_components
-         for each temperature are added to the measurements in order to improve obtained fits
-        :return: ProcessModel object
+        Fits the PervaporationFunctions of a Non-Ideal Process, see non_ideal_isothermal_process
+        and non_ideal_non_isothermal_process for the description of the parameters
+        :param isothermal: if True, the fits of a single diffusion curve measured at the initial feed temperature
+        are not corrected by the activation energies
+        :return: PervaporationFunctions of both components, facilitation rates, which are ratios of the initial
+        permeances to the values of the PervaporationFunctions, and the initial permeances in kg/(m2*h*kPa)
         """
         for curve in diffusion_curve_set.diffusion_curves:
             for c in curve.feed_compositions:
                 if c.type == CompositionType.molar:
                     c.to_weight(curve.mixture)
 
-        time: typing.List[float] = [
-            delta_hours * step for step in range(number_of_steps)
-        ]
-
-        partial_fluxes: typing.List[typing.Tuple[float, float]] = []
-
-        permeate_composition: typing.List[Composition] = []
-        feed_composition: typing.List[Composition] = [
-            conditions.initial_feed_composition.to_weight(self.mixture)
-        ]
-
-        feed_evaporation_heat: typing.List[float] = []
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
-        feed_mass: typing.List[float] = [conditions.initial_feed_amount]
-
-        measurements_first = Measurements.from_diffusion_curves_first(
-            diffusion_curve_set
-        )
-        measurements_second = Measurements.from_diffusion_curves_second(
-            diffusion_curve_set
+        pervaporation_function_first, pervaporation_function_second = (
+            self._find_permeance_fits(
+                diffusion_curve_set=diffusion_curve_set,
+                n_first=n_first,
+                m_first=m_first,
+                n_second=n_second,
+                m_second=m_second,
+                include_zero=include_zero
+                and len(diffusion_curve_set.diffusion_curves) > 1,
+            )
         )
 
         if len(diffusion_curve_set.diffusion_curves) == 1:
@@ -893,27 +2597,11 @@ class Pervaporation:
                 0
             ].feed_temperature
 
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=0,
-                include_zero=False,
-                component_index=0,
-            )
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=0,
-                include_zero=False,
-                component_index=1,
-            )
-
-            if (
-                pervaporation_function_temperature
+            if not (
+                isothermal
+                and pervaporation_function_temperature
                 == conditions.initial_feed_temperature
             ):
-                pass
-            else:
                 activation_energy_first = self.membrane.calculate_activation_energy(
                     self.mixture.first_component
                 )
@@ -940,32 +2628,19 @@ class Pervaporation:
                 pervaporation_function_first.b[0] = activation_energy_first / R
                 pervaporation_function_second.b[0] = activation_energy_second / R
 
-        else:
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=m_first,
-                include_zero=include_zero,
-                component_index=0,
-            )
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=m_second,
-                include_zero=include_zero,
-                component_index=1,
-            )
-
         if initial_permeances is None:
+            feed_composition = conditions.initial_feed_composition.to_weight(
+                self.mixture
+            ).p
             first_component_permeance = Permeance(
                 value=pervaporation_function_first(
-                    feed_composition[0].first, conditions.initial_feed_temperature
+                    feed_composition, conditions.initial_feed_temperature
                 )
             )
 
             second_component_permeance = Permeance(
                 value=pervaporation_function_second(
-                    feed_composition[0].first, conditions.initial_feed_temperature
+                    feed_composition, conditions.initial_feed_temperature
                 )
             )
 
@@ -977,10 +2652,6 @@ class Pervaporation:
                 to_units=Units.kg_m2_h_kPa, component=self.mixture.second_component
             )
 
-        permeances: typing.List[typing.Tuple[Permeance, Permeance]] = [
-            (first_component_permeance, second_component_permeance)
-        ]
-
         facilitation_rate_first = (
             first_component_permeance.value
             / pervaporation_function_first(
@@ -995,144 +2666,127 @@ class Pervaporation:
                 t=conditions.initial_feed_temperature,
             )
         )
+        return (
+            (pervaporation_function_first, pervaporation_function_second),
+            (facilitation_rate_first, facilitation_rate_second),
+            (first_component_permeance.value, second_component_permeance.value),
+        )
 
-        evaporation_heat_1 = (
-            self.mixture.first_component.get_vaporisation_heat(
-                conditions.initial_feed_temperature
-            )
-            / self.mixture.first_component.molecular_weight
-            * 1000
-        )
-        evaporation_heat_2 = (
-            self.mixture.second_component.get_vaporisation_heat(
-                conditions.initial_feed_temperature
-            )
-            / self.mixture.first_component.molecular_weight
-            * 1000
-        )
-        if conditions.permeate_temperature is None:
-            condensation_heat_1 = None
-            condensation_heat_2 = None
-            cooling_heat_1 = None
-            cooling_heat_2 = None
-
-        else:
-            condensation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    conditions.permeate_temperature
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            condensation_heat_2 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    conditions.permeate_temperature
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            cooling_heat_1 = self.mixture.first_component.get_cooling_heat(
-                conditions.permeate_temperature, conditions.initial_feed_temperature
-            )
-            cooling_heat_2 = self.mixture.second_component.get_cooling_heat(
-                conditions.permeate_temperature, conditions.initial_feed_temperature
-            )
-
-        for step in range(len(time)):
-
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=conditions.initial_feed_temperature,
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
-                )
-            )
-
-            permeate_composition.append(
-                Composition(
-                    p=partial_fluxes[step][0] / (sum(partial_fluxes[step])),
-                    type=CompositionType.weight,
-                )
-            )
-
-            d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
-            d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
-
-            feed_evaporation_heat.append(
-                evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
-            )
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
-            else:
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (cooling_heat_1 * d_mass_1 + cooling_heat_2 * d_mass_2)
-                    * (
-                        conditions.initial_feed_temperature
-                        - conditions.permeate_temperature
-                    )
-                )
-
-            feed_mass.append(feed_mass[step] - d_mass_1 - d_mass_2)
-
-            feed_composition.append(
-                Composition(
-                    p=(feed_composition[step].p * feed_mass[step] - d_mass_1)
-                    / feed_mass[step + 1],
-                    type=CompositionType.weight,
-                )
-            )
-            permeances.append(
-                (
-                    Permeance(
-                        value=pervaporation_function_first(
-                            x=feed_composition[step].first,
-                            t=conditions.initial_feed_temperature,
-                        )
-                        * facilitation_rate_first
-                    ),
-                    Permeance(
-                        value=pervaporation_function_second(
-                            x=feed_composition[step].first,
-                            t=conditions.initial_feed_temperature,
-                        )
-                        * facilitation_rate_second
-                    ),
-                ),
-            )
-
-        feed_composition.pop(-1)
-        feed_mass.pop(-1)
-        permeances.pop(-1)
-
-        return ProcessModel(
-            mixture=self.mixture,
-            membrane_name=self.membrane.name,
-            feed_temperature=[conditions.initial_feed_temperature] * number_of_steps,
-            feed_compositions=feed_composition,
-            permeate_composition=permeate_composition,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
-            feed_mass=feed_mass,
-            partial_fluxes=partial_fluxes,
-            permeances=permeances,
-            time=time,
-            feed_evaporation_heat=feed_evaporation_heat,
-            permeate_condensation_heat=permeate_condensation_heat,
-            initial_conditions=conditions,
-            permeance_fits=(
-                pervaporation_function_first,
-                pervaporation_function_second,
+    def _get_non_ideal_definition(
+        self,
+        permeance_fits: typing.Tuple[PervaporationFunction, PervaporationFunction],
+        facilitation_rates: typing.Tuple[float, float],
+        initial_permeances: typing.Tuple[float, float],
+        isothermal: bool,
+    ) -> _ProcessDefinition:
+        """
+        :param permeance_fits: PervaporationFunctions of both components
+        :param facilitation_rates: ratios of the initial permeances to the values of the PervaporationFunctions
+        :param initial_permeances: permeances of both components at the beginning of the process in kg/(m2*h*kPa)
+        :param isothermal: if True, the feed temperature is kept constant
+        :return: _ProcessDefinition of a Non-Ideal Process
+        """
+        pervaporation_function_first, pervaporation_function_second = permeance_fits
+        facilitation_rate_first, facilitation_rate_second = facilitation_rates
+        return _ProcessDefinition(
+            isothermal=isothermal,
+            initial_permeances=initial_permeances,
+            get_permeances=lambda composition, temperature: (
+                pervaporation_function_first(x=composition, t=temperature)
+                * facilitation_rate_first,
+                pervaporation_function_second(x=composition, t=temperature)
+                * facilitation_rate_second,
             ),
-            comments=(
-                f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
-                f"Non-ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
+            lagged_permeances=isothermal,
+            model_parameters=dict(
+                permeance_fits=permeance_fits,
+                comments=(
+                    f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
+                    f"Non-ideal Process Model"
+                    + datetime.now().strftime("%m/%d/%Y, %H:%M")
+                ),
+                membrane_path=self.membrane.path,
+            ),
+        )
+
+    def non_ideal_isothermal_process(
+        self,
+        conditions: Conditions,
+        diffusion_curve_set: DiffusionCurveSet,
+        number_of_steps: int,
+        delta_hours: float,
+        precision: typing.Optional[float] = 5e-5,
+        initial_permeances: typing.Optional[typing.Tuple[Permeance, Permeance]] = None,
+        n_first: typing.Optional[int] = None,
+        m_first: typing.Optional[int] = None,
+        n_second: typing.Optional[int] = None,
+        m_second: typing.Optional[int] = None,
+        include_zero: bool = False,
+        engine: str = ProcessEngine.euler,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+    ):
+        """
+        The function models Non-Ideal Isothermal Process
+        Based on a set of Diffusion curves measured at different temperatures;
+        The modelling could be also performed based on a single diffusion curve:
+        In that case the apparent activation energy of transport is considered constant
+        and is calculated for each component based on the IdealExperiments default_membranes provided for the Membrane.
+        :param conditions: Initial Conditions of the Process
+        :param diffusion_curve_set: A set of Diffusion curves picked for the Modelling form the Membrane
+        :param number_of_steps: Number of time steps for modelling
+        :param delta_hours: Size of each step in hours
+        :param precision: Precision in obtained permeate composition, by default is 5e-5
+        :param initial_permeances: Initial Permeances, should be stated if the Membranes swelling history is significant
+        :param n_first: Optional parameter,
+        indicates the order of the polynomial of the composition part of the Permeance function for the
+        first component
+        :param m_first: Optional parameter,
+        indicates the order of the polynomial of the temperature part of the Permeance function for
+        the first component
+        :param n_second: Optional parameter,
+        indicates the order of the polynomial of the composition part of the Permeance function for
+        the second component
+        :param m_second: Optional parameter,
+        indicates the order of the polynomial of the temperature part of the Permeance function for
+        the second component
+        :param include_zero: if True, points:
+         first_component_fraction = 0 first_component_permeance=0 for the first test_components
+         first_component_fraction = 1 second_component_permeance=0 for the second test_components
+         for each temperature are added to the measurements in order to improve obtained fits
+        :param engine: ProcessEngine.euler - explicit Euler steps (default),
+        ProcessEngine.adaptive - adaptive step integration of the mass balance
+        :param rtol: Relative tolerance of the adaptive engine
+        :param atol: Absolute tolerance of the adaptive engine
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used;
+        The last state of a terminated process corresponds to the point, where the condition is reached
+        :return: ProcessModel object
+        """
+        return self._model_process(
+            definition=self._get_non_ideal_definition(
+                *self._fit_non_ideal_permeances(
+                    conditions=conditions,
+                    diffusion_curve_set=diffusion_curve_set,
+                    isothermal=True,
+                    initial_permeances=initial_permeances,
+                    n_first=n_first,
+                    m_first=m_first,
+                    n_second=n_second,
+                    m_second=m_second,
+                    include_zero=include_zero,
+                ),
+                isothermal=True,
             ),
+            conditions=conditions,
+            number_of_steps=number_of_steps,
+            delta_hours=delta_hours,
+            precision=precision,
+            engine=engine,
+            rtol=rtol,
+            atol=atol,
+            stop_conditions=stop_conditions,
         )
 
     def non_ideal_non_isothermal_process(
@@ -1148,6 +2802,12 @@ class Pervaporation:
         n_second: typing.Optional[int] = None,
         m_second: typing.Optional[int] = None,
         include_zero: bool = False,
+        engine: str = ProcessEngine.euler,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+        checkpoint_path: typing.Optional[typing.Union[str, Path]] = None,
+        checkpoint_every: int = 1000,
     ) -> ProcessModel:
         """
         The function models Non-Ideal Non-Isothermal Process
@@ -1178,292 +2838,228 @@ class Pervaporation:
          first_component_fraction = 0 first_component_permeance=0 for the first test_components
          first_component_fraction = 1 second_component_permeance=0 for the second test_components
          for each temperature are added to the measurements in order to improve obtained fits
+        :param engine: ProcessEngine.euler - explicit Euler steps (default),
+        ProcessEngine.adaptive - adaptive step integration of the mass and heat balances
+        :param rtol: Relative tolerance of the adaptive engine
+        :param atol: Absolute tolerance of the adaptive engine
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used;
+        The last state of a terminated process corresponds to the point, where the condition is reached
+        :param checkpoint_path: path to the .npz file, where a ProcessCheckpoint is saved every checkpoint_every steps
+        of the euler engine, the process may be continued from the checkpoint with
+        resume_non_ideal_non_isothermal_process
+        :param checkpoint_every: number of steps between the checkpoints
         :return: ProcessModel object
         """
-        for curve in diffusion_curve_set.diffusion_curves:
-            for c in curve.feed_compositions:
-                if c.type == CompositionType.molar:
-                    c.to_weight(curve.mixture)
-
-        time: typing.List[float] = [
-            delta_hours * step for step in range(number_of_steps)
-        ]
-
-        feed_temperature: typing.List[float] = [conditions.initial_feed_temperature]
-
-        partial_fluxes: typing.List[typing.Tuple[float, float]] = []
-
-        permeate_composition: typing.List[Composition] = []
-
-        feed_composition: typing.List[Composition] = [
-            conditions.initial_feed_composition.to_weight(self.mixture)
-        ]
-
-        feed_evaporation_heat: typing.List[float] = []
-
-        permeate_condensation_heat: typing.List[typing.Optional[float]] = []
-
-        feed_mass: typing.List[float] = [conditions.initial_feed_amount]
-
-        measurements_first = Measurements.from_diffusion_curves_first(
-            diffusion_curve_set
+        permeance_fits, facilitation_rates, permeances = self._fit_non_ideal_permeances(
+            conditions=conditions,
+            diffusion_curve_set=diffusion_curve_set,
+            isothermal=False,
+            initial_permeances=initial_permeances,
+            n_first=n_first,
+            m_first=m_first,
+            n_second=n_second,
+            m_second=m_second,
+            include_zero=include_zero,
         )
-        measurements_second = Measurements.from_diffusion_curves_second(
-            diffusion_curve_set
+        if checkpoint_path is None:
+            return self._model_process(
+                definition=self._get_non_ideal_definition(
+                    permeance_fits, facilitation_rates, permeances, isothermal=False
+                ),
+                conditions=conditions,
+                number_of_steps=number_of_steps,
+                delta_hours=delta_hours,
+                precision=precision,
+                engine=engine,
+                rtol=rtol,
+                atol=atol,
+                stop_conditions=stop_conditions,
+            )
+        if engine != ProcessEngine.euler:
+            raise ValueError("Checkpoints are supported only by the euler engine")
+
+        return self._model_from_checkpoint(
+            checkpoint=ProcessCheckpoint(
+                step=0,
+                state=ProcessState.allocate(number_of_steps),
+                previous=None,
+                current=self._get_initial_step(conditions, permeances),
+                conditions=conditions,
+                number_of_steps=number_of_steps,
+                delta_hours=delta_hours,
+                precision=precision,
+                permeance_fits=permeance_fits,
+                facilitation_rates=facilitation_rates,
+                stop_conditions=stop_conditions,
+                checkpoint_every=checkpoint_every,
+            ),
+            checkpoint_path=checkpoint_path,
         )
 
-        if len(diffusion_curve_set.diffusion_curves) == 1:
-            pervaporation_function_temperature = diffusion_curve_set.diffusion_curves[
-                0
-            ].feed_temperature
-            activation_energy_first = self.membrane.calculate_activation_energy(
-                self.mixture.first_component
-            )
-            activation_energy_second = self.membrane.calculate_activation_energy(
-                self.mixture.second_component
-            )
-
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=0,
-                include_zero=False,
-                component_index=0,
-            )
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=0,
-                include_zero=False,
-                component_index=1,
-            )
-
-            pervaporation_function_first = pervaporation_function_first * numpy.exp(
-                -pervaporation_function_first.b[0] / pervaporation_function_temperature
-                + activation_energy_first / (R * pervaporation_function_temperature)
-            )
-
-            pervaporation_function_second = pervaporation_function_second * numpy.exp(
-                -pervaporation_function_second.b[0] / pervaporation_function_temperature
-                + activation_energy_second / (R * pervaporation_function_temperature)
-            )
-
-            pervaporation_function_first.b[0] = activation_energy_first / R
-            pervaporation_function_second.b[0] = activation_energy_second / R
-
-        else:
-            pervaporation_function_first = find_best_fit(
-                data=measurements_first,
-                n=n_first,
-                m=m_first,
-                include_zero=include_zero,
-                component_index=0,
-            )
-            pervaporation_function_second = find_best_fit(
-                data=measurements_second,
-                n=n_second,
-                m=m_second,
-                include_zero=include_zero,
-                component_index=1,
-            )
-
-        if initial_permeances is None:
-            first_component_permeance = Permeance(
-                value=pervaporation_function_first(
-                    feed_composition[0].p, conditions.initial_feed_temperature
-                )
-            )
-
-            second_component_permeance = Permeance(
-                value=pervaporation_function_second(
-                    feed_composition[0].p, conditions.initial_feed_temperature
-                )
-            )
-
-        else:
-            first_component_permeance = initial_permeances[0].convert(
-                to_units=Units.kg_m2_h_kPa, component=self.mixture.first_component
-            )
-            second_component_permeance = initial_permeances[1].convert(
-                to_units=Units.kg_m2_h_kPa, component=self.mixture.second_component
-            )
-
-        permeances: typing.List[typing.Tuple[Permeance, Permeance]] = [
-            (first_component_permeance, second_component_permeance)
-        ]
-
-        facilitation_rate_first = (
-            first_component_permeance.value
-            / pervaporation_function_first(
-                x=conditions.initial_feed_composition.first,
-                t=conditions.initial_feed_temperature,
-            )
-        )
-        facilitation_rate_second = (
-            second_component_permeance.value
-            / pervaporation_function_second(
-                x=conditions.initial_feed_composition.first,
-                t=conditions.initial_feed_temperature,
-            )
+    def resume_non_ideal_non_isothermal_process(
+        self,
+        checkpoint_path: typing.Union[str, Path],
+    ) -> ProcessModel:
+        """
+        Continues non_ideal_non_isothermal_process from a ProcessCheckpoint,
+        the result is identical to the result of the process, which was not interrupted;
+        The checkpoints are saved to the same path as before
+        :param checkpoint_path: path to the .npz file with the checkpoint
+        :return: ProcessModel object
+        """
+        return self._model_from_checkpoint(
+            checkpoint=ProcessCheckpoint.load(checkpoint_path),
+            checkpoint_path=checkpoint_path,
         )
 
-        for step in range(len(time)):
-
-            evaporation_heat_1 = (
-                self.mixture.first_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.first_component.molecular_weight
-                * 1000
-            )
-            evaporation_heat_2 = (
-                self.mixture.second_component.get_vaporisation_heat(
-                    feed_temperature[step]
-                )
-                / self.mixture.second_component.molecular_weight
-                * 1000
-            )
-
-            heat_capacity_1 = (
-                self.mixture.first_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.first_component.molecular_weight
-            )
-            heat_capacity_2 = (
-                self.mixture.second_component.get_specific_heat(feed_temperature[step])
-                / self.mixture.second_component.molecular_weight
-            )
-            feed_heat_capacity = (
-                feed_composition[step].first * heat_capacity_1
-                + feed_composition[step].second * heat_capacity_2
-            )
-
-            partial_fluxes.append(
-                self.calculate_partial_fluxes(
-                    feed_temperature=feed_temperature[step],
-                    composition=feed_composition[step],
-                    precision=precision,
-                    permeate_temperature=conditions.permeate_temperature,
-                    permeate_pressure=conditions.permeate_pressure,
-                    first_component_permeance=permeances[step][0],
-                    second_component_permeance=permeances[step][1],
-                )
-            )
-
-            permeate_composition.append(
-                Composition(
-                    p=partial_fluxes[step][0] / (sum(partial_fluxes[step])),
-                    type=CompositionType.weight,
-                )
-            )
-
-            d_mass_1 = partial_fluxes[step][0] * conditions.membrane_area * delta_hours
-            d_mass_2 = partial_fluxes[step][1] * conditions.membrane_area * delta_hours
-
-            if conditions.permeate_temperature is None:
-                permeate_condensation_heat.append(None)
-            else:
-                condensation_heat_1 = (
-                    self.mixture.first_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.first_component.molecular_weight
-                    * 1000
-                )
-                condensation_heat_2 = (
-                    self.mixture.second_component.get_vaporisation_heat(
-                        conditions.permeate_temperature
-                    )
-                    / self.mixture.second_component.molecular_weight
-                    * 1000
-                )
-
-                specific_heat_1 = self.mixture.first_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-                specific_heat_2 = self.mixture.second_component.get_cooling_heat(
-                    feed_temperature[step], conditions.permeate_temperature
-                )
-
-                permeate_condensation_heat.append(
-                    condensation_heat_1 * d_mass_1
-                    + condensation_heat_2 * d_mass_2
-                    + (specific_heat_1 * d_mass_1 + specific_heat_2 * d_mass_2)
-                    * (feed_temperature[step] - conditions.permeate_temperature)
-                )
-
-            feed_evaporation_heat.append(
-                evaporation_heat_1 * d_mass_1 + evaporation_heat_2 * d_mass_2
-            )
+    def _model_from_checkpoint(
+        self,
+        checkpoint: ProcessCheckpoint,
+        checkpoint_path: typing.Union[str, Path],
+    ) -> ProcessModel:
+        """
+        Calculates the steps of non_ideal_non_isothermal_process with the euler engine,
+        starting from the step of the checkpoint
+        :param checkpoint: ProcessCheckpoint with the state of the process and the parameters of the modelling
+        :param checkpoint_path: path to the .npz file, where the checkpoint is saved every checkpoint_every steps
+        :return: ProcessModel object
+        """
+        definition = self._get_non_ideal_definition(
+            permeance_fits=checkpoint.permeance_fits,
+            facilitation_rates=checkpoint.facilitation_rates,
+            initial_permeances=checkpoint.current.permeances,
+            isothermal=False,
+        )
 
-            feed_mass.append(feed_mass[step] - d_mass_1 - d_mass_2)
+        def save_checkpoint(buffer: _StepBuffer) -> None:
+            if (
+                buffer.step > checkpoint.step
+                and buffer.step % checkpoint.checkpoint_every == 0
+            ):
+                attr.evolve(
+                    checkpoint,
+                    step=buffer.step,
+                    previous=buffer.previous,
+                    current=buffer.current,
+                ).save(checkpoint_path)
+
+        state = checkpoint.state
+        for process_step in self._euler_steps(
+            definition=definition,
+            buffer=_StepBuffer(
+                current=checkpoint.current,
+                previous=checkpoint.previous,
+                step=checkpoint.step,
+            ),
+            conditions=checkpoint.conditions,
+            number_of_steps=checkpoint.number_of_steps,
+            delta_hours=checkpoint.delta_hours,
+            precision=checkpoint.precision,
+            stop_conditions=checkpoint.stop_conditions,
+            before_step=save_checkpoint,
+        ):
+            state.append(process_step)
+        return state.to_process_model(
+            mixture=self.mixture,
+            membrane_name=self.membrane.name,
+            conditions=checkpoint.conditions,
+            **definition.model_parameters,
+        )
 
-            feed_composition.append(
-                Composition(
-                    p=(feed_composition[step].p * feed_mass[step] - d_mass_1)
-                    / feed_mass[step + 1],
-                    type=CompositionType.weight,
-                )
+    def process_steps(
+        self,
+        process: str,
+        conditions: Conditions,
+        number_of_steps: int,
+        delta_hours: float,
+        sinks: typing.Optional[typing.Sequence[ProcessSink]] = None,
+        precision: typing.Optional[float] = 5e-5,
+        engine: str = ProcessEngine.euler,
+        number_of_nodes: int = 2000,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        stop_conditions: typing.Optional[StopConditions] = None,
+        **kwargs,
+    ) -> typing.Iterator[ProcessStep]:
+        """
+        Models a process and yields its steps one at a time, a step is yielded as soon as it is final;
+        With the euler engine only the last two steps are kept,
+        so the memory does not depend on the number of steps,
+        other engines calculate the whole process before the first step is yielded
+        :param process: name of the method of the process: "ideal_isothermal_process",
+        "ideal_non_isothermal_process", "non_ideal_isothermal_process" or "non_ideal_non_isothermal_process"
+        :param conditions: Conditions object, where initial conditions are specified
+        :param number_of_steps: Number of time steps to include in the model
+        :param delta_hours: The duration of each step in hours
+        :param sinks: ProcessSinks, which receive each step, the sinks are closed after the last step
+        :param precision: Precision in obtained permeate composition, by default is 5e-5
+        :param engine: ProcessEngine of the process
+        :param number_of_nodes: Number of composition nodes for the quadrature engine
+        :param rtol: Relative tolerance of the adaptive engine
+        :param atol: Absolute tolerance of the adaptive engine
+        :param stop_conditions: Conditions, that terminate the process,
+        if not specified StopConditions of the conditions are used
+        :param kwargs: parameters of the PervaporationFunctions of the non-ideal processes:
+        diffusion_curve_set, initial_permeances, n_first, m_first, n_second, m_second and include_zero
+        :return: generator of ProcessSteps
+        """
+        if process in ["ideal_isothermal_process", "ideal_non_isothermal_process"]:
+            definition = self._get_ideal_definition(
+                conditions,
+                isothermal=process == "ideal_isothermal_process",
+                **kwargs,
+            )
+        elif process in [
+            "non_ideal_isothermal_process",
+            "non_ideal_non_isothermal_process",
+        ]:
+            isothermal = process == "non_ideal_isothermal_process"
+            definition = self._get_non_ideal_definition(
+                *self._fit_non_ideal_permeances(
+                    conditions=conditions, isothermal=isothermal, **kwargs
+                ),
+                isothermal=isothermal,
             )
-
-            if conditions.temperature_program is None:
-                feed_temperature.append(
-                    feed_temperature[step]
-                    - (
-                        feed_evaporation_heat[step]
-                        / (feed_heat_capacity * feed_mass[step])
+        else:
+            raise ValueError("Process %s is not supported" % process)
+        if sinks is None:
+            sinks = []
+
+        if engine == ProcessEngine.euler:
+            steps = self._euler_steps(
+                definition=definition,
+                buffer=_StepBuffer(
+                    current=self._get_initial_step(
+                        conditions, definition.initial_permeances
                     )
-                )
-            else:
-                feed_temperature.append(
-                    conditions.temperature_program.program(time[step] + delta_hours)
-                )
-
-            permeances.append(
-                (
-                    Permeance(
-                        value=pervaporation_function_first(
-                            x=feed_composition[step + 1].first,
-                            t=feed_temperature[step + 1],
-                        )
-                        * facilitation_rate_first
-                    ),
-                    Permeance(
-                        value=pervaporation_function_second(
-                            x=feed_composition[step + 1].first,
-                            t=feed_temperature[step + 1],
-                        )
-                        * facilitation_rate_second
-                    ),
                 ),
+                conditions=conditions,
+                number_of_steps=number_of_steps,
+                delta_hours=delta_hours,
+                precision=precision,
+                stop_conditions=stop_conditions,
             )
-
-        feed_composition.pop(-1)
-        feed_mass.pop(-1)
-        permeances.pop(-1)
-        feed_temperature.pop(-1)
-
-        return ProcessModel(
-            mixture=self.mixture,
-            membrane_name=self.membrane.name,
-            feed_temperature=feed_temperature,
-            permeate_temperature=[conditions.permeate_temperature] * number_of_steps,
-            permeate_pressure=[conditions.permeate_pressure] * number_of_steps,
-            feed_compositions=feed_composition,
-            permeate_composition=permeate_composition,
-            feed_mass=feed_mass,
-            partial_fluxes=partial_fluxes,
-            permeances=permeances,
-            time=time,
-            feed_evaporation_heat=feed_evaporation_heat,
-            permeate_condensation_heat=permeate_condensation_heat,
-            initial_conditions=conditions,
-            permeance_fits=(
-                pervaporation_function_first,
-                pervaporation_function_second,
-            ),
-            comments=(
-                f"{self.membrane.name} {self.mixture.first_component.name} / {self.mixture.second_component.name}"
-                f"Non-ideal Process Model" + datetime.now().strftime("%m/%d/%Y, %H:%M")
-            ),
-            membrane_path=self.membrane.path,
-        )
+        else:
+            state = self._get_process_state(
+                definition=definition,
+                conditions=conditions,
+                number_of_steps=number_of_steps,
+                delta_hours=delta_hours,
+                precision=precision,
+                engine=engine,
+                number_of_nodes=number_of_nodes,
+                rtol=rtol,
+                atol=atol,
+                stop_conditions=stop_conditions,
+            )
+            steps = (state.get_step(step, conditions) for step in range(state.length))
+
+        try:
+            for process_step in steps:
+                for sink in sinks:
+                    sink.write(process_step)
+                yield process_step
+        finally:
+            for sink in sinks:
+                sink.close()
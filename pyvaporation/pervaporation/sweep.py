@@ -0,0 +1,257 @@
+import inspect
+import itertools
+import os
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+import attr
+import numpy
+import pandas
+
+from ..conditions import Conditions
+from ..diffusion_curve import DiffusionCurve
+from ..permeance import Units
+from ..process import ProcessModel
+from .pervaporation import Pervaporation
+
+# Parameters of the non-ideal methods, which define the fitted permeance functions
+FIT_PARAMETERS = [
+    "diffusion_curve_set",
+    "n_first",
+    "m_first",
+    "n_second",
+    "m_second",
+    "include_zero",
+]
+
+# Columns of the results of the methods, which model a process and which calculate a diffusion curve
+_PROCESS_COLUMNS = [
+    "time",
+    "feed_temperature",
+    "feed_mass",
+    "feed_composition",
+    "permeate_composition",
+    "partial_flux_1",
+    "partial_flux_2",
+    "permeance_1",
+    "permeance_2",
+]
+_DIFFUSION_CURVE_COLUMNS = [
+    "feed_temperature",
+    "feed_composition",
+    "partial_flux_1",
+    "partial_flux_2",
+    "permeance_1",
+    "permeance_2",
+]
+
+_worker_pervaporation: typing.Optional[Pervaporation] = None
+
+
+def _set_worker_pervaporation(pervaporation: Pervaporation) -> None:
+    """
+    Initializer of the workers, the Pervaporation is transferred once per worker
+    :param pervaporation: Pervaporation with the fitted permeance functions stored in its fit_cache
+    """
+    global _worker_pervaporation
+    _worker_pervaporation = pervaporation
+
+
+def _get_columns(
+    result: typing.Union[ProcessModel, DiffusionCurve],
+) -> typing.Dict[str, numpy.ndarray]:
+    """
+    :param result: ProcessModel or DiffusionCurve obtained with a method of Pervaporation
+    :return: mapping of the column names to the arrays of the result, compositions are weight fractions
+    """
+    if isinstance(result, ProcessModel):
+        permeances = result.permeances.convert(Units.kg_m2_h_kPa, result.mixture)
+        return {
+            "time": result.time,
+            "feed_temperature": result.feed_temperature,
+            "feed_mass": result.feed_mass,
+            "feed_composition": result.feed_compositions.first,
+            "permeate_composition": result.permeate_composition.first,
+            "partial_flux_1": result.partial_fluxes.first,
+            "partial_flux_2": result.partial_fluxes.second,
+            "permeance_1": permeances.first,
+            "permeance_2": permeances.second,
+        }
+    if isinstance(result, DiffusionCurve):
+        permeances = result.permeances.convert(Units.kg_m2_h_kPa, result.mixture)
+        size = len(result.feed_compositions)
+        return {
+            "feed_temperature": numpy.full(size, result.feed_temperature, dtype=float),
+            "feed_composition": result.feed_compositions.to_weight(
+                result.mixture
+            ).first,
+            "partial_flux_1": result.partial_fluxes.first,
+            "partial_flux_2": result.partial_fluxes.second,
+            "permeance_1": permeances.first,
+            "permeance_2": permeances.second,
+        }
+    raise ValueError("Results of type %s are not supported" % type(result).__name__)
+
+
+def _run(
+    pervaporation: Pervaporation,
+    method: str,
+    arguments: typing.Mapping[str, typing.Any],
+) -> typing.Dict[str, numpy.ndarray]:
+    """
+    :param pervaporation: Pervaporation
+    :param method: name of the method of Pervaporation
+    :param arguments: arguments of the method
+    :return: mapping of the column names to the arrays of the result
+    """
+    return _get_columns(getattr(pervaporation, method)(**arguments))
+
+
+def _find_permeance_fits(
+    pervaporation: Pervaporation,
+    method: str,
+    arguments: typing.Mapping[str, typing.Any],
+) -> None:
+    """
+    Fits the permeance functions of a non-ideal method with the same options as the method,
+    the functions are stored in the fit_cache of the pervaporation
+    :param pervaporation: Pervaporation
+    :param method: name of the non-ideal method of Pervaporation
+    :param arguments: arguments of the method
+    """
+    fit_arguments = {
+        name: arguments[name] for name in FIT_PARAMETERS if name in arguments
+    }
+    if method != "non_ideal_diffusion_curve":
+        # the processes fit a single diffusion curve without the zero points
+        fit_arguments["include_zero"] = (
+            fit_arguments.get("include_zero", False)
+            and len(fit_arguments["diffusion_curve_set"].diffusion_curves) > 1
+        )
+    pervaporation._find_permeance_fits(**fit_arguments)
+
+
+def _run_in_worker(
+    method: str, arguments: typing.Mapping[str, typing.Any]
+) -> typing.Dict[str, numpy.ndarray]:
+    return _run(_worker_pervaporation, method, arguments)
+
+
+def parameter_sweep(
+    pervaporation: Pervaporation,
+    method: str,
+    parameters: typing.Mapping[str, typing.Sequence[typing.Any]],
+    conditions: typing.Optional[Conditions] = None,
+    n_jobs: int = 1,
+    executor: typing.Optional[typing.Callable[..., Executor]] = None,
+    chunksize: typing.Optional[int] = None,
+    **kwargs,
+) -> pandas.DataFrame:
+    """
+    Runs a method of Pervaporation for each point of the Cartesian product of the parameters;
+    The parameters named after the fields of Conditions (membrane_area, initial_feed_temperature,
+    permeate_pressure etc.) replace the fields of the conditions, the rest are passed to the method;
+    For the non-ideal methods the permeance functions of each set of FIT_PARAMETERS are fitted in advance,
+    so that they are fitted once and transferred to the workers with the fit_cache,
+    the fit_cache is enlarged if it can not hold all the functions of the sweep
+    :param pervaporation: Pervaporation
+    :param method: name of the method of Pervaporation, which returns a ProcessModel or a DiffusionCurve
+    :param parameters: mapping of the parameter names to the sequences of the values
+    :param conditions: Conditions of the process, required if the method models a process
+    :param n_jobs: number of processes used for modelling, -1 means using all processors
+    :param executor: concurrent.futures.Executor class or factory used for modelling, overrides n_jobs;
+    It is called with the initializer and initargs, which transfer the Pervaporation once per worker,
+    e.g. ThreadPoolExecutor or partial(ProcessPoolExecutor, max_workers=4)
+    :param chunksize: number of the points sent to a worker at once,
+    by default the points are split into four chunks per worker of the process pool of n_jobs
+    and sent one by one to the workers of the executor
+    :param kwargs: arguments of the method, which are the same for all the points
+    :return: frame with a row for each point of each result; The columns are "run" - index of the point,
+    the parameters and the results: feed_temperature, feed_composition, partial_flux_1, partial_flux_2,
+    permeance_1, permeance_2 and, for the processes, time, feed_mass and permeate_composition;
+    Compositions are weight fractions of the first component, permeances are in kg/(m2*h*kPa)
+    """
+    if not hasattr(Pervaporation, method):
+        raise ValueError("Pervaporation has no method %s" % method)
+    method_parameters = inspect.signature(getattr(Pervaporation, method)).parameters
+    condition_fields = {field.name for field in attr.fields(Conditions)}
+    for name in parameters:
+        if name not in condition_fields and name not in method_parameters:
+            raise ValueError("%s is not a parameter of %s" % (name, method))
+    if conditions is None and any(name in condition_fields for name in parameters):
+        raise ValueError("Conditions should be specified to vary their fields")
+
+    names = list(parameters)
+    points = list(itertools.product(*[parameters[name] for name in names]))
+
+    tasks = []
+    for point in points:
+        arguments = dict(kwargs)
+        condition_values = {}
+        for name, value in zip(names, point):
+            if name in condition_fields:
+                condition_values[name] = value
+            else:
+                arguments[name] = value
+        if conditions is not None:
+            arguments["conditions"] = attr.evolve(conditions, **condition_values)
+        tasks.append(arguments)
+
+    if "diffusion_curve_set" in method_parameters:
+        fitted = {}
+        for arguments in tasks:
+            # the sets of diffusion curves are compared by identity
+            key = tuple(
+                (
+                    id(arguments.get(name))
+                    if name == "diffusion_curve_set"
+                    else arguments.get(name)
+                )
+                for name in FIT_PARAMETERS
+            )
+            fitted.setdefault(key, arguments)
+        # each set of FIT_PARAMETERS stores the functions of both components
+        pervaporation.fit_cache.maxsize = max(
+            pervaporation.fit_cache.maxsize, 2 * len(fitted)
+        )
+        for arguments in fitted.values():
+            _find_permeance_fits(pervaporation, method, arguments)
+
+    if len(tasks) == 0:
+        results = []
+    elif executor is not None or n_jobs != 1:
+        if executor is None:
+            max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+            executor = partial(ProcessPoolExecutor, max_workers=max_workers)
+            chunksize = chunksize or max(1, -(-len(tasks) // (4 * max_workers)))
+        with executor(
+            initializer=_set_worker_pervaporation, initargs=(pervaporation,)
+        ) as pool:
+            results = list(
+                pool.map(
+                    partial(_run_in_worker, method), tasks, chunksize=chunksize or 1
+                )
+            )
+    else:
+        results = [_run(pervaporation, method, arguments) for arguments in tasks]
+
+    frames = []
+    for index, (point, columns) in enumerate(zip(points, results)):
+        size = len(next(iter(columns.values())))
+        frame = {"run": numpy.full(size, index)}
+        for name, value in zip(names, point):
+            frame[name] = [value] * size
+        frame.update(columns)
+        frames.append(pandas.DataFrame(frame))
+    if len(frames) == 0:
+        return pandas.DataFrame(
+            columns=["run"]
+            + names
+            + (
+                _PROCESS_COLUMNS
+                if "conditions" in method_parameters
+                else _DIFFUSION_CURVE_COLUMNS
+            )
+        )
+    return pandas.concat(frames, ignore_index=True)
@@ -1,6 +1,5 @@
 import typing
 
-import matplotlib.pyplot as plt
 import numpy
 
 
@@ -20,6 +19,8 @@ def plot_graph(
     :param title: Title of the plot
     :return: shows the plot.
     """
+    # matplotlib is imported on demand, so that the modelling does not depend on it
+    import matplotlib.pyplot as plt
 
     legend = []
 
@@ -62,6 +63,8 @@ def plot_surface(
     :return: plots a 3D graph with or without scattered points
     """
     # TODO: docstring
+    import matplotlib.pyplot as plt
+
     fig = plt.figure()
     ax = fig.add_subplot(projection="3d")
 
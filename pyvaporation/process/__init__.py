@@ -1,3 +1,12 @@
 from .process import ProcessModel
+from .stream import (PROCESS_STEP_COLUMNS, FrameSink, ProcessSink, ProcessStep,
+                     RollingAggregator)
 
-__all__ = ["ProcessModel"]
+__all__ = [
+    "ProcessModel",
+    "ProcessStep",
+    "ProcessSink",
+    "FrameSink",
+    "RollingAggregator",
+    "PROCESS_STEP_COLUMNS",
+]
@@ -1,3 +1,4 @@
+import json
 import typing
 from datetime import datetime
 from pathlib import Path
@@ -8,10 +9,13 @@ import numpy
 import pandas
 
 from ..conditions import Conditions
+from ..diffusion_curve import (CompositionColumn, PartialFluxColumn,
+                               PermeanceColumn)
 from ..mixtures import Composition, Mixture, Mixtures
 from ..optimizer import PervaporationFunction
 from ..permeance import Permeance, Units
 from ..plotting import plot_graph
+from ..utils import StorageFormat, read_frame, write_frame
 
 PROCESS_MODEL_COLUMNS = [
     "membrane_name",
@@ -35,25 +39,50 @@ PROCESS_MODEL_COLUMNS = [
     "comment",
 ]
 
+PROCESS_MODEL_SCHEMA = {
+    "membrane_name": str,
+    "mixture": str,
+    "time": float,
+    "feed_mass": float,
+    "feed_temperature": float,
+    "permeate_temperature": float,
+    "permeate_pressure": float,
+    "composition": float,
+    "composition_type": str,
+    "permeate_composition": float,
+    "permeate_composition_type": str,
+    "partial_flux_1": float,
+    "partial_flux_2": float,
+    "permeance_1": float,
+    "permeance_2": float,
+    "units": str,
+    "feed_evaporation_heat": float,
+    "permeate_condensation_heat": float,
+    "comment": str,
+}
+
 
 @attr.s(auto_attribs=True)
 class ProcessModel:
     """
-    Clas for description, working with and storage of process models
+    Clas for description, working with and storage of process models;
+    Compositions, fluxes and permeances are stored as columns backed by NumPy arrays,
+    time, feed mass, temperature and evaporation heat - as arrays
+    solver_iterations - number of iterations of the permeate composition at each step, is not saved
     """
 
     mixture: Mixture
     membrane_name: str
-    feed_temperature: typing.List[float]
-    feed_compositions: typing.List[Composition]
-    permeate_composition: typing.List[Composition]
+    feed_temperature: numpy.ndarray
+    feed_compositions: CompositionColumn
+    permeate_composition: CompositionColumn
     permeate_temperature: typing.List[float]
     permeate_pressure: typing.List[float]
-    feed_mass: typing.List[float]
-    partial_fluxes: typing.List[typing.Tuple[float, float]]
-    permeances: typing.List[typing.Tuple[Permeance, Permeance]]
-    time: typing.List[float]
-    feed_evaporation_heat: typing.List[float]
+    feed_mass: numpy.ndarray
+    partial_fluxes: typing.Optional[PartialFluxColumn]
+    permeances: typing.Optional[PermeanceColumn]
+    time: numpy.ndarray
+    feed_evaporation_heat: numpy.ndarray
     permeate_condensation_heat: typing.List[typing.Optional[float]]
     initial_conditions: typing.Optional[Conditions] = None
     permeance_fits: typing.Optional[
@@ -61,6 +90,29 @@ class ProcessModel:
     ] = None
     comments: typing.Optional[str] = None
     membrane_path: typing.Optional[Path] = None
+    solver_iterations: typing.Optional[numpy.ndarray] = None
+
+    def __attrs_post_init__(self):
+        self.feed_temperature = numpy.asarray(self.feed_temperature, dtype=float)
+        self.feed_mass = numpy.asarray(self.feed_mass, dtype=float)
+        self.time = numpy.asarray(self.time, dtype=float)
+        self.feed_evaporation_heat = numpy.asarray(
+            self.feed_evaporation_heat, dtype=float
+        )
+        self.feed_compositions = CompositionColumn.from_compositions(
+            self.feed_compositions, self.mixture
+        )
+        self.permeate_composition = CompositionColumn.from_compositions(
+            self.permeate_composition, self.mixture
+        )
+        if self.partial_fluxes is not None:
+            self.partial_fluxes = PartialFluxColumn.from_partial_fluxes(
+                self.partial_fluxes
+            )
+        if self.permeances is not None:
+            self.permeances = PermeanceColumn.from_permeances(
+                self.permeances, self.mixture
+            )
 
     @staticmethod
     def _generate_process_path(membrane_path: typing.Union[str, Path]) -> Path:
@@ -80,37 +132,54 @@ class ProcessModel:
         return process_path
 
     @property
-    def get_separation_factor(self) -> typing.List[float]:
+    def get_separation_factor(self) -> numpy.ndarray:
         """
-        :return: List of separation Factors
+        :return: Array of separation Factors
         """
         feed = self.feed_compositions
         permeate = self.permeate_composition
-        return [
-            (permeate[i].first / permeate[i].second) / (feed[i].first / feed[i].second)
-            for i in range(len(feed))
-        ]
+        return (permeate.first / permeate.second) / (feed.first / feed.second)
 
     @property
-    def get_psi(self) -> typing.List[float]:
+    def get_psi(self) -> numpy.ndarray:
         """
-        :return: List of Pervaporation Separation Index (PSI) values
+        :return: Array of Pervaporation Separation Index (PSI) values
         """
-        separation_factor = self.get_separation_factor
-        total_flux = [
-            sum(self.partial_fluxes[i]) for i in range(len(self.partial_fluxes))
-        ]
-        return list(numpy.multiply(total_flux, numpy.subtract(separation_factor, 1)))
+        return self.partial_fluxes.total * (self.get_separation_factor - 1)
 
     @property
-    def get_selectivity(self) -> typing.List[float]:
+    def get_selectivity(self) -> numpy.ndarray:
+        """
+        :return: Array of Calculated selectivities
         """
-        :return: List of Calculated selectivities
+        return self.permeances.first / self.permeances.second
+
+    @staticmethod
+    def load_frame(
+        process_path: typing.Union[str, Path],
+        columns: typing.Optional[typing.List[str]] = None,
+    ) -> pandas.DataFrame:
         """
-        permeance = self.permeances
-        return [
-            permeance[i][0].value / permeance[i][1].value for i in range(len(permeance))
+        Reads the tabular data of a saved process model, the file of any StorageFormat is accepted
+        :param process_path: path to the process folder of a unified format
+        :param columns: names of the columns to read, all PROCESS_MODEL_COLUMNS are read if not specified
+        :return: frame with the process data
+        """
+        process_files = [
+            Path(process_path) / f"process_model.{storage_format}"
+            for storage_format in [
+                StorageFormat.csv,
+                StorageFormat.npz,
+                StorageFormat.parquet,
+                StorageFormat.feather,
+            ]
+            if (Path(process_path) / f"process_model.{storage_format}").exists()
         ]
+        if len(process_files) != 1:
+            raise FileExistsError(
+                "Distinct process model file is not found in %s" % process_path
+            )
+        return read_frame(process_files[0], columns=columns)
 
     @classmethod
     def load(cls, process_path: typing.Union[str, Path]) -> "ProcessModel":
@@ -122,7 +191,7 @@ class ProcessModel:
         if type(process_path) is not Path:
             process_path = Path(process_path)
 
-        process_frame = pandas.read_csv(process_path / "process_model.csv")
+        process_frame = cls.load_frame(process_path)
 
         pv_0_filenames = list(
             filter(
@@ -150,7 +219,10 @@ class ProcessModel:
         pv_0 = PervaporationFunction.load(pv_0_filenames[0])
         pv_1 = PervaporationFunction.load(pv_1_filenames[0])
 
-        if (process_path / "initial_conditions.ic").exists():
+        if (process_path / "initial_conditions.json").exists():
+            with open(process_path / "initial_conditions.json", "r") as file:
+                initial_conditions = Conditions.from_dict(json.load(file))
+        elif (process_path / "initial_conditions.ic").exists():
             initial_conditions = joblib.load(process_path / "initial_conditions.ic")
         else:
             initial_conditions = None
@@ -170,14 +242,11 @@ class ProcessModel:
             process_frame["partial_flux_1"].isna().mean() == 0
             and process_frame["partial_flux_2"].isna().mean() == 0
         ):
-            partial_fluxes = []
-            for i in range(len(process_frame)):
-                partial_fluxes.append(
-                    (
-                        process_frame["partial_flux_1"].iloc[i],
-                        process_frame["partial_flux_2"].iloc[i],
-                    )
+            partial_fluxes = PartialFluxColumn(
+                values=process_frame[["partial_flux_1", "partial_flux_2"]].to_numpy(
+                    dtype=float
                 )
+            )
         else:
             partial_fluxes = None
 
@@ -186,54 +255,38 @@ class ProcessModel:
             and process_frame["permeance_2"].isna().mean() == 0
             and process_frame["units"].isna().mean() == 0
         ):
-            permeances = []
-            for i in range(len(process_frame)):
-                permeances.append(
-                    (
-                        Permeance(
-                            value=process_frame["permeance_1"].iloc[i],
-                            units=process_frame["units"].iloc[0],
-                        ).convert(
-                            to_units=Units.kg_m2_h_kPa,
-                            component=mixture.first_component,
-                        ),
-                        Permeance(
-                            value=process_frame["permeance_2"].iloc[i],
-                            units=process_frame["units"].iloc[0],
-                        ).convert(
-                            to_units=Units.kg_m2_h_kPa,
-                            component=mixture.second_component,
-                        ),
-                    )
-                )
+            permeances = PermeanceColumn(
+                values=process_frame[["permeance_1", "permeance_2"]].to_numpy(
+                    dtype=float
+                ),
+                units=process_frame["units"].iloc[0],
+            ).convert(to_units=Units.kg_m2_h_kPa, mixture=mixture)
         else:
             permeances = None
 
         return cls(
             mixture=mixture,
             membrane_name=process_frame["membrane_name"].iloc[0],
-            feed_temperature=process_frame["feed_temperature"],
-            feed_compositions=[
-                Composition(
-                    p=process_frame["composition"].iloc[i],
-                    type=process_frame["composition_type"].iloc[i],
-                ).to_weight(mixture=mixture)
-                for i in range(len(process_frame))
-            ],
-            permeate_composition=[
-                Composition(
-                    p=process_frame["permeate_composition"].iloc[i],
-                    type=process_frame["permeate_composition_type"].iloc[i],
-                ).to_weight(mixture=mixture)
-                for i in range(len(process_frame))
-            ],
+            feed_temperature=process_frame["feed_temperature"].to_numpy(dtype=float),
+            feed_compositions=CompositionColumn.from_arrays(
+                values=process_frame["composition"].to_numpy(dtype=float),
+                types=process_frame["composition_type"].to_numpy(dtype=str),
+                mixture=mixture,
+            ),
+            permeate_composition=CompositionColumn.from_arrays(
+                values=process_frame["permeate_composition"].to_numpy(dtype=float),
+                types=process_frame["permeate_composition_type"].to_numpy(dtype=str),
+                mixture=mixture,
+            ),
             permeate_temperature=permeate_temperature,
             permeate_pressure=permeate_pressure,
-            feed_mass=process_frame["feed_mass"],
+            feed_mass=process_frame["feed_mass"].to_numpy(dtype=float),
             partial_fluxes=partial_fluxes,
             permeances=permeances,
-            time=process_frame["time"],
-            feed_evaporation_heat=process_frame["feed_evaporation_heat"],
+            time=process_frame["time"].to_numpy(dtype=float),
+            feed_evaporation_heat=process_frame["feed_evaporation_heat"].to_numpy(
+                dtype=float
+            ),
             permeate_condensation_heat=process_frame["permeate_condensation_heat"],
             initial_conditions=initial_conditions,
             permeance_fits=(pv_0, pv_1)
@@ -243,10 +296,16 @@ class ProcessModel:
             membrane_path=None,
         )
 
-    def save(self, membrane_path: typing.Union[str, Path] = membrane_path) -> None:
+    def save(
+        self,
+        membrane_path: typing.Union[str, Path] = membrane_path,
+        storage_format: str = StorageFormat.csv,
+    ) -> None:
         """
         Saves a ProcessModel object to a specified directory of a unified format
         :param membrane_path: path to the associated membrane
+        :param storage_format: StorageFormat of the process data,
+        for binary formats the permeance fits are saved as plain arrays and the initial conditions as json
         :return: saves the object
         """
         if type(membrane_path) is not Path:
@@ -259,23 +318,21 @@ class ProcessModel:
 
         process_frame = pandas.DataFrame(
             {
-                "feed_temperature": [t for t in self.feed_temperature],
-                "time": [t for t in self.time],
-                "composition": [c.first for c in self.feed_compositions],
-                "composition_type": [c.type for c in self.feed_compositions],
-                "permeate_composition": [c.first for c in self.permeate_composition],
-                "permeate_composition_type": [
-                    c.type for c in self.permeate_composition
-                ],
+                "feed_temperature": self.feed_temperature,
+                "time": self.time,
+                "composition": self.feed_compositions.first,
+                "composition_type": self.feed_compositions.type,
+                "permeate_composition": self.permeate_composition.first,
+                "permeate_composition_type": self.permeate_composition.type,
                 "permeate_temperature": [p_t for p_t in self.permeate_temperature],
                 "permeate_pressure": [p_p for p_p in self.permeate_pressure],
-                "feed_mass": [m for m in self.feed_mass],
-                "partial_flux_1": [f[0] for f in self.partial_fluxes],
-                "partial_flux_2": [f[1] for f in self.partial_fluxes],
-                "permeance_1": [p[0].value for p in self.permeances],
-                "permeance_2": [p[1].value for p in self.permeances],
-                "units": [p[0].units for p in self.permeances],
-                "feed_evaporation_heat": [h for h in self.feed_evaporation_heat],
+                "feed_mass": self.feed_mass,
+                "partial_flux_1": self.partial_fluxes.first,
+                "partial_flux_2": self.partial_fluxes.second,
+                "permeance_1": self.permeances.first,
+                "permeance_2": self.permeances.second,
+                "units": self.permeances.units,
+                "feed_evaporation_heat": self.feed_evaporation_heat,
                 "permeate_condensation_heat": [
                     c_h for c_h in self.permeate_condensation_heat
                 ],
@@ -284,23 +341,33 @@ class ProcessModel:
         process_frame["membrane_name"] = self.membrane_name
         process_frame["mixture"] = self.mixture.name
         process_frame["comment"] = self.comments
-        process_frame = process_frame[PROCESS_MODEL_COLUMNS]
-        process_frame.to_csv(process_path / "process_model.csv", index=False)
+        write_frame(
+            process_frame,
+            process_path / f"process_model.{storage_format}",
+            PROCESS_MODEL_SCHEMA,
+        )
 
+        suffix = "pv" if storage_format == StorageFormat.csv else StorageFormat.npz
         self.permeance_fits[0].save(
             (
                 process_path
-                / f"pervaporation_function_0_{self.mixture.first_component.name}.pv"
+                / f"pervaporation_function_0_{self.mixture.first_component.name}.{suffix}"
             )
         )
         self.permeance_fits[1].save(
             (
                 process_path
-                / f"pervaporation_function_1_{self.mixture.second_component.name}.pv"
+                / f"pervaporation_function_1_{self.mixture.second_component.name}.{suffix}"
             )
         )
 
-        joblib.dump(self.initial_conditions, (process_path / "initial_conditions.ic"))
+        if storage_format == StorageFormat.csv:
+            joblib.dump(
+                self.initial_conditions, (process_path / "initial_conditions.ic")
+            )
+        elif self.initial_conditions is not None:
+            with open(process_path / "initial_conditions.json", "w") as file:
+                json.dump(self.initial_conditions.to_dict(), file)
 
     def plot(self, y: typing.List, y_label: str = "", curve: bool = 1):
         """
@@ -0,0 +1,213 @@
+import typing
+from collections import deque
+from pathlib import Path
+
+import attr
+import numpy
+import pandas
+
+from ..utils import StorageFormat, get_storage_format
+
+PROCESS_STEP_COLUMNS = [
+    "time",
+    "feed_mass",
+    "feed_temperature",
+    "feed_composition",
+    "permeate_composition",
+    "partial_flux_1",
+    "partial_flux_2",
+    "permeance_1",
+    "permeance_2",
+    "feed_evaporation_heat",
+    "permeate_condensation_heat",
+    "iterations",
+]
+
+
+@attr.s(auto_attribs=True)
+class ProcessStep:
+    """
+    State of a process at the beginning of a step and the heats of the step
+    :param time: process time, hours
+    :param feed_composition: weight fraction of the first component in feed
+    :param feed_mass: feed mass, kg
+    :param feed_temperature: feed temperature, K
+    :param partial_fluxes: partial fluxes of both components, kg/(m2*h)
+    :param permeances: permeances of both components, kg/(m2*h*kPa)
+    :param permeate_composition: weight fraction of the first component in permeate
+    :param feed_evaporation_heat: heat of the feed evaporation during the step, kJ
+    :param permeate_condensation_heat: heat of the permeate condensation during the step, kJ,
+    None if the permeate temperature is not specified
+    :param iterations: number of iterations of the permeate composition
+    """
+
+    time: float
+    feed_composition: float
+    feed_mass: float
+    feed_temperature: float
+    partial_fluxes: typing.Tuple[float, float]
+    permeances: typing.Tuple[float, float]
+    permeate_composition: float
+    feed_evaporation_heat: float
+    permeate_condensation_heat: typing.Optional[float] = None
+    iterations: int = 0
+
+    def to_dict(self) -> typing.Dict[str, float]:
+        """
+        :return: mapping of PROCESS_STEP_COLUMNS to the values of the step,
+        the missing condensation heat is NaN
+        """
+        return {
+            "time": self.time,
+            "feed_mass": self.feed_mass,
+            "feed_temperature": self.feed_temperature,
+            "feed_composition": self.feed_composition,
+            "permeate_composition": self.permeate_composition,
+            "partial_flux_1": self.partial_fluxes[0],
+            "partial_flux_2": self.partial_fluxes[1],
+            "permeance_1": self.permeances[0],
+            "permeance_2": self.permeances[1],
+            "feed_evaporation_heat": self.feed_evaporation_heat,
+            "permeate_condensation_heat": (
+                numpy.nan
+                if self.permeate_condensation_heat is None
+                else self.permeate_condensation_heat
+            ),
+            "iterations": self.iterations,
+        }
+
+
+class ProcessSink:
+    """
+    Base class of the receivers of the process steps, see Pervaporation.process_steps
+    """
+
+    def write(self, step: ProcessStep) -> None:
+        """
+        Receives a step of the process
+        :param step: ProcessStep
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Is called after the last step of the process
+        """
+
+
+@attr.s(auto_attribs=True)
+class FrameSink(ProcessSink):
+    """
+    Appends the process steps with PROCESS_STEP_COLUMNS to a .csv or a .parquet file,
+    the steps are written in chunks, the .parquet files require pyarrow to be installed
+    :param path: path to the file, an existing file is overwritten
+    :param chunk_size: number of the steps kept in memory before they are written
+    """
+
+    path: Path = attr.ib(converter=Path)
+    chunk_size: int = 1000
+    _rows: typing.List[typing.Dict[str, float]] = attr.ib(
+        factory=list, init=False, repr=False
+    )
+    _written: bool = attr.ib(default=False, init=False, repr=False)
+    _writer: typing.Any = attr.ib(default=None, init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        if get_storage_format(self.path) not in [
+            StorageFormat.csv,
+            StorageFormat.parquet,
+        ]:
+            raise ValueError("Steps can not be appended to %s" % self.path)
+
+    def write(self, step: ProcessStep) -> None:
+        self._rows.append(step.to_dict())
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the steps kept in memory to the file
+        """
+        if not self._rows:
+            return
+        frame = pandas.DataFrame(self._rows, columns=PROCESS_STEP_COLUMNS)
+        self._rows = []
+        if get_storage_format(self.path) == StorageFormat.csv:
+            frame.to_csv(
+                self.path,
+                mode="a" if self._written else "w",
+                header=not self._written,
+                index=False,
+            )
+        else:
+            import pyarrow
+            import pyarrow.parquet
+
+            table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+            if self._writer is None:
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        self._written = True
+
+    def close(self) -> None:
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+@attr.s(auto_attribs=True)
+class RollingAggregator(ProcessSink):
+    """
+    Accumulates the totals of a process and the averages over the last steps
+    :param window: number of the last steps used for the averages
+    """
+
+    window: int = 100
+    count: int = attr.ib(default=0, init=False)
+    feed_evaporation_heat: float = attr.ib(default=0.0, init=False)
+    permeate_condensation_heat: typing.Optional[float] = attr.ib(
+        default=None, init=False
+    )
+    minimum_feed_temperature: float = attr.ib(default=numpy.inf, init=False)
+    maximum_feed_temperature: float = attr.ib(default=-numpy.inf, init=False)
+    last: typing.Optional[ProcessStep] = attr.ib(default=None, init=False)
+    _total_fluxes: typing.Deque[float] = attr.ib(init=False, repr=False)
+    _permeate_compositions: typing.Deque[float] = attr.ib(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._total_fluxes = deque(maxlen=self.window)
+        self._permeate_compositions = deque(maxlen=self.window)
+
+    def write(self, step: ProcessStep) -> None:
+        self.count += 1
+        self.feed_evaporation_heat += step.feed_evaporation_heat
+        if step.permeate_condensation_heat is not None:
+            self.permeate_condensation_heat = (
+                self.permeate_condensation_heat or 0.0
+            ) + step.permeate_condensation_heat
+        self.minimum_feed_temperature = min(
+            self.minimum_feed_temperature, step.feed_temperature
+        )
+        self.maximum_feed_temperature = max(
+            self.maximum_feed_temperature, step.feed_temperature
+        )
+        self._total_fluxes.append(step.partial_fluxes[0] + step.partial_fluxes[1])
+        self._permeate_compositions.append(step.permeate_composition)
+        self.last = step
+
+    @property
+    def mean_total_flux(self) -> float:
+        """
+        Returns the average total flux over the last steps, kg/(m2*h)
+        """
+        return float(numpy.mean(self._total_fluxes)) if self.count else numpy.nan
+
+    @property
+    def mean_permeate_composition(self) -> float:
+        """
+        Returns the average weight fraction of the first component in permeate over the last steps
+        """
+        return (
+            float(numpy.mean(self._permeate_compositions)) if self.count else numpy.nan
+        )
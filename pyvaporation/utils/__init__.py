@@ -1,3 +1,4 @@
+from .storage import StorageFormat, get_storage_format, read_frame, write_frame
 from .utils import (HeatCapacityConstants, NRTLParameters, R,
                     VaporPressureConstants, VPConstantsType)
 
@@ -7,4 +8,8 @@ __all__ = [
     "NRTLParameters",
     "HeatCapacityConstants",
     "VPConstantsType",
+    "StorageFormat",
+    "get_storage_format",
+    "read_frame",
+    "write_frame",
 ]
@@ -0,0 +1,123 @@
+import typing
+from pathlib import Path
+
+import numpy
+import pandas
+
+
+class StorageFormat:
+    """
+    Formats of the files with tabular data;
+    csv is the default human-readable format,
+    npz requires only numpy, parquet and feather require pyarrow to be installed
+    """
+
+    csv: str = "csv"
+    npz: str = "npz"
+    parquet: str = "parquet"
+    feather: str = "feather"
+
+
+def get_storage_format(path: typing.Union[str, Path]) -> str:
+    """
+    :param path: path to the file
+    :return: StorageFormat defined by the suffix of the file
+    """
+    storage_format = Path(path).suffix.lstrip(".").lower()
+    if storage_format not in [
+        StorageFormat.csv,
+        StorageFormat.npz,
+        StorageFormat.parquet,
+        StorageFormat.feather,
+    ]:
+        raise ValueError("Storage format of %s is not supported" % path)
+    return storage_format
+
+
+def _apply_schema(
+    frame: pandas.DataFrame, schema: typing.Mapping[str, type]
+) -> pandas.DataFrame:
+    """
+    Casts the columns of the frame to the types of the schema, missing values are kept as NaN
+    :param frame: frame with the columns of the schema
+    :param schema: mapping of the column names to float or str
+    :return: frame with typed columns in the order of the schema
+    """
+    columns = {}
+    for name, column_type in schema.items():
+        if column_type is float:
+            columns[name] = pandas.to_numeric(frame[name], errors="raise").astype(float)
+        else:
+            columns[name] = (
+                frame[name]
+                .map(lambda x: numpy.nan if pandas.isna(x) else str(x))
+                .astype(object)
+            )
+    return pandas.DataFrame(columns)
+
+
+def write_frame(
+    frame: pandas.DataFrame,
+    path: typing.Union[str, Path],
+    schema: typing.Mapping[str, type],
+) -> None:
+    """
+    Writes the frame to a file of the StorageFormat defined by the suffix of the path
+    :param frame: frame with the columns of the schema
+    :param path: path to the file
+    :param schema: mapping of the column names to float or str
+    """
+    storage_format = get_storage_format(path)
+    if storage_format == StorageFormat.csv:
+        frame[list(schema)].to_csv(path, index=False)
+        return
+
+    frame = _apply_schema(frame, schema)
+    if storage_format == StorageFormat.npz:
+        numpy.savez(
+            path,
+            **{
+                name: (
+                    frame[name].to_numpy(dtype=float)
+                    if column_type is float
+                    else frame[name].fillna("").to_numpy(dtype=str)
+                )
+                for name, column_type in schema.items()
+            },
+        )
+    elif storage_format == StorageFormat.parquet:
+        frame.to_parquet(path, index=False)
+    else:
+        frame.to_feather(path)
+
+
+def read_frame(
+    path: typing.Union[str, Path],
+    columns: typing.Optional[typing.List[str]] = None,
+) -> pandas.DataFrame:
+    """
+    Reads the frame from a file of the StorageFormat defined by the suffix of the path,
+    in npz files empty strings are read as missing values
+    :param path: path to the file
+    :param columns: names of the columns to read, all the columns are read if not specified
+    :return: frame
+    """
+    storage_format = get_storage_format(path)
+    if storage_format == StorageFormat.csv:
+        frame = pandas.read_csv(path, usecols=columns)
+        return frame if columns is None else frame[columns]
+    elif storage_format == StorageFormat.npz:
+        with numpy.load(path, allow_pickle=False) as data:
+            if columns is None:
+                columns = list(data.keys())
+            frame = {}
+            for name in columns:
+                column = data[name]
+                if column.dtype.kind == "U":
+                    column = pandas.Series(column, dtype=object).replace("", numpy.nan)
+                frame[name] = column
+        return pandas.DataFrame(frame)
+    elif storage_format == StorageFormat.parquet:
+        return pandas.read_parquet(path, columns=columns)
+    else:
+        return pandas.read_feather(path, columns=columns)
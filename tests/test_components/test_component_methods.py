@@ -1,4 +1,7 @@
-from pyvaporation.components import Component
+import numpy
+from pytest import raises
+
+from pyvaporation.components import Component, PropertyTable
 from pyvaporation.utils import HeatCapacityConstants, VaporPressureConstants
 
 vapor_pressure_constants_antoine = VaporPressureConstants(
@@ -127,3 +130,103 @@ def test_get_cooling_heat():
     assert abs(test_component.get_cooling_heat(333, 273) - 2019.442222) < 2.5e-1
     assert abs(test_component.get_cooling_heat(323, 273) - 1681.011314) < 2.5e-1
     assert abs(test_component.get_cooling_heat(313, 273) - 1343.342474) < 2.5e-1
+
+
+def test_array_properties():
+    temperatures = numpy.array([293.15, 313.15, 333.15, 353.15])
+
+    for component in [test_component, test_component_2]:
+        assert isinstance(component.get_vapor_pressure(313.15), float)
+        vapor_pressures = component.get_vapor_pressure(temperatures)
+        vaporisation_heats = component.get_vaporisation_heat(temperatures)
+        specific_heats = component.get_specific_heat(temperatures)
+        cooling_heats = component.get_cooling_heat(temperatures, 273.15)
+        for i in range(len(temperatures)):
+            assert vapor_pressures[i] == component.get_vapor_pressure(temperatures[i])
+            assert vaporisation_heats[i] == component.get_vaporisation_heat(
+                temperatures[i]
+            )
+            assert specific_heats[i] == component.get_specific_heat(temperatures[i])
+            assert cooling_heats[i] == component.get_cooling_heat(
+                temperatures[i], 273.15
+            )
+
+
+def test_tabulated_properties():
+    temperatures = numpy.linspace(280, 370, 101)
+
+    for component in [test_component, test_component_2]:
+        tabulated = component.tabulate(273.15, 373.15, rtol=1e-9)
+        assert tabulated == component
+        assert tabulated.tables.error <= 1e-9
+        for name in [
+            "get_vapor_pressure",
+            "get_vaporisation_heat",
+            "get_specific_heat",
+        ]:
+            exact = getattr(component, name)
+            approximation = getattr(tabulated, name)
+            for t in temperatures:
+                assert abs(approximation(t) / exact(t) - 1) < 1e-9
+            assert approximation(400.0) == exact(400.0)
+            values = approximation(temperatures)
+            assert numpy.allclose(
+                values, [approximation(t) for t in temperatures], rtol=1e-14, atol=0
+            )
+            assert numpy.max(numpy.abs(values / exact(temperatures) - 1)) < 1e-9
+            mixed_temperatures = numpy.array([[250.0, 300.0], [350.0, 400.0]])
+            mixed_values = approximation(mixed_temperatures)
+            assert mixed_values.shape == (2, 2)
+            assert mixed_values[0, 0] == exact(250.0)
+            assert mixed_values[1, 1] == exact(400.0)
+            assert abs(mixed_values[0, 1] / approximation(300.0) - 1) < 1e-14
+            for temperature in [
+                numpy.float32(300.0),
+                numpy.int64(300),
+                numpy.asarray(300.0),
+            ]:
+                assert isinstance(approximation(temperature), float)
+                assert approximation(temperature) == approximation(300.0)
+
+        table = tabulated.tables.vapor_pressure
+        assert table(250) == component.get_vapor_pressure(250.0)
+        assert table(400) == component.get_vapor_pressure(400.0)
+        dense_temperatures = numpy.linspace(273.15, 373.15, 100001)
+        values = [table(t) for t in dense_temperatures]
+        assert (
+            numpy.max(
+                numpy.abs(values / component.get_vapor_pressure(dense_temperatures) - 1)
+            )
+            <= 2 * table.error
+        )
+
+    with raises(ValueError):
+        PropertyTable.build(numpy.exp, 373.15, 273.15)
+
+
+def test_vapor_pressure_constants_type():
+    component = Component(
+        name="H2O",
+        molecular_weight=18.02,
+        vapour_pressure_constants=vapor_pressure_constants_antoine,
+        heat_capacity_constants=heat_capacity_constants,
+    )
+    component.vapour_pressure_constants = vapor_pressure_constants_frost
+    assert component.get_vapor_pressure(313.15) == test_component_2.get_vapor_pressure(
+        313.15
+    )
+    assert component.get_vaporisation_heat(
+        313.15
+    ) == test_component_2.get_vaporisation_heat(313.15)
+
+    unknown_constants = VaporPressureConstants(a=16.5191, b=-3937.6553, c=-190231.9062)
+    unknown_constants.type = "unknown"
+    with raises(ValueError):
+        component.vapour_pressure_constants = unknown_constants
+    with raises(ValueError):
+        Component(
+            name="H2O",
+            molecular_weight=18.02,
+            vapour_pressure_constants=unknown_constants,
+            heat_capacity_constants=heat_capacity_constants,
+        )
@@ -2,7 +2,6 @@ from pyvaporation.components import Components
 
 
 def test_constants_h2o():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1115/1.3687121"""
 
     assert abs(Components.H2O.get_vapor_pressure(313) - 7.31934) < 1e-4
@@ -17,7 +16,6 @@ def test_constants_h2o():
 
 
 def test_constants_meoh():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1016/0021-9614(75)90267-0"""
 
     assert abs(Components.MeOH.get_vapor_pressure(313) - 35.1986) < 1e-4
@@ -32,7 +30,6 @@ def test_constants_meoh():
 
 
 def test_constants_etoh():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1016/0021-9614(75)90267-0"""
 
     assert abs(Components.EtOH.get_vapor_pressure(313) - 17.7708) < 1e-4
@@ -48,7 +45,6 @@ def test_constants_etoh():
 
 
 def test_constants_ipoh():
-
     """Antoine Pressure Constants Calculated from https://doi.org/10.1016/j.fluid.2015.09.052"""
 
     assert abs(Components.iPOH.get_vapor_pressure(313) - 13.7388) < 1e-4
@@ -63,7 +59,6 @@ def test_constants_ipoh():
 
 
 def test_constants_dme():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1021/ie50448a022"""
 
     assert abs(Components.DME.get_vapor_pressure(313) - 18.4210) < 1e-4
@@ -78,7 +73,6 @@ def test_constants_dme():
 
 
 def test_constants_dmc():
-
     """Antoine Pressure Constants Calculated from https://doi.org/10.1016/j.fluid.2011.08.007"""
 
     assert abs(Components.DMC.get_vapor_pressure(313) - 14.6761) < 1e-4
@@ -93,7 +87,6 @@ def test_constants_dmc():
 
 
 def test_constants_mtbe():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1135/cccc19691317"""
 
     assert abs(Components.MTBE.get_vapor_pressure(313) - 60.1905) < 1e-4
@@ -108,7 +101,6 @@ def test_constants_mtbe():
 
 
 def test_constants_etbe():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1135/cccc19691317"""
 
     assert abs(Components.ETBE.get_vapor_pressure(313) - 31.2979) < 1e-4
@@ -123,7 +115,6 @@ def test_constants_etbe():
 
 
 def test_constants_cyclohexane():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1039/tf9686400637"""
 
     assert abs(Components.CycloHexane.get_vapor_pressure(313) - 24.6260) < 1e-4
@@ -140,7 +131,6 @@ def test_constants_cyclohexane():
 
 
 def test_constants_benzene():
-
     """Antoine Pressure Constants Calculated from https://doi.org/10.1002/9781118477304.app2"""
 
     assert abs(Components.Benzene.get_vapor_pressure(313) - 24.3752) < 1e-4
@@ -155,7 +145,6 @@ def test_constants_benzene():
 
 
 def test_constants_toluene():
-
     """Antoine Pressure Constants Calculated from https://doi.org/10.1002/9781118477304.app2"""
 
     assert abs(Components.Toluene.get_vapor_pressure(313) - 7.8949) < 1e-4
@@ -170,7 +159,6 @@ def test_constants_toluene():
 
 
 def test_constants_acetic_acid():
-
     """Antoine Pressure Constants Calculated from https://dx.doi.org/10.1021/je60004a009"""
 
     assert abs(Components.AceticAcid.get_vapor_pressure(313) - 4.68410) < 1e-4
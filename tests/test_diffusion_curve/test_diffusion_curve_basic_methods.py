@@ -1,10 +1,12 @@
 from pathlib import Path
 
-from pytest import fixture
+from pytest import fixture, raises
 
+from pyvaporation.diffusion_curve import (CompositionColumn, DiffusionCurve,
+                                          PartialFluxColumn, PermeanceColumn)
 from pyvaporation.membrane import Membrane
-from pyvaporation.mixtures import Composition
-from pyvaporation.permeance import Permeance
+from pyvaporation.mixtures import Composition, CompositionType
+from pyvaporation.permeance import Permeance, Units
 
 
 @fixture
@@ -96,3 +98,131 @@ def test_get_selectivity(diffusion_curve):
 
     for i in range(len(diffusion_curve.get_selectivity)):
         assert (diffusion_curve.get_selectivity[i] - validation_selectivity[i]) < 1e-2
+
+
+def test_columnar_storage(diffusion_curve):
+    assert isinstance(diffusion_curve.feed_compositions, CompositionColumn)
+    assert isinstance(diffusion_curve.partial_fluxes, PartialFluxColumn)
+    assert isinstance(diffusion_curve.permeances, PermeanceColumn)
+    assert diffusion_curve.partial_fluxes.values.shape == (len(diffusion_curve), 2)
+
+    compositions = list(diffusion_curve.feed_compositions)
+    partial_fluxes = list(diffusion_curve.partial_fluxes)
+    permeances = list(diffusion_curve.permeances)
+    assert all(isinstance(c, Composition) for c in compositions)
+    assert all(type(f[0]) == float for f in partial_fluxes)
+    assert all(isinstance(p[1], Permeance) for p in permeances)
+    assert diffusion_curve.feed_compositions[1:] == compositions[1:]
+    assert diffusion_curve.permeances == permeances
+
+    curve = DiffusionCurve(
+        mixture=diffusion_curve.mixture,
+        membrane_name=diffusion_curve.membrane_name,
+        feed_temperature=diffusion_curve.feed_temperature,
+        feed_compositions=[compositions[0].to_molar(diffusion_curve.mixture)]
+        + compositions[1:],
+        permeances=[
+            (
+                p[0].convert(Units.SI, diffusion_curve.mixture.first_component),
+                p[1].convert(Units.SI, diffusion_curve.mixture.second_component),
+            )
+            for p in permeances
+        ],
+    )
+    assert curve.feed_compositions.type == CompositionType.weight
+    assert curve.permeances.units == Units.kg_m2_h_kPa
+    for i in range(len(curve)):
+        assert abs(curve.feed_compositions[i].first - compositions[i].first) < 1e-12
+        assert abs(curve.permeances[i][0].value - permeances[i][0].value) < 1e-12
+        assert abs(curve.partial_fluxes[i][1] - partial_fluxes[i][1]) < 1e-9
+
+
+def test_lazy_permeances(diffusion_curve):
+    curve = DiffusionCurve(
+        mixture=diffusion_curve.mixture,
+        membrane_name=diffusion_curve.membrane_name,
+        feed_temperature=diffusion_curve.feed_temperature,
+        feed_compositions=diffusion_curve.feed_compositions,
+        partial_fluxes=diffusion_curve.partial_fluxes,
+    )
+    assert curve._permeances is None
+    assert curve.permeate_composition == diffusion_curve.permeate_composition
+    assert curve._permeances is None
+
+    permeances = curve.permeances
+    assert curve.permeances is permeances
+    for i in range(len(curve)):
+        assert (
+            abs(permeances[i][0].value - diffusion_curve.permeances[i][0].value) < 1e-9
+        )
+
+    curve.permeances = [(Permeance(p[0].value * 2), p[1]) for p in permeances]
+    assert curve._partial_fluxes is None
+    for i in range(len(curve)):
+        assert (
+            abs(curve.partial_fluxes[i][0] - 2 * diffusion_curve.partial_fluxes[i][0])
+            < 1e-9
+        )
+
+
+def test_equality_does_not_depend_on_access(diffusion_curve):
+    def get_curve():
+        return DiffusionCurve(
+            mixture=diffusion_curve.mixture,
+            membrane_name=diffusion_curve.membrane_name,
+            feed_temperature=diffusion_curve.feed_temperature,
+            feed_compositions=list(diffusion_curve.feed_compositions),
+            partial_fluxes=list(diffusion_curve.partial_fluxes),
+        )
+
+    curve = get_curve()
+    other_curve = get_curve()
+    assert curve.permeances is not None
+    assert other_curve._permeances is None
+    assert curve == other_curve
+    assert other_curve == curve
+
+    other_curve.partial_fluxes = [
+        (fluxes[0] * 2, fluxes[1]) for fluxes in curve.partial_fluxes
+    ]
+    assert curve != other_curve
+
+
+def test_column_list_api(diffusion_curve):
+    compositions = list(diffusion_curve.feed_compositions)
+    partial_fluxes = list(diffusion_curve.partial_fluxes)
+    permeances = list(diffusion_curve.permeances)
+    curve = DiffusionCurve(
+        mixture=diffusion_curve.mixture,
+        membrane_name=diffusion_curve.membrane_name,
+        feed_temperature=diffusion_curve.feed_temperature,
+        feed_compositions=compositions[:-1],
+        partial_fluxes=partial_fluxes[:-1],
+        permeances=permeances[:-1],
+        comments=diffusion_curve.comments,
+    )
+    curve.feed_compositions.append(compositions[-1])
+    curve.partial_fluxes.append(partial_fluxes[-1])
+    curve.permeances.append(permeances[-1])
+    assert curve == diffusion_curve
+
+    curve.feed_compositions.insert(0, compositions[-1])
+    curve.partial_fluxes[0] = (0.5, 0.25)
+    del curve.permeances[0]
+    assert curve.feed_compositions == [compositions[-1]] + compositions
+    assert curve.partial_fluxes == [(0.5, 0.25)] + partial_fluxes[1:]
+    assert curve.permeances == permeances[1:]
+
+    with raises(ValueError):
+        curve.feed_compositions.append(
+            compositions[0].to_molar(diffusion_curve.mixture)
+        )
+    with raises(ValueError):
+        curve.permeances.append(
+            (
+                permeances[0][0].convert(
+                    Units.SI, diffusion_curve.mixture.first_component
+                ),
+                permeances[0][1],
+            )
+        )
@@ -1,6 +1,8 @@
 import shutil
 from pathlib import Path
 
+import numpy
+import pandas
 from pytest import fixture
 
 from pyvaporation.components import Components
@@ -10,6 +12,7 @@ from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance, Units
 from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.utils import read_frame
 
 
 @fixture
@@ -184,3 +187,77 @@ def test_semi_ideal_curve(romakon_102_single_diffusion_curve):
             )
             < 7e-3
         )
+
+
+def test_load_diffusion_curve_set_columns():
+    frame = pandas.DataFrame(
+        {
+            "curve_id": [2, 1, 2, 1, numpy.nan],
+            "membrane_name": "Romakon-PM102",
+            "mixture": "H2O_EtOH",
+            "feed_temperature": [333.15, 323.15, 333.15, 323.15, 323.15],
+            "permeate_temperature": numpy.nan,
+            "permeate_pressure": numpy.nan,
+            "composition": [0.9, 0.8, 0.7, 0.6, 0.5],
+            "composition_type": ["weight", "molar", "weight", "weight", "weight"],
+            "partial_flux_1": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "partial_flux_2": [0.1, numpy.nan, 0.3, 0.4, 0.5],
+            "permeance_1": [1e-7, 2e-7, 3e-7, 4e-7, 5e-7],
+            "permeance_2": [1e-9, 2e-9, 3e-9, 4e-9, 5e-9],
+            "units": "SI",
+            "comment": numpy.nan,
+        }
+    )
+    temp_path = Path("tests/temp_dc_set")
+    temp_path.mkdir(parents=True, exist_ok=True)
+    frame.to_csv(temp_path / "curves.csv", index=False)
+    curves = DiffusionCurveSet.load(temp_path / "curves.csv").diffusion_curves
+    shutil.rmtree(temp_path)
+
+    assert len(curves) == 2
+    assert [curve.feed_temperature for curve in curves] == [323.15, 333.15]
+    assert curves[0].feed_compositions[0] == Composition(
+        p=0.8, type=CompositionType.molar
+    ).to_weight(Mixtures.H2O_EtOH)
+    assert curves[0].feed_compositions[1] == Composition(
+        p=0.6, type=CompositionType.weight
+    )
+    assert curves[0]._partial_fluxes is None
+    assert curves[1].partial_fluxes == [(1.0, 0.1), (3.0, 0.3)]
+    for curve, rows in zip(curves, [[1, 3], [0, 2]]):
+        for i, row in enumerate(rows):
+            first = Permeance(value=frame["permeance_1"][row], units=Units.SI).convert(
+                Units.kg_m2_h_kPa, Mixtures.H2O_EtOH.first_component
+            )
+            second = Permeance(value=frame["permeance_2"][row], units=Units.SI).convert(
+                Units.kg_m2_h_kPa, Mixtures.H2O_EtOH.second_component
+            )
+            assert abs(curve.permeances[i][0].value - first.value) < 1e-15
+            assert abs(curve.permeances[i][1].value - second.value) < 1e-15
+
+
+def test_save_load_diffusion_curve_binary():
+    curve = DiffusionCurve(
+        mixture=Mixtures.H2O_EtOH,
+        membrane_name="Romakon-PM102",
+        feed_temperature=333.15,
+        feed_compositions=[
+            Composition(p=c, type=CompositionType.weight) for c in [0.1, 0.5, 0.9]
+        ],
+        partial_fluxes=[(0.1 / 3, 0.2 / 3), (0.3, 0.02), (1.1, 0.001)],
+        permeate_pressure=1.3,
+    )
+    temp_path = Path("tests/temp_dc_binary")
+    temp_path.mkdir(parents=True, exist_ok=True)
+    curve.save(temp_path / "curve.npz")
+    loaded = DiffusionCurveSet.load(temp_path / "curve.npz").diffusion_curves[0]
+    compositions = read_frame(temp_path / "curve.npz", columns=["composition"])
+    shutil.rmtree(temp_path)
+
+    assert list(compositions.columns) == ["composition"]
+    assert loaded.feed_compositions == curve.feed_compositions
+    assert loaded.partial_fluxes == curve.partial_fluxes
+    assert loaded.permeances == curve.permeances
+    assert loaded.permeate_pressure == curve.permeate_pressure
+    assert loaded.permeate_temperature is None
+    assert pandas.isna(loaded.comments)
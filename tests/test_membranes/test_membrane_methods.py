@@ -1,3 +1,4 @@
+import numpy
 import pytest
 from pytest import fixture
 
@@ -5,6 +6,7 @@ from pyvaporation.components import Components
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.permeance import Permeance
+from pyvaporation.utils import R
 
 
 @fixture
@@ -245,3 +247,72 @@ def test_get_pure_component_flux_permeate_pressure(romakon_pm102t):
         romakon_pm102t.get_estimated_pure_component_flux(
             333, Components.H2O, 298, permeate_pressure=0
         )
+
+
+def test_get_permeance_cache(romakon_pm102t):
+    h2o_permeance = romakon_pm102t.get_permeance(340, Components.H2O).value
+    meoh_activation_energy = romakon_pm102t.calculate_activation_energy(
+        Components.MeOH
+    )
+
+    for temperature in [300, 333, 337.5, 338, 343, 348, 353, 400]:
+        experiments = romakon_pm102t.get_penetrant_data(Components.EtOH).experiments
+        nearest = min(experiments, key=lambda e: abs(e.temperature - temperature))
+        assert (
+            abs(
+                romakon_pm102t.get_permeance(temperature, Components.EtOH).value
+                - nearest.permeance.value
+                * numpy.exp(
+                    -nearest.activation_energy
+                    / R
+                    * (1 / temperature - 1 / nearest.temperature)
+                )
+            )
+            < 1e-12
+        )
+
+    romakon_pm102t.ideal_experiments.experiments.append(
+        IdealExperiment(
+            name="Romakon-PM102T",
+            temperature=333,
+            component=Components.MeOH,
+            permeance=Permeance(value=0.0009),
+        )
+    )
+    assert (
+        romakon_pm102t.calculate_activation_energy(Components.MeOH)
+        != meoh_activation_energy
+    )
+
+    romakon_pm102t.ideal_experiments = IdealExperiments(
+        experiments=romakon_pm102t.get_penetrant_data(Components.H2O).experiments[:1]
+    )
+    assert romakon_pm102t.get_permeance(340, Components.H2O).value != h2o_permeance
+    with pytest.raises(ValueError):
+        romakon_pm102t.get_permeance(340, Components.EtOH)
+
+
+def test_get_permeance_array(romakon_pm102t):
+    temperatures = numpy.array([300, 333, 337.5, 338, 343, 348, 349, 353, 400])
+    for component in [Components.H2O, Components.EtOH, Components.MeOH]:
+        permeances = romakon_pm102t.get_permeance_array(temperatures, component)
+        initial_permeances = romakon_pm102t.get_permeance_array(
+            temperatures, component, initial_permeance=Permeance(0.01)
+        )
+        for i in range(len(temperatures)):
+            assert (
+                abs(
+                    permeances[i]
+                    - romakon_pm102t.get_permeance(temperatures[i], component).value
+                )
+                < 1e-12
+            )
+            assert (
+                abs(
+                    initial_permeances[i]
+                    - romakon_pm102t.get_permeance(
+                        temperatures[i], component, Permeance(0.01)
+                    ).value
+                )
+                < 1e-12
+            )
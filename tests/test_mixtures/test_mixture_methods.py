@@ -1,6 +1,9 @@
+import numpy
+
 from pyvaporation.components import Component
 from pyvaporation.mixtures import (Composition, CompositionType, Mixture,
-                                   get_nrtl_partial_pressures)
+                                   get_nrtl_partial_pressures,
+                                   get_nrtl_partial_pressures_array)
 from pyvaporation.utils import (HeatCapacityConstants, NRTLParameters,
                                 VaporPressureConstants)
 
@@ -167,3 +170,46 @@ def test_get_nrtl_partial_pressures_from_weight_composition():
             )
             < 1e-3
         )
+
+
+def test_get_nrtl_partial_pressures_array():
+    temperatures = numpy.array([303.15, 313, 323.15])
+    molar_fractions = numpy.array([0, 0.3, 0.7, 1])
+    # Reference values of the scalar get_nrtl_partial_pressures
+    reference_first = numpy.array(
+        [
+            [0.0, 2.449963715502535, 3.704320495499306, 4.242712726688077],
+            [0.0, 4.185729198510305, 6.344026025812567, 7.319336038915202],
+            [0.0, 6.986415723288275, 10.619913197012572, 12.339753799188664],
+        ]
+    )
+    reference_second = numpy.array(
+        [
+            [10.461968802039372, 7.699230028355404, 5.403150613145087, 0.0],
+            [17.7708110273582, 13.090387841253984, 9.142383733621767, 0.0],
+            [29.48986600053266, 21.741075203478694, 15.103834738666281, 0.0],
+        ]
+    )
+
+    first, second = get_nrtl_partial_pressures_array(
+        temperatures[:, None], test_mixture, molar_fractions[None, :]
+    )
+
+    assert first.shape == (3, 4)
+    assert second.shape == (3, 4)
+    assert numpy.allclose(first, reference_first, rtol=1e-10, atol=1e-12)
+    assert numpy.allclose(second, reference_second, rtol=1e-10, atol=1e-12)
+
+
+def test_tabulated_mixture():
+    tabulated = test_mixture.tabulate(293.15, 353.15)
+    composition = Composition(p=0.3, type=CompositionType.weight)
+    assert tabulated == test_mixture
+    assert tabulated.first_component.tables is not None
+    assert tabulated.second_component.tables is not None
+    assert test_mixture.first_component.tables is None
+    for temperature in [300.0, 320.0, 340.0]:
+        exact = get_nrtl_partial_pressures(temperature, test_mixture, composition)
+        approximation = get_nrtl_partial_pressures(temperature, tabulated, composition)
+        for i in range(2):
+            assert abs(approximation[i] / exact[i] - 1) < 1e-8
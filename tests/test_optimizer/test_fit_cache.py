@@ -0,0 +1,79 @@
+import shutil
+from pathlib import Path
+
+import numpy
+from pytest import fixture
+
+from pyvaporation.diffusion_curve import DiffusionCurve
+from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.optimizer import FitCache, Measurements, find_best_fit
+
+
+@fixture
+def spi_255_diffusion_curve():
+    compositions = [0.9999, 0.883, 0.756, 0.658, 0.490, 0.430, 0.401, 0.280]
+    flux_h2o_40 = [0.7848, 0.3480, 0.2566, 0.4406, 0.3340, 0.2773, 0.2816, 0.2292]
+    flux_etoh_40 = [0, 0.0017, 0.0013, 0.0136, 0.0684, 0.0568, 0.0577, 0.0573]
+
+    return DiffusionCurve(
+        mixture=Mixtures.H2O_EtOH,
+        membrane_name="SPI 255 dense",
+        feed_temperature=313.15,
+        feed_compositions=[
+            Composition(p=c, type=CompositionType.weight) for c in compositions
+        ],
+        partial_fluxes=[
+            (flux_h2o_40[i], flux_etoh_40[i]) for i in range(len(compositions))
+        ],
+    )
+
+
+def test_fit_cache_memory(spi_255_diffusion_curve):
+    measurements_h2o = Measurements.from_diffusion_curve_first(spi_255_diffusion_curve)
+    measurements_etoh = Measurements.from_diffusion_curve_second(
+        spi_255_diffusion_curve
+    )
+    cache = FitCache(maxsize=1)
+
+    fit_h2o = cache.find_best_fit(measurements_h2o, n=3)
+    expected = find_best_fit(measurements_h2o, n=3)
+    assert numpy.array_equal(fit_h2o.a, expected.a)
+    assert numpy.array_equal(fit_h2o.b, expected.b)
+    assert fit_h2o.alpha == expected.alpha
+
+    fit_h2o.b[0] = 1e3
+    _fit_h2o = cache.find_best_fit(measurements_h2o, n=3)
+    assert numpy.array_equal(_fit_h2o.b, expected.b)
+    assert len(cache) == 1
+
+    assert FitCache.get_key(measurements_h2o, n=3) != FitCache.get_key(
+        measurements_h2o, n=2
+    )
+    assert FitCache.get_key(measurements_h2o, n=3) == FitCache.get_key(
+        measurements_h2o, n=3, m=None, n_jobs=2
+    )
+    cache.find_best_fit(measurements_etoh, n=3)
+    assert len(cache) == 1
+    assert cache.get(FitCache.get_key(measurements_h2o, n=3)) is None
+
+
+def test_fit_cache_disk(spi_255_diffusion_curve):
+    measurements_h2o = Measurements.from_diffusion_curve_first(spi_255_diffusion_curve)
+    temp_path = Path("tests/temp_fit_cache")
+    cache = FitCache.from_membrane_path(temp_path)
+    fit_h2o = cache.find_best_fit(measurements_h2o, n=3)
+
+    _cache = FitCache.from_membrane_path(temp_path)
+    _fit_h2o = _cache.get(FitCache.get_key(measurements_h2o, n=3))
+    files = list(_cache.path.iterdir())
+    with numpy.load(files[0], allow_pickle=False) as data:
+        coefficients = data["coefficients"]
+    shutil.rmtree(temp_path)
+
+    assert [file.suffix for file in files] == [".npz"]
+    assert numpy.array_equal(coefficients, fit_h2o.to_array())
+
+    assert _fit_h2o is not None
+    assert numpy.array_equal(fit_h2o.a, _fit_h2o.a)
+    assert numpy.array_equal(fit_h2o.b, _fit_h2o.b)
+    assert fit_h2o.alpha == _fit_h2o.alpha
@@ -1,9 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy
-from pytest import fixture
+from pytest import fixture, raises
 
 from pyvaporation.diffusion_curve import DiffusionCurve
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
-from pyvaporation.optimizer import Measurements, find_best_fit, fit
+from pyvaporation.optimizer import (FitMethod, Measurements,
+                                    PervaporationFunction, find_best_fit, fit,
+                                    fit_linearized)
+from pyvaporation.optimizer.optimizer import (Measurement, residuals,
+                                              residuals_jacobian)
 from pyvaporation.permeance import Permeance, Units
 
 
@@ -178,3 +184,103 @@ def test_find_best_fit_spi(spi_255_diffusion_curve):
         assert abs(fit_h2o.a[i] - validation_a[i]) < 1e-3
 
     assert abs(fit_h2o.b[0] - 1177.8598832639543) < 1e-3
+
+
+def test_fit_linearized(romakon_102_diffusion_curve_set):
+    function = PervaporationFunction(
+        n=2, m=1, alpha=0.05, a=[1.5, -0.7], b=[800.0, -300.0]
+    )
+    synthetic = Measurements(
+        data=[
+            Measurement(x=x, t=t, p=function(x, t))
+            for x in [0.1, 0.3, 0.5, 0.7, 0.9]
+            for t in [313.15, 333.15, 353.15]
+        ]
+    )
+    coefficients = fit_linearized(synthetic, n=2, m=1)
+    assert abs(coefficients[0] - 0.05) < 1e-8
+    for fitted, exact in zip(coefficients[1:], [1.5, -0.7, 800.0, -300.0]):
+        assert abs(fitted - exact) < 1e-6 * max(1, abs(exact))
+
+    measurements_h2o = Measurements.from_diffusion_curves_first(
+        romakon_102_diffusion_curve_set
+    )
+    x, t, p = measurements_h2o.to_arrays()
+    rmse = {
+        key: numpy.sqrt(numpy.mean((function(x, t) - p) ** 2))
+        for key, function in [
+            ("exact", fit(measurements_h2o, n=1, m=1)),
+            ("linear", fit(measurements_h2o, n=1, m=1, method=FitMethod.linear)),
+            ("warm_started", fit(measurements_h2o, n=1, m=1, warm_start=True)),
+        ]
+    }
+    assert rmse["linear"] < 2 * rmse["exact"]
+    assert rmse["warm_started"] < rmse["exact"] * (1 + 1e-3)
+
+
+def test_find_best_fit_linear(spi_255_diffusion_curve):
+    measurements_etoh = Measurements.from_diffusion_curve_second(
+        spi_255_diffusion_curve
+    )
+    fit_etoh = find_best_fit(measurements_etoh, method=FitMethod.linear)
+
+    for measurement in measurements_etoh:
+        assert abs(fit_etoh(measurement.x, 313.15) - measurement.p) < 3e-3
+
+    with raises(ValueError):
+        fit(measurements_etoh, include_zero=True, method=FitMethod.linear)
+
+
+def test_residuals_jacobian(romakon_102_diffusion_curve_set):
+    x, t, p = Measurements.from_diffusion_curves_first(
+        romakon_102_diffusion_curve_set
+    ).to_arrays()
+    params = numpy.array([0.05, 1.2, -0.3, 800, -200, 50])
+    jacobian = residuals_jacobian(params, x, t, p, n=2, m=2)
+
+    assert jacobian.shape == (len(x), len(params))
+    for j in range(len(params)):
+        step = 1e-6 * max(1, abs(params[j]))
+        shifted = params.copy()
+        shifted[j] += step
+        derivative = (
+            residuals(shifted, x, t, p, n=2, m=2) - residuals(params, x, t, p, n=2, m=2)
+        ) / step
+        assert numpy.abs(derivative - jacobian[:, j]).max() < 1e-4 * max(
+            1, numpy.abs(jacobian[:, j]).max()
+        )
+
+
+def test_find_best_fit_least_squares(
+    romakon_102_diffusion_curve_set, spi_255_diffusion_curve
+):
+    for measurements in [
+        Measurements.from_diffusion_curves_first(romakon_102_diffusion_curve_set),
+        Measurements.from_diffusion_curve_first(spi_255_diffusion_curve),
+        Measurements.from_diffusion_curve_second(spi_255_diffusion_curve),
+    ]:
+        powell = find_best_fit(measurements)
+        least_squares = find_best_fit(
+            measurements, method=FitMethod.least_squares, warm_start=True
+        )
+        x, t, p = measurements.to_arrays()
+        assert numpy.sqrt(numpy.mean((least_squares(x, t) - p) ** 2)) < numpy.sqrt(
+            numpy.mean((powell(x, t) - p) ** 2)
+        ) * (1 + 1e-3)
+
+
+def test_find_best_fit_parallel(romakon_102_diffusion_curve_set):
+    measurements_h2o = Measurements.from_diffusion_curves_first(
+        romakon_102_diffusion_curve_set
+    )
+    serial = find_best_fit(measurements_h2o, include_zero=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = find_best_fit(measurements_h2o, include_zero=True, executor=executor)
+    parallel = find_best_fit(measurements_h2o, include_zero=True, n_jobs=2)
+
+    for curve in [threaded, parallel]:
+        assert (curve.n, curve.m) == (serial.n, serial.m)
+        assert curve.alpha == serial.alpha
+        assert list(curve.a) == list(serial.a)
+        assert list(curve.b) == list(serial.b)
@@ -0,0 +1,150 @@
+import numpy
+from pytest import fixture
+
+from pyvaporation.components import Components
+from pyvaporation.conditions import Conditions, StopConditions
+from pyvaporation.experiments import IdealExperiment, IdealExperiments
+from pyvaporation.membrane import Membrane
+from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.permeance import Permeance
+from pyvaporation.pervaporation import Pervaporation
+
+
+@fixture
+def pervaporation():
+    ideal_experiments = IdealExperiments(
+        experiments=[
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.H2O,
+                permeance=Permeance(0.036091),
+                activation_energy=19944,
+            ),
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.EtOH,
+                permeance=Permeance(0.0000282),
+                activation_energy=110806,
+            ),
+        ]
+    )
+    return Pervaporation(
+        membrane=Membrane(ideal_experiments=ideal_experiments, name="Romakon-PM102"),
+        mixture=Mixtures.H2O_EtOH,
+    )
+
+
+@fixture
+def conditions():
+    return [
+        Conditions(
+            membrane_area=0.04155,
+            initial_feed_temperature=333.15,
+            initial_feed_amount=12,
+            initial_feed_composition=Composition(p=0.94, type=CompositionType.weight),
+            permeate_temperature=293.15,
+        ),
+        Conditions(
+            membrane_area=0.1,
+            initial_feed_temperature=343.15,
+            initial_feed_amount=5,
+            initial_feed_composition=Composition(p=0.2, type=CompositionType.weight),
+            permeate_pressure=0.6,
+        ),
+        Conditions(
+            membrane_area=0.05,
+            initial_feed_temperature=323.15,
+            initial_feed_amount=2,
+            initial_feed_composition=Composition(p=0.1, type=CompositionType.molar),
+        ),
+    ]
+
+
+def test_ensemble_isothermal_process(pervaporation, conditions):
+    ensemble = pervaporation.ensemble_process(
+        conditions=conditions, number_of_steps=40, delta_hours=0.25
+    )
+    assert len(ensemble) == 3
+    assert ensemble.feed_mass.shape == (3, 40)
+    assert ensemble.partial_fluxes.shape == (3, 40, 2)
+    for member, model in zip(conditions, ensemble):
+        validation_model = pervaporation.ideal_isothermal_process(
+            number_of_steps=40, delta_hours=0.25, conditions=member
+        )
+        assert len(model.time) == 40
+        for i in range(40):
+            assert abs(model.feed_mass[i] - validation_model.feed_mass[i]) < 1e-6
+            assert (
+                abs(
+                    model.feed_compositions[i].first
+                    - validation_model.feed_compositions[i].first
+                )
+                < 1e-6
+            )
+            assert (
+                abs(model.partial_fluxes[i][0] - validation_model.partial_fluxes[i][0])
+                < 1e-5
+            )
+    assert numpy.array_equal(ensemble.feed_mass[1], ensemble[1].feed_mass)
+
+
+def test_ensemble_non_isothermal_process(pervaporation, conditions):
+    conditions[0].stop_conditions = StopConditions(minimum_feed_mass=11.9)
+    ensemble = pervaporation.ensemble_process(
+        conditions=conditions, number_of_steps=40, delta_hours=0.25, isothermal=False
+    )
+    for member, model in zip(conditions, ensemble):
+        validation_model = pervaporation.ideal_non_isothermal_process(
+            number_of_steps=40, delta_hours=0.25, conditions=member
+        )
+        assert len(model.time) == len(validation_model.time)
+        for i in range(len(model.time)):
+            assert abs(model.time[i] - validation_model.time[i]) < 1e-4
+            assert abs(model.feed_mass[i] - validation_model.feed_mass[i]) < 1e-6
+            assert (
+                abs(model.feed_temperature[i] - validation_model.feed_temperature[i])
+                < 1e-4
+            )
+    assert ensemble.lengths[0] < 40
+    assert abs(ensemble[0].feed_mass[-1] - 11.9) < 1e-9
+    assert numpy.isnan(ensemble.feed_mass[0, -1])
+    assert ensemble[0].permeate_condensation_heat[0] is not None
+    assert ensemble[1].permeate_condensation_heat[0] is None
+
+
+def test_ensemble_member_columns(pervaporation, conditions):
+    member = conditions[0]
+    model = pervaporation.ensemble_process(
+        conditions=[member], number_of_steps=50, delta_hours=0.1, precision=1e-10
+    )[0]
+    validation_model = pervaporation.ideal_isothermal_process(
+        number_of_steps=50, delta_hours=0.1, conditions=member, precision=1e-10
+    )
+    assert len(model.time) == len(validation_model.time) == 50
+    for name in [
+        "time",
+        "feed_temperature",
+        "feed_mass",
+        "feed_evaporation_heat",
+        "permeate_condensation_heat",
+    ]:
+        assert numpy.allclose(
+            numpy.array(getattr(model, name), dtype=float),
+            numpy.array(getattr(validation_model, name), dtype=float),
+            rtol=1e-8,
+            atol=0,
+        ), name
+    for name in [
+        "feed_compositions",
+        "permeate_composition",
+        "partial_fluxes",
+        "permeances",
+    ]:
+        assert numpy.allclose(
+            getattr(model, name).values,
+            getattr(validation_model, name).values,
+            rtol=1e-8,
+            atol=0,
+        ), name
@@ -2,12 +2,13 @@ import pytest
 from pytest import fixture
 
 from pyvaporation.components import Components
-from pyvaporation.conditions import Conditions
+from pyvaporation.conditions import Conditions, StopConditions
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (Pervaporation, ProcessEngine,
+                                        ProcessState)
 
 
 @fixture
@@ -123,6 +124,47 @@ def test_experimet_romakon_al2(
         )
 
 
+def test_heats(romakon_al2_pervaporation, romakon_al2_experiment_conditions):
+    conditions = romakon_al2_experiment_conditions
+    model = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=10,
+        delta_hours=1,
+        conditions=conditions,
+        precision=1e-10,
+    )
+    feed_temperature = conditions.initial_feed_temperature
+    permeate_temperature = conditions.permeate_temperature
+    components = [Components.H2O, Components.EtOH]
+    for i in [0, 5, 9]:
+        d_mass = [
+            flux * conditions.membrane_area * 1 for flux in model.partial_fluxes[i]
+        ]
+        feed_evaporation_heat = sum(
+            component.get_vaporisation_heat(feed_temperature)
+            / component.molecular_weight
+            * 1000
+            * mass
+            for component, mass in zip(components, d_mass)
+        )
+        permeate_condensation_heat = sum(
+            (
+                component.get_vaporisation_heat(permeate_temperature)
+                / component.molecular_weight
+                * 1000
+                + component.get_cooling_heat(feed_temperature, permeate_temperature)
+                * (feed_temperature - permeate_temperature)
+            )
+            * mass
+            for component, mass in zip(components, d_mass)
+        )
+        assert abs(model.feed_evaporation_heat[i] / feed_evaporation_heat - 1) < 1e-10
+        assert (
+            abs(model.permeate_condensation_heat[i] / permeate_condensation_heat - 1)
+            < 1e-10
+        )
+        assert model.permeate_condensation_heat[i] > 0
+
+
 def test_experimet_romakon_al2_no_permeate_params(
     romakon_al2_pervaporation, romakon_al2_experiment_conditions_2
 ):
@@ -198,3 +240,121 @@ def test_permeate_comp_and_temp(
             conditions=romakon_al2_experiment_conditions_4,
             precision=5e-5,
         )
+
+
+def test_quadrature_engine(
+    romakon_al2_pervaporation,
+    romakon_al2_experiment_conditions,
+    romakon_al2_experiment_conditions_2,
+):
+    for conditions in [
+        romakon_al2_experiment_conditions,
+        romakon_al2_experiment_conditions_2,
+    ]:
+        euler_model = romakon_al2_pervaporation.ideal_isothermal_process(
+            number_of_steps=1000,
+            delta_hours=0.005,
+            conditions=conditions,
+            precision=5e-5,
+        )
+        quadrature_model = romakon_al2_pervaporation.ideal_isothermal_process(
+            number_of_steps=5,
+            delta_hours=1,
+            conditions=conditions,
+            precision=5e-5,
+            engine=ProcessEngine.quadrature,
+        )
+        assert len(quadrature_model.time) == 5
+        for i in range(5):
+            assert (
+                abs(
+                    quadrature_model.feed_compositions[i].first
+                    - euler_model.feed_compositions[i * 200].first
+                )
+                < 1e-3
+            )
+            assert (
+                abs(quadrature_model.feed_mass[i] - euler_model.feed_mass[i * 200])
+                < 1e-4
+            )
+            assert (
+                abs(
+                    quadrature_model.partial_fluxes[i][0]
+                    - euler_model.partial_fluxes[i * 200][0]
+                )
+                < 1e-3
+            )
+
+
+def test_stop_conditions(romakon_al2_pervaporation, romakon_al2_experiment_conditions):
+    stop_conditions = StopConditions(
+        target_feed_composition=Composition(p=0.01, type=CompositionType.weight)
+    )
+    euler_model = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=5000,
+        delta_hours=0.005,
+        conditions=romakon_al2_experiment_conditions,
+        stop_conditions=stop_conditions,
+    )
+    adaptive_model = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=25,
+        delta_hours=1,
+        conditions=romakon_al2_experiment_conditions,
+        engine=ProcessEngine.adaptive,
+        stop_conditions=stop_conditions,
+    )
+    for model in [euler_model, adaptive_model]:
+        assert len(model.time) == len(model.feed_mass) == len(model.partial_fluxes)
+        assert len(model.permeances) == len(model.feed_evaporation_heat)
+        assert abs(model.feed_compositions[-1].first - 0.01) < 1e-8
+        assert all(c.first > 0.01 for c in model.feed_compositions[:-1])
+    assert euler_model.time[-1] < 25
+    assert abs(euler_model.time[-1] - adaptive_model.time[-1]) < 1e-2
+    assert abs(euler_model.feed_mass[-1] - adaptive_model.feed_mass[-1]) < 1e-5
+
+    romakon_al2_experiment_conditions.stop_conditions = StopConditions(
+        minimum_feed_mass=0.046, maximum_time=2.5
+    )
+    for engine in [ProcessEngine.euler, ProcessEngine.adaptive]:
+        model = romakon_al2_pervaporation.ideal_isothermal_process(
+            number_of_steps=25,
+            delta_hours=1,
+            conditions=romakon_al2_experiment_conditions,
+            engine=engine,
+        )
+        assert abs(model.time[-1] - 2.5) < 1e-9
+        assert model.feed_mass[-1] > 0.046
+
+    with pytest.raises(ValueError):
+        romakon_al2_pervaporation.ideal_isothermal_process(
+            number_of_steps=25,
+            delta_hours=1,
+            conditions=romakon_al2_experiment_conditions,
+            engine=ProcessEngine.quadrature,
+        )
+
+
+def test_process_state(romakon_al2_pervaporation, romakon_al2_experiment_conditions):
+    state = ProcessState.allocate(number_of_steps=10)
+    assert state.length == 0
+    assert state.feed_mass.shape == (10,) and state.partial_fluxes.shape == (10, 2)
+
+    model = romakon_al2_pervaporation.ideal_isothermal_process(
+        number_of_steps=10,
+        delta_hours=0.5,
+        conditions=romakon_al2_experiment_conditions,
+    )
+    assert len(model.time) == 10
+    assert model.permeate_condensation_heat[0] is not None
+    for i in range(1, 10):
+        d_mass_1 = model.partial_fluxes[i - 1][0] * 0.0048 * 0.5
+        assert (
+            abs(
+                model.feed_compositions[i].first * model.feed_mass[i]
+                - (
+                    model.feed_compositions[i - 1].first * model.feed_mass[i - 1]
+                    - d_mass_1
+                )
+            )
+            < 1e-12
+        )
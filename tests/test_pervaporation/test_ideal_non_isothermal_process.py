@@ -7,7 +7,7 @@ from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import Pervaporation, ProcessEngine
 
 
 @fixture
@@ -147,3 +147,78 @@ def test_ideal_non_isothermal_process_perm_pressure_and_temp(
             number_of_steps=8,
             delta_hours=0.125,
         )
+
+
+def test_adaptive_engine(pervaporation, test_conditions, test_conditions_perm_pressure):
+    for conditions in [test_conditions, test_conditions_perm_pressure]:
+        euler_model = pervaporation.ideal_non_isothermal_process(
+            conditions=conditions, number_of_steps=800, delta_hours=0.005
+        )
+        adaptive_model = pervaporation.ideal_non_isothermal_process(
+            conditions=conditions,
+            number_of_steps=8,
+            delta_hours=0.5,
+            engine=ProcessEngine.adaptive,
+        )
+        assert len(adaptive_model.time) == 8
+        for i in range(8):
+            assert (
+                abs(
+                    adaptive_model.feed_temperature[i]
+                    - euler_model.feed_temperature[i * 100]
+                )
+                < 1e-2
+            )
+            assert (
+                abs(adaptive_model.feed_mass[i] - euler_model.feed_mass[i * 100]) < 1e-3
+            )
+            assert (
+                abs(
+                    adaptive_model.partial_fluxes[i][0]
+                    - euler_model.partial_fluxes[i * 100][0]
+                )
+                < 1e-3
+            )
+
+
+def test_unsupported_engine(pervaporation, test_conditions):
+    with pytest.raises(ValueError):
+        pervaporation.ideal_non_isothermal_process(
+            conditions=test_conditions,
+            number_of_steps=8,
+            delta_hours=0.125,
+            engine="unknown",
+        )
+
+
+def test_warm_start(pervaporation, test_conditions):
+    test_conditions.permeate_temperature = 313.15
+    model = pervaporation.ideal_non_isothermal_process(
+        conditions=test_conditions,
+        number_of_steps=50,
+        delta_hours=0.1,
+    )
+    assert len(model.solver_iterations) == len(model.time)
+
+    cold_start_iterations = []
+    for i in range(len(model.time)):
+        partial_fluxes, iterations = pervaporation._calculate_partial_fluxes(
+            feed_temperature=model.feed_temperature[i],
+            composition=model.feed_compositions[i].first,
+            first_component_permeance=model.permeances[i][0].value,
+            second_component_permeance=model.permeances[i][1].value,
+            precision=5e-5,
+            permeate_temperature=test_conditions.permeate_temperature,
+        )
+        cold_start_iterations.append(iterations)
+        assert abs(partial_fluxes[0] - model.partial_fluxes[i][0]) < 1e-5
+    assert model.solver_iterations[0] == cold_start_iterations[0]
+    assert sum(model.solver_iterations[1:]) < sum(cold_start_iterations[1:])
+
+    model = pervaporation.ideal_non_isothermal_process(
+        conditions=test_conditions,
+        number_of_steps=50,
+        delta_hours=0.1,
+        engine=ProcessEngine.adaptive,
+    )
+    assert len(model.solver_iterations) == len(model.time)
@@ -1,15 +1,19 @@
 from pathlib import Path
 
-from pytest import fixture
+import attr
+import numpy
+from pytest import fixture, raises
 
 from pyvaporation.components import Components
-from pyvaporation.conditions import Conditions, TemperatureProgram
+from pyvaporation.conditions import (Conditions, StopConditions,
+                                     TemperatureProgram)
 from pyvaporation.diffusion_curve import DiffusionCurveSet
 from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import (Pervaporation, ProcessCheckpoint,
+                                        ProcessEngine)
 
 
 @fixture
@@ -192,6 +196,88 @@ def test_validate_against_ideal_process_temperature_program(pervaporation):
         )
 
 
+def test_adaptive_engine(pervaporation, basic_conditions):
+    euler_model = pervaporation.non_ideal_non_isothermal_process(
+        conditions=basic_conditions,
+        diffusion_curve_set=pervaporation.membrane.diffusion_curve_sets[0],
+        number_of_steps=1000,
+        delta_hours=0.01,
+    )
+    adaptive_model = pervaporation.non_ideal_non_isothermal_process(
+        conditions=basic_conditions,
+        diffusion_curve_set=pervaporation.membrane.diffusion_curve_sets[0],
+        number_of_steps=10,
+        delta_hours=1,
+        engine=ProcessEngine.adaptive,
+    )
+    assert len(adaptive_model.time) == 10
+    for i in range(10):
+        assert (
+            abs(
+                adaptive_model.feed_temperature[i]
+                - euler_model.feed_temperature[i * 100]
+            )
+            < 1e-1
+        )
+        assert abs(adaptive_model.feed_mass[i] - euler_model.feed_mass[i * 100]) < 5e-3
+        assert (
+            abs(
+                adaptive_model.feed_compositions[i].first
+                - euler_model.feed_compositions[i * 100].first
+            )
+            < 1e-4
+        )
+        assert (
+            abs(
+                adaptive_model.permeances[i][0].value
+                - euler_model.permeances[i * 100][0].value
+            )
+            < 1e-4
+        )
+
+
+def test_checkpoint(pervaporation, basic_conditions, tmp_path):
+    conditions = attr.evolve(
+        basic_conditions,
+        permeate_temperature=293.15,
+        stop_conditions=StopConditions(minimum_feed_mass=11.5),
+    )
+    checkpoint_path = tmp_path / "checkpoint.npz"
+    model = pervaporation.non_ideal_non_isothermal_process(
+        conditions=conditions,
+        diffusion_curve_set=pervaporation.membrane.diffusion_curve_sets[0],
+        number_of_steps=500,
+        delta_hours=0.05,
+        initial_permeances=(Permeance(0.03), Permeance(0.00003)),
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=40,
+    )
+    checkpoint = ProcessCheckpoint.load(checkpoint_path)
+    resumed_model = pervaporation.resume_non_ideal_non_isothermal_process(
+        checkpoint_path
+    )
+
+    assert checkpoint.step == 40 * ((len(model.time) - 1) // 40)
+    assert checkpoint.conditions == conditions
+    assert resumed_model.initial_conditions == conditions
+    assert numpy.array_equal(resumed_model.time, model.time)
+    assert numpy.array_equal(resumed_model.feed_mass, model.feed_mass)
+    assert numpy.array_equal(resumed_model.feed_temperature, model.feed_temperature)
+    assert resumed_model.feed_compositions == model.feed_compositions
+    assert resumed_model.permeate_composition == model.permeate_composition
+    assert resumed_model.partial_fluxes == model.partial_fluxes
+    assert resumed_model.permeances == model.permeances
+    assert resumed_model.permeate_condensation_heat == model.permeate_condensation_heat
+    for i in range(2):
+        assert numpy.array_equal(
+            resumed_model.permeance_fits[i].to_array(),
+            model.permeance_fits[i].to_array(),
+        )
+
+    with raises(FileNotFoundError):
+        ProcessCheckpoint.load(tmp_path / "missing_checkpoint.npz")
+
+
 def test_validate_against_experimental_data():
     """
     Data for validation is taken from: https://doi.org/10.1007/bf02705302.
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import numpy
+import pandas
+from pytest import fixture, raises
+
+from pyvaporation.components import Components
+from pyvaporation.conditions import Conditions, StopConditions
+from pyvaporation.experiments import IdealExperiment, IdealExperiments
+from pyvaporation.membrane import Membrane
+from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.permeance import Permeance
+from pyvaporation.pervaporation import Pervaporation, ProcessEngine
+from pyvaporation.process import (PROCESS_STEP_COLUMNS, FrameSink,
+                                  RollingAggregator)
+
+
+@fixture
+def pervaporation():
+    ideal_experiments = IdealExperiments(
+        experiments=[
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.H2O,
+                permeance=Permeance(0.036091),
+                activation_energy=19944,
+            ),
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.EtOH,
+                permeance=Permeance(0.0000282),
+                activation_energy=110806,
+            ),
+        ]
+    )
+    return Pervaporation(
+        membrane=Membrane(ideal_experiments=ideal_experiments, name="Romakon-PM102"),
+        mixture=Mixtures.H2O_EtOH,
+    )
+
+
+@fixture
+def conditions():
+    return Conditions(
+        membrane_area=0.4155,
+        initial_feed_temperature=333.15,
+        initial_feed_amount=12,
+        initial_feed_composition=Composition(p=0.94, type=CompositionType.weight),
+        permeate_temperature=293.15,
+        stop_conditions=StopConditions(minimum_feed_mass=11.8),
+    )
+
+
+def test_process_steps(pervaporation, conditions):
+    model = pervaporation.ideal_non_isothermal_process(
+        conditions=conditions, number_of_steps=200, delta_hours=0.05
+    )
+    path = Path("tests/temp_process_steps.csv")
+    aggregator = RollingAggregator(window=10)
+    steps = list(
+        pervaporation.process_steps(
+            "ideal_non_isothermal_process",
+            conditions=conditions,
+            number_of_steps=200,
+            delta_hours=0.05,
+            sinks=[FrameSink(path, chunk_size=7), aggregator],
+        )
+    )
+    frame = pandas.read_csv(path)
+    path.unlink()
+
+    assert len(steps) == len(model.time) < 200
+    assert len(frame) == len(steps)
+    assert list(frame.columns) == PROCESS_STEP_COLUMNS
+    for i, step in enumerate(steps):
+        assert step.time == model.time[i]
+        assert step.feed_mass == model.feed_mass[i]
+        assert step.feed_temperature == model.feed_temperature[i]
+        assert step.feed_composition == model.feed_compositions[i].p
+        assert step.partial_fluxes == model.partial_fluxes[i]
+        assert step.permeate_condensation_heat == model.permeate_condensation_heat[i]
+        assert abs(frame["feed_mass"][i] - step.feed_mass) < 1e-12
+
+    assert aggregator.count == len(steps)
+    assert aggregator.last == steps[-1]
+    assert (
+        abs(aggregator.feed_evaporation_heat - numpy.sum(model.feed_evaporation_heat))
+        < 1e-9
+    )
+    assert aggregator.minimum_feed_temperature == numpy.min(model.feed_temperature)
+    assert (
+        abs(
+            aggregator.mean_total_flux
+            - numpy.mean(model.partial_fluxes.values[-10:].sum(axis=1))
+        )
+        < 1e-12
+    )
+
+
+def test_process_steps_engines(pervaporation, conditions):
+    for engine in (ProcessEngine.euler, ProcessEngine.adaptive):
+        model = pervaporation.ideal_isothermal_process(
+            conditions=conditions, number_of_steps=50, delta_hours=0.1, engine=engine
+        )
+        steps = list(
+            pervaporation.process_steps(
+                "ideal_isothermal_process",
+                conditions=conditions,
+                number_of_steps=50,
+                delta_hours=0.1,
+                engine=engine,
+            )
+        )
+        assert len(steps) == len(model.time)
+        for i, step in enumerate(steps):
+            assert step.time == model.time[i]
+            assert step.feed_composition == model.feed_compositions[i].p
+            assert step.feed_evaporation_heat == model.feed_evaporation_heat[i]
+
+    with raises(ValueError):
+        next(
+            pervaporation.process_steps(
+                "ideal_diffusion_curve",
+                conditions=conditions,
+                number_of_steps=50,
+                delta_hours=0.1,
+            )
+        )
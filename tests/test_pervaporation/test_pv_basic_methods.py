@@ -1,3 +1,6 @@
+import functools
+
+import numpy
 import pytest
 from pytest import fixture
 
@@ -7,7 +10,8 @@ from pyvaporation.experiments import IdealExperiment, IdealExperiments
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
-from pyvaporation.pervaporation import Pervaporation
+from pyvaporation.pervaporation import Pervaporation, SolverMethod
+from pyvaporation.pervaporation.pervaporation import _find_root_newton_brent
 
 
 @fixture
@@ -267,3 +271,150 @@ def test_get_separation_factor(pervaporation_binary):
         )
         < 5
     )
+
+
+def test_calculate_partial_fluxes_batch(pervaporation_real):
+    compositions = [0.05, 0.3, 0.6, 0.9362]
+    temperatures = [313.15, 323.15, 333.15, 343.15]
+    for permeate_conditions in [
+        {},
+        {"permeate_temperature": 276.15},
+        {"permeate_pressure": 0.5},
+    ]:
+        batch = pervaporation_real.calculate_partial_fluxes_batch(
+            feed_temperature=numpy.array(temperatures),
+            composition=numpy.array(compositions),
+            precision=5e-5,
+            **permeate_conditions,
+        )
+        assert batch.converged.all()
+        for i in range(len(compositions)):
+            fluxes = pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=temperatures[i],
+                composition=Composition(p=compositions[i], type=CompositionType.weight),
+                precision=5e-5,
+                **permeate_conditions,
+            )
+            assert abs(batch.partial_fluxes[i][0] - fluxes[0]) < 5e-5 * fluxes[0]
+            assert abs(batch.partial_fluxes[i][1] - fluxes[1]) < 5e-5 * fluxes[1]
+            assert abs(batch.permeate_composition[i] - fluxes[0] / sum(fluxes)) < 5e-5
+
+
+def test_calculate_partial_fluxes_batch_precision(pervaporation_real):
+    compositions = [0.05, 0.3, 0.6, 0.9362]
+    for precision in [1e-2, 1e-3, 5e-5]:
+        batch = pervaporation_real.calculate_partial_fluxes_batch(
+            feed_temperature=333.15,
+            composition=numpy.array(compositions),
+            precision=precision,
+            permeate_pressure=0.6,
+        )
+        assert batch.converged.all()
+        for i in range(len(compositions)):
+            fluxes = pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=333.15,
+                composition=Composition(p=compositions[i], type=CompositionType.weight),
+                precision=1e-9,
+                permeate_pressure=0.6,
+            )
+            assert abs(batch.permeate_composition[i] - fluxes[0] / sum(fluxes)) < (
+                precision
+            )
+
+
+def test_ideal_diffusion_curve_not_converged(pervaporation_real, monkeypatch):
+    batch = pervaporation_real.calculate_partial_fluxes_batch(
+        feed_temperature=333.15,
+        composition=numpy.array([0.1, 0.5]),
+        permeate_pressure=0.6,
+        max_iterations=1,
+    )
+    assert not batch.converged.any()
+    assert numpy.isfinite(batch.partial_fluxes).all()
+
+    monkeypatch.setattr(
+        pervaporation_real,
+        "calculate_partial_fluxes_batch",
+        functools.partial(
+            Pervaporation.calculate_partial_fluxes_batch,
+            pervaporation_real,
+            max_iterations=1,
+        ),
+    )
+    curve = pervaporation_real.ideal_diffusion_curve(
+        feed_temperature=333.15,
+        compositions=[
+            Composition(p=0.1, type=CompositionType.weight),
+            Composition(p=0.5, type=CompositionType.weight),
+        ],
+        permeate_pressure=0.6,
+    )
+    assert numpy.array_equal(curve.partial_fluxes.values, batch.partial_fluxes)
+
+
+def test_calculate_partial_fluxes_batch_perm_temp_and_press(pervaporation_real):
+    with pytest.raises(ValueError):
+        pervaporation_real.calculate_partial_fluxes_batch(
+            feed_temperature=333.15,
+            composition=numpy.array([0.9362]),
+            permeate_temperature=0,
+            permeate_pressure=0,
+        )
+
+
+def test_calculate_partial_fluxes_methods(pervaporation_real):
+    for permeate_conditions in [
+        {"permeate_temperature": 290.15},
+        {"permeate_pressure": 0.6},
+    ]:
+        for p in [0.1, 0.5, 0.9362]:
+            composition = Composition(p=p, type=CompositionType.weight)
+            newton = pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=333.15,
+                composition=composition,
+                precision=5e-5,
+                method=SolverMethod.newton,
+                **permeate_conditions,
+            )
+            substitution = pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=333.15,
+                composition=composition,
+                precision=5e-5,
+                method=SolverMethod.substitution,
+                **permeate_conditions,
+            )
+            assert (
+                abs(newton[0] / sum(newton) - substitution[0] / sum(substitution))
+                < 1e-4
+            )
+
+
+def test_calculate_partial_fluxes_iteration_limit(pervaporation_real):
+    for method in [SolverMethod.newton, SolverMethod.substitution]:
+        with pytest.raises(ValueError):
+            pervaporation_real.calculate_partial_fluxes(
+                feed_temperature=333.15,
+                composition=Composition(p=0.5, type=CompositionType.weight),
+                precision=1e-12,
+                permeate_temperature=290.15,
+                method=method,
+                max_iterations=1,
+            )
+
+
+def test_newton_brent_iteration_budget():
+    def residual(p):
+        return numpy.sign(0.3 - p) * abs(0.3 - p) ** 0.1
+
+    root, iterations = _find_root_newton_brent(
+        residual, initial_guess=0.9, precision=1e-3, max_iterations=1000
+    )
+    assert abs(root - 0.3) < 1e-3
+    # Newton iterations are followed by the Brent iterations within the same budget
+    assert _find_root_newton_brent(
+        residual, initial_guess=0.9, precision=1e-3, max_iterations=iterations
+    ) == (root, iterations)
+    with pytest.raises(ValueError):
+        _find_root_newton_brent(
+            residual, initial_guess=0.9, precision=1e-3, max_iterations=iterations - 1
+        )
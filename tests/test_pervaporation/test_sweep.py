@@ -0,0 +1,201 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+from pytest import fixture, raises
+
+import pyvaporation.optimizer.fit_cache
+from pyvaporation.components import Components
+from pyvaporation.conditions import Conditions
+from pyvaporation.diffusion_curve import DiffusionCurveSet
+from pyvaporation.experiments import IdealExperiment, IdealExperiments
+from pyvaporation.membrane import Membrane
+from pyvaporation.mixtures import Composition, CompositionType, Mixtures
+from pyvaporation.permeance import Permeance
+from pyvaporation.pervaporation import Pervaporation, parameter_sweep
+
+
+@fixture
+def pervaporation():
+    ideal_experiments = IdealExperiments(
+        experiments=[
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.H2O,
+                permeance=Permeance(0.036091),
+                activation_energy=19944,
+            ),
+            IdealExperiment(
+                name="Romakon-PM102",
+                temperature=323.15,
+                component=Components.EtOH,
+                permeance=Permeance(0.0000282),
+                activation_energy=110806,
+            ),
+        ]
+    )
+    membrane = Membrane(ideal_experiments=ideal_experiments, name="Romakon-PM102")
+    diffusion_curve = Pervaporation(
+        membrane=membrane, mixture=Mixtures.H2O_EtOH
+    ).ideal_diffusion_curve(
+        compositions=[
+            Composition(p=i / 10, type=CompositionType.weight) for i in range(1, 10)
+        ],
+        feed_temperature=323.15,
+    )
+    membrane = Membrane(
+        ideal_experiments=ideal_experiments,
+        diffusion_curve_sets=[DiffusionCurveSet("ideal curve", [diffusion_curve])],
+        name="Romakon-PM102",
+    )
+    return Pervaporation(membrane, Mixtures.H2O_EtOH)
+
+
+@fixture
+def conditions():
+    return Conditions(
+        membrane_area=0.04155,
+        initial_feed_temperature=333.15,
+        initial_feed_amount=12,
+        initial_feed_composition=Composition(p=0.94, type=CompositionType.weight),
+    )
+
+
+def test_ideal_process_sweep(pervaporation, conditions):
+    parameters = {
+        "membrane_area": [0.04155, 0.1],
+        "initial_feed_temperature": [323.15, 333.15],
+        "permeate_pressure": [0, 1],
+    }
+    frame = parameter_sweep(
+        pervaporation,
+        "ideal_isothermal_process",
+        parameters,
+        conditions=conditions,
+        n_jobs=2,
+        number_of_steps=10,
+        delta_hours=0.5,
+    )
+
+    assert len(frame) == 8 * 10
+    assert list(frame.columns[:4]) == ["run"] + list(parameters)
+    for run, group in frame.groupby("run"):
+        point = group.iloc[0]
+        model = pervaporation.ideal_isothermal_process(
+            conditions=attr.evolve(
+                conditions, **{name: point[name] for name in parameters}
+            ),
+            number_of_steps=10,
+            delta_hours=0.5,
+        )
+        for i in range(len(model.time)):
+            assert abs(group["feed_mass"].iloc[i] - model.feed_mass[i]) < 1e-12
+            assert (
+                abs(group["feed_composition"].iloc[i] - model.feed_compositions[i].p)
+                < 1e-12
+            )
+
+
+def test_non_ideal_sweep(pervaporation):
+    curve_set = pervaporation.membrane.diffusion_curve_sets[0]
+    frame = parameter_sweep(
+        pervaporation,
+        "non_ideal_diffusion_curve",
+        {"feed_temperature": [323.15, 333.15, 343.15], "n_first": [1, 2]},
+        executor=functools.partial(ThreadPoolExecutor, max_workers=2),
+        diffusion_curve_set=curve_set,
+        initial_feed_composition=Composition(p=0.9, type=CompositionType.weight),
+        delta_composition=-0.1,
+        number_of_steps=5,
+    )
+
+    assert len(frame) == 6 * 6
+    assert len(pervaporation.fit_cache) == 3
+    curve = pervaporation.non_ideal_diffusion_curve(
+        diffusion_curve_set=curve_set,
+        feed_temperature=333.15,
+        initial_feed_composition=Composition(p=0.9, type=CompositionType.weight),
+        delta_composition=-0.1,
+        number_of_steps=5,
+        n_first=2,
+    )
+    group = frame[(frame["feed_temperature"] == 333.15) & (frame["n_first"] == 2)]
+    for i in range(len(curve.feed_compositions)):
+        assert abs(group["permeance_1"].iloc[i] - curve.permeances[i][0].value) < 1e-12
+
+    with raises(ValueError):
+        parameter_sweep(pervaporation, "non_ideal_diffusion_curve", {"area": [1]})
+
+
+def test_non_ideal_sweep_fits_in_parent(pervaporation, monkeypatch):
+    non_ideal_diffusion_curve = Pervaporation.non_ideal_diffusion_curve
+    calls = []
+
+    @functools.wraps(non_ideal_diffusion_curve)
+    def count_calls(self, *args, **kwargs):
+        calls.append(threading.current_thread() is threading.main_thread())
+        return non_ideal_diffusion_curve(self, *args, **kwargs)
+
+    monkeypatch.setattr(Pervaporation, "non_ideal_diffusion_curve", count_calls)
+    fits = []
+    find_best_fit = pyvaporation.optimizer.fit_cache.find_best_fit
+
+    @functools.wraps(find_best_fit)
+    def count_fits(*args, **kwargs):
+        fits.append(threading.current_thread() is threading.main_thread())
+        return find_best_fit(*args, **kwargs)
+
+    monkeypatch.setattr(pyvaporation.optimizer.fit_cache, "find_best_fit", count_fits)
+    initializers = []
+
+    def executor(initializer, initargs):
+        initializers.append(initargs)
+        return ThreadPoolExecutor(
+            max_workers=2, initializer=initializer, initargs=initargs
+        )
+
+    # the fit_cache is too small to hold the functions of the sweep
+    pervaporation.fit_cache.maxsize = 1
+    frame = parameter_sweep(
+        pervaporation,
+        "non_ideal_diffusion_curve",
+        {"feed_temperature": [323.15, 333.15, 343.15], "n_first": [1, 2]},
+        executor=executor,
+        diffusion_curve_set=pervaporation.membrane.diffusion_curve_sets[0],
+        initial_feed_composition=Composition(p=0.9, type=CompositionType.weight),
+        delta_composition=-0.1,
+        number_of_steps=5,
+    )
+
+    assert len(frame) == 6 * 6
+    assert len(calls) == 6 and not any(calls)
+    assert len(pervaporation.fit_cache) == 3
+    assert pervaporation.fit_cache.maxsize == 4
+    assert initializers == [(pervaporation,)]
+    # the functions are fitted once in the parent and found in the fit_cache by the workers
+    assert len(fits) == 3 and all(fits)
+
+
+def test_empty_sweep(pervaporation, conditions):
+    frame = parameter_sweep(
+        pervaporation,
+        "ideal_isothermal_process",
+        {"membrane_area": []},
+        conditions=conditions,
+        number_of_steps=10,
+        delta_hours=0.5,
+    )
+    assert len(frame) == 0
+    assert list(frame.columns[:2]) == ["run", "membrane_area"]
+    assert "feed_mass" in frame.columns
+
+    frame = parameter_sweep(
+        pervaporation,
+        "ideal_diffusion_curve",
+        {"feed_temperature": []},
+        compositions=[Composition(p=0.5, type=CompositionType.weight)],
+    )
+    assert len(frame) == 0
+    assert "permeance_1" in frame.columns
@@ -1,8 +1,11 @@
 from pathlib import Path
 
+import numpy
 from pytest import fixture
 
 from pyvaporation.conditions import Conditions
+from pyvaporation.diffusion_curve import (CompositionColumn, PartialFluxColumn,
+                                          PermeanceColumn)
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
@@ -215,3 +218,27 @@ def test_get_selectivity(test_process):
     ]
     for i in range(len(test_process.get_selectivity)):
         assert (test_process.get_selectivity[i] - validation_selectivity[i]) < 1e-3
+
+
+def test_columnar_storage(test_process):
+    assert isinstance(test_process.feed_compositions, CompositionColumn)
+    assert isinstance(test_process.partial_fluxes, PartialFluxColumn)
+    assert isinstance(test_process.permeances, PermeanceColumn)
+    assert isinstance(test_process.time, numpy.ndarray)
+    assert isinstance(test_process.get_psi, numpy.ndarray)
+
+    feed = test_process.feed_compositions[3]
+    permeate = test_process.permeate_composition[3]
+    permeances = test_process.permeances[3]
+    assert isinstance(feed, Composition)
+    assert (
+        abs(
+            test_process.get_separation_factor[3]
+            - (permeate.first / permeate.second) / (feed.first / feed.second)
+        )
+        < 1e-9
+    )
+    assert (
+        abs(test_process.get_selectivity[3] - permeances[0].value / permeances[1].value)
+        < 1e-9
+    )
@@ -1,12 +1,16 @@
 import shutil
 from pathlib import Path
 
-from pyvaporation.conditions import Conditions
+import attr
+import numpy
+
+from pyvaporation.conditions import Conditions, TemperatureProgram
 from pyvaporation.membrane import Membrane
 from pyvaporation.mixtures import Composition, CompositionType, Mixtures
 from pyvaporation.permeance import Permeance
 from pyvaporation.pervaporation import Pervaporation
 from pyvaporation.process import ProcessModel
+from pyvaporation.utils import StorageFormat
 
 
 def test_save_load_process():
@@ -59,3 +63,83 @@ def test_save_load_process():
             process.partial_fluxes[i][0], 4
         )
         assert round(loaded.feed_mass[i], 4) == round(process.feed_mass[i], 4)
+
+
+def test_save_load_process_binary():
+    membrane = Membrane.load(Path("tests/default_membranes/Pervap_4101"))
+    pv = Pervaporation(
+        membrane=membrane,
+        mixture=Mixtures.H2O_EtOH,
+    )
+    con = Conditions(
+        membrane_area=0.017,
+        initial_feed_temperature=368.15,
+        initial_feed_amount=1.5,
+        initial_feed_composition=Composition(p=0.1, type=CompositionType.weight),
+        permeate_pressure=0,
+    )
+    process = pv.non_ideal_isothermal_process(
+        conditions=con,
+        diffusion_curve_set=membrane.diffusion_curve_sets[0],
+        number_of_steps=20,
+        delta_hours=0.2,
+    )
+
+    temp_path = Path("tests/temp_binary_process")
+    process.save(temp_path, storage_format=StorageFormat.npz)
+    process_path = list((temp_path / "results").iterdir())[0]
+    loaded = ProcessModel.load(process_path=process_path)
+    frame = ProcessModel.load_frame(process_path, columns=["time", "feed_mass"])
+    files = [file.suffix for file in process_path.iterdir()]
+    shutil.rmtree(temp_path)
+
+    assert sorted(files) == [".json", ".npz", ".npz", ".npz"]
+    assert list(frame.columns) == ["time", "feed_mass"]
+    assert loaded.initial_conditions == con
+    for i in range(2):
+        assert numpy.array_equal(
+            loaded.permeance_fits[i].to_array(), process.permeance_fits[i].to_array()
+        )
+    for i in range(len(loaded.time)):
+        assert loaded.time[i] == process.time[i]
+        assert frame["feed_mass"][i] == process.feed_mass[i]
+        assert loaded.partial_fluxes[i] == process.partial_fluxes[i]
+        assert loaded.feed_compositions[i] == process.feed_compositions[i]
+        assert loaded.permeances[i][1] == process.permeances[i][1]
+
+
+def test_save_load_process_numpy_conditions():
+    membrane = Membrane.load(Path("tests/default_membranes/Pervap_4101"))
+    pv = Pervaporation(
+        membrane=membrane,
+        mixture=Mixtures.H2O_EtOH,
+    )
+    con = Conditions(
+        membrane_area=numpy.float64(0.017),
+        initial_feed_temperature=368.15,
+        initial_feed_amount=numpy.int64(2),
+        initial_feed_composition=Composition(p=0.1, type=CompositionType.weight),
+        permeate_pressure=0,
+        temperature_program=TemperatureProgram(
+            coefficients=numpy.array([368.15, -1.0])
+        ),
+    )
+    process = pv.non_ideal_isothermal_process(
+        conditions=con,
+        diffusion_curve_set=membrane.diffusion_curve_sets[0],
+        number_of_steps=5,
+        delta_hours=0.2,
+    )
+
+    temp_path = Path("tests/temp_numpy_conditions_process")
+    process.save(temp_path, storage_format=StorageFormat.npz)
+    process_path = list((temp_path / "results").iterdir())[0]
+    loaded = ProcessModel.load(process_path=process_path)
+    shutil.rmtree(temp_path)
+
+    assert loaded.initial_conditions == attr.evolve(
+        con,
+        initial_feed_amount=2,
+        temperature_program=TemperatureProgram(coefficients=[368.15, -1.0]),
+    )
+    assert type(loaded.initial_conditions.initial_feed_amount) is int